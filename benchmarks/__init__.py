@@ -0,0 +1 @@
+"""Performance benchmarks for the RelayWarden SDK against a local mock API server."""
@@ -0,0 +1,78 @@
+"""
+Compare two benchmark result files and flag regressions.
+
+Usage::
+
+    python -m benchmarks.compare baseline.json candidate.json --threshold 0.15
+
+Exits with status 1 when any scenario's throughput drops, or its p99 latency
+rises, by more than ``threshold`` (a fraction).
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _load(path: str) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        report = json.load(f)
+    return {(r["scenario"], r["mode"]): r for r in report["results"]}
+
+
+def _change(old: float, new: float) -> float:
+    return (new - old) / old if old else 0.0
+
+
+def compare(baseline: str, candidate: str, threshold: float = 0.1) -> List[str]:
+    """
+    Print a comparison table and return the regressed scenarios.
+
+    Args:
+        baseline: Path of the reference result file
+        candidate: Path of the result file to check
+        threshold: Allowed relative slowdown before a scenario counts as regressed
+
+    Returns:
+        Names (``scenario/mode``) of regressed scenarios
+    """
+    old_results = _load(baseline)
+    new_results = _load(candidate)
+    regressions = []
+
+    print(f"{'scenario':<24} {'req/s':>22} {'p99 ms':>22} {'peak KiB':>22}")
+    for key in sorted(old_results.keys() & new_results.keys()):
+        old, new = old_results[key], new_results[key]
+        throughput = _change(old["requests_per_second"], new["requests_per_second"])
+        p99 = _change(old["latency_ms"]["p99"], new["latency_ms"]["p99"])
+        if old["peak_memory_kib"] and new["peak_memory_kib"]:
+            growth = _change(old["peak_memory_kib"], new["peak_memory_kib"])
+            memory = f"{new['peak_memory_kib']:>12.1f} ({growth:+7.1%})"
+        else:
+            memory = f"{'n/a':>22}"
+        name = "/".join(key)
+        regressed = throughput < -threshold or p99 > threshold
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:<24} "
+            f"{new['requests_per_second']:>12.1f} ({throughput:+7.1%}) "
+            f"{new['latency_ms']['p99']:>12.2f} ({p99:+7.1%}) "
+            f"{memory}"
+            f"{'  REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args(argv)
+    return 1 if compare(args.baseline, args.candidate, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
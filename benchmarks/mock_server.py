@@ -0,0 +1,255 @@
+"""Local stand-in for the RelayWarden API used by the benchmarks."""
+
+import json
+import multiprocessing
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+API_PREFIX = "/api/v1"
+
+
+class MockConfig:
+    """
+    Behaviour of the mock server; may be changed between benchmark scenarios.
+
+    Attributes:
+        latency: Seconds added to every response
+        jitter: Upper bound of extra random latency in seconds
+        error_rate: Fraction of requests answered with 503
+        rate_limit_rate: Fraction of requests answered with 429 and ``Retry-After``
+        retry_after: ``Retry-After`` value sent with 429s
+        total_items: Number of items served by list endpoints
+        rate_limit: Value of the ``X-RateLimit-Limit`` header
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: int = 0,
+        total_items: int = 1000,
+        rate_limit: int = 1_000_000,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.total_items = total_items
+        self.rate_limit = rate_limit
+        self.rng = random.Random(seed)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, delayed ACKs add ~40ms
+    disable_nagle_algorithm = True
+    server: "MockServer"
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PATCH(self) -> None:
+        self._dispatch("PATCH")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        config = self.server.config
+        self.server.count_request()
+
+        delay = config.latency + (config.rng.random() * config.jitter if config.jitter else 0)
+        if delay:
+            time.sleep(delay)
+
+        roll = config.rng.random()
+        if roll < config.rate_limit_rate:
+            self._send_json(
+                429,
+                _error("rate_limited", "Too many requests"),
+                {"Retry-After": str(config.retry_after), "X-RateLimit-Remaining": "0"},
+            )
+            return
+        if roll < config.rate_limit_rate + config.error_rate:
+            self._send_json(503, _error("unavailable", "Service unavailable"))
+            return
+
+        url = urlsplit(self.path)
+        path = url.path[len(API_PREFIX) :] if url.path.startswith(API_PREFIX) else url.path
+        status, payload = self.server.route(method, path, parse_qs(url.query), body)
+        self._send_json(
+            status,
+            payload,
+            {
+                "X-RateLimit-Limit": str(config.rate_limit),
+                "X-RateLimit-Remaining": str(config.rate_limit),
+                "X-RateLimit-Reset": "60",
+            },
+        )
+
+    def _send_json(
+        self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def _meta() -> Dict[str, str]:
+    return {"request_id": f"req-{uuid.uuid4().hex[:12]}"}
+
+
+def _error(code: str, message: str) -> Dict[str, Any]:
+    return {"error": {"code": code, "message": message}, "meta": _meta()}
+
+
+def _message(index: int) -> Dict[str, Any]:
+    return {
+        "id": f"msg-{index:08d}",
+        "status": "delivered",
+        "subject": "Benchmark",
+        "to": [{"email": f"user{index}@example.com"}],
+        "created_at": "2026-01-01T00:00:00Z",
+    }
+
+
+class MockServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server mimicking the RelayWarden API envelopes.
+
+    Serves ``POST /messages``, ``GET /messages`` (paginated with ``meta``) and
+    ``GET /messages/{id}``; other paths answer with an empty ``data`` object.
+
+    Use as a context manager to run it on a background thread::
+
+        with MockServer(MockConfig(latency=0.005)) as server:
+            client = Client(server.base_url, "token")
+    """
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, config: Optional[MockConfig] = None, port: int = 0):
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.config = config or MockConfig()
+        self.requests = 0
+        self.shared_requests: Optional[Any] = None
+        self._count_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}{API_PREFIX}"
+
+    def count_request(self) -> None:
+        with self._count_lock:
+            self.requests += 1
+        if self.shared_requests is not None:
+            with self.shared_requests.get_lock():
+                self.shared_requests.value += 1
+
+    def route(
+        self, method: str, path: str, query: Dict[str, Any], body: bytes
+    ) -> Tuple[int, Dict[str, Any]]:
+        if path == "/messages" and method == "POST":
+            message = json.loads(body or b"{}")
+            data = {"message_id": str(uuid.uuid4()), "status": "queued", **message}
+            return 202, {"data": data, "meta": _meta()}
+
+        if path == "/messages" and method == "GET":
+            page = int(query.get("page", ["1"])[0])
+            per_page = int(query.get("per_page", ["25"])[0])
+            total = self.config.total_items
+            last_page = max(1, -(-total // per_page))
+            start = (page - 1) * per_page
+            items = [_message(i) for i in range(start, min(start + per_page, total))]
+            meta = {
+                **_meta(),
+                "current_page": page,
+                "last_page": last_page,
+                "per_page": per_page,
+                "total": total,
+            }
+            return 200, {"data": items, "meta": meta}
+
+        if path.startswith("/messages/") and method == "GET":
+            return 200, {"data": {**_message(0), "id": path.rsplit("/", 1)[-1]}, "meta": _meta()}
+
+        return 200, {"data": {}, "meta": _meta()}
+
+    def __enter__(self) -> "MockServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def _serve(config: MockConfig, ready: Any, shared_requests: Any) -> None:
+    server = MockServer(config)
+    server.shared_requests = shared_requests
+    ready.put(server.server_port)
+    server.serve_forever()
+
+
+class MockServerProcess:
+    """
+    Run a :class:`MockServer` in a child process.
+
+    Keeps the server's request handling off the benchmarked process, so it neither
+    competes for the GIL nor shows up in memory measurements.
+    """
+
+    def __init__(self, config: Optional[MockConfig] = None):
+        self.config = config or MockConfig()
+        self.port = 0
+        self._context = multiprocessing.get_context("spawn")
+        self._requests = self._context.Value("q", 0)
+        self._process: Optional[Any] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}{API_PREFIX}"
+
+    @property
+    def requests(self) -> int:
+        """Number of requests served so far."""
+        return self._requests.value
+
+    def __enter__(self) -> "MockServerProcess":
+        ready = self._context.Queue()
+        self._process = self._context.Process(
+            target=_serve, args=(self.config, ready, self._requests), daemon=True
+        )
+        self._process.start()
+        self.port = ready.get(timeout=30)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
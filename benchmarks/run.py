@@ -0,0 +1,333 @@
+"""
+Run the SDK benchmarks against a local mock server.
+
+Usage::
+
+    python -m benchmarks.run                      # all scenarios, sync and async
+    python -m benchmarks.run --size 200 --mode sync --scenario single_send
+    python -m benchmarks.run --latency 0.01 --output results.json
+
+Results are written as JSON (see ``--output``) and can be compared between
+releases with ``python -m benchmarks.compare``.
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.mock_server import MockConfig, MockServerProcess
+from relaywarden import AsyncClient, Client, Middleware, RequestContext, RetryBudget, RetryPolicy
+from relaywarden import __version__
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+MESSAGE = {
+    "from": {"email": "bench@example.com"},
+    "to": [{"email": "user@example.com"}],
+    "subject": "Benchmark",
+    "text": "Hello from the benchmark suite",
+}
+
+
+class LatencyRecorder(Middleware):
+    """Record the duration of every API call (including retries) and count failures."""
+
+    def __init__(self) -> None:
+        self.latencies: List[float] = []
+        self.retries = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def after_response(self, ctx: RequestContext, response: Any) -> None:
+        if 200 <= response.status_code < 300:
+            self.latencies.append(time.monotonic() - ctx.started)
+
+    def on_retry(self, ctx: RequestContext, error: Exception, delay: float) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def on_error(self, ctx: RequestContext, error: Exception) -> None:
+        with self._lock:
+            self.errors += 1
+        self.latencies.append(time.monotonic() - ctx.started)
+
+
+class Scenario:
+    """A benchmark workload and the mock server behaviour it runs against."""
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        sync: Callable[[Client, int], int],
+        run_async: Callable[[AsyncClient, int], Any],
+        config: Callable[[int, float], MockConfig],
+        retry_policy: Optional[Callable[[], RetryPolicy]] = None,
+    ):
+        self.name = name
+        self.description = description
+        self.sync = sync
+        self.run_async = run_async
+        self.config = config
+        self.retry_policy = retry_policy
+
+
+def _send_one(client: Client, size: int) -> int:
+    for _ in range(size):
+        client.messages.send(MESSAGE)
+    return size
+
+
+async def _send_one_async(client: AsyncClient, size: int) -> int:
+    for _ in range(size):
+        await client.messages.send(MESSAGE)
+    return size
+
+
+def _send_many(client: Client, size: int) -> int:
+    return sum(1 for _ in client.messages.send_many((MESSAGE for _ in range(size)), 20))
+
+
+async def _send_many_async(client: AsyncClient, size: int) -> int:
+    count = 0
+    async for _ in client.messages.send_many((MESSAGE for _ in range(size)), 20):
+        count += 1
+    return count
+
+
+def _scan(client: Client, size: int) -> int:
+    return sum(1 for _ in client.messages.list_all(per_page=100))
+
+
+async def _scan_async(client: AsyncClient, size: int) -> int:
+    count = 0
+    async for _ in client.messages.list_all(per_page=100):
+        count += 1
+    return count
+
+
+def _send_retried(client: Client, size: int) -> int:
+    done = 0
+    for _ in range(size):
+        try:
+            client.messages.send(MESSAGE, idempotency_key=str(uuid.uuid4()))
+            done += 1
+        except Exception:
+            pass
+    return done
+
+
+async def _send_retried_async(client: AsyncClient, size: int) -> int:
+    done = 0
+    for _ in range(size):
+        try:
+            await client.messages.send(MESSAGE, idempotency_key=str(uuid.uuid4()))
+            done += 1
+        except Exception:
+            pass
+    return done
+
+
+def _storm_policy() -> RetryPolicy:
+    return RetryPolicy(
+        max_retries=5,
+        backoff_base=0.001,
+        backoff_max=0.005,
+        budget=RetryBudget(capacity=1000, ratio=1.0),
+    )
+
+
+SCENARIOS = [
+    Scenario(
+        "single_send",
+        "Sequential messages.send calls",
+        _send_one,
+        _send_one_async,
+        lambda size, latency: MockConfig(latency=latency),
+    ),
+    Scenario(
+        "bulk_send",
+        "messages.send_many with concurrency 20",
+        _send_many,
+        _send_many_async,
+        lambda size, latency: MockConfig(latency=latency),
+    ),
+    Scenario(
+        "paginated_scan",
+        "messages.list_all over size * 10 items, 100 per page",
+        _scan,
+        _scan_async,
+        lambda size, latency: MockConfig(latency=latency, total_items=size * 10),
+    ),
+    Scenario(
+        "retry_storm",
+        "Sequential sends with 20% 503s and 10% 429s (Retry-After: 0)",
+        _send_retried,
+        _send_retried_async,
+        lambda size, latency: MockConfig(latency=latency, error_rate=0.2, rate_limit_rate=0.1),
+        _storm_policy,
+    ),
+]
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def _execute(
+    scenario: Scenario, mode: str, size: int, config: MockConfig, recorder: LatencyRecorder
+) -> Dict[str, Any]:
+    """Run one scenario pass; returns items processed, requests served and wall time."""
+    policy = scenario.retry_policy() if scenario.retry_policy else None
+    with MockServerProcess(config) as server:
+        if mode == "sync":
+            client = Client(server.base_url, "bench-token", retry_policy=policy)
+            client.add_middleware(recorder)
+            started = time.perf_counter()
+            items = scenario.sync(client, size)
+            seconds = time.perf_counter() - started
+            client.close()
+        else:
+
+            async def main() -> Any:
+                async with AsyncClient(
+                    server.base_url, "bench-token", retry_policy=policy
+                ) as client:
+                    client.add_middleware(recorder)
+                    started = time.perf_counter()
+                    items = await scenario.run_async(client, size)
+                    return items, time.perf_counter() - started
+
+            items, seconds = asyncio.run(main())
+        return {"items": items, "requests": server.requests, "seconds": seconds}
+
+
+def run_scenario(
+    scenario: Scenario, mode: str, size: int, latency: float = 0.0, memory: bool = True
+) -> Dict[str, Any]:
+    """
+    Benchmark one scenario in ``sync`` or ``async`` mode.
+
+    Timing and memory are measured in separate passes because ``tracemalloc``
+    slows allocation-heavy code down considerably.
+    """
+    # Warm up imports, connection setup and caches outside the measured pass
+    _execute(scenario, mode, max(1, size // 20), scenario.config(size, latency), LatencyRecorder())
+
+    recorder = LatencyRecorder()
+    run = _execute(scenario, mode, size, scenario.config(size, latency), recorder)
+    latencies = recorder.latencies
+    result = {
+        "scenario": scenario.name,
+        "mode": mode,
+        "description": scenario.description,
+        "size": size,
+        "items": run["items"],
+        "requests": run["requests"],
+        "retries": recorder.retries,
+        "errors": recorder.errors,
+        "seconds": round(run["seconds"], 6),
+        "requests_per_second": round(run["requests"] / run["seconds"], 2),
+        "items_per_second": round(run["items"] / run["seconds"], 2),
+        "latency_ms": {
+            "p50": round(_percentile(latencies, 50) * 1000, 3),
+            "p90": round(_percentile(latencies, 90) * 1000, 3),
+            "p99": round(_percentile(latencies, 99) * 1000, 3),
+            "max": round(max(latencies, default=0.0) * 1000, 3),
+        },
+        "peak_memory_kib": None,
+    }
+
+    if memory:
+        tracemalloc.start()
+        try:
+            _execute(scenario, mode, size, scenario.config(size, latency), LatencyRecorder())
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result["peak_memory_kib"] = round(peak / 1024, 1)
+    return result
+
+
+def run(
+    size: int = 500,
+    modes: Optional[List[str]] = None,
+    scenarios: Optional[List[str]] = None,
+    latency: float = 0.0,
+    memory: bool = True,
+) -> Dict[str, Any]:
+    """Run the selected scenarios and return the full report."""
+    selected = [s for s in SCENARIOS if not scenarios or s.name in scenarios]
+    results = []
+    for scenario in selected:
+        for mode in modes or ["sync", "async"]:
+            result = run_scenario(scenario, mode, size, latency, memory)
+            results.append(result)
+            print(
+                f"{scenario.name:<16} {mode:<6} "
+                f"{result['requests_per_second']:>10.1f} req/s  "
+                f"p50 {result['latency_ms']['p50']:>8.2f} ms  "
+                f"p99 {result['latency_ms']['p99']:>8.2f} ms  "
+                f"peak {result['peak_memory_kib'] or 0:>9.1f} KiB",
+                file=sys.stderr,
+            )
+    return {
+        "sdk_version": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "settings": {"size": size, "latency": latency},
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=500, help="Operations per scenario")
+    parser.add_argument("--mode", choices=["sync", "async", "all"], default="all")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[s.name for s in SCENARIOS],
+        help="Scenario to run (repeatable; default: all)",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds of latency injected by the server"
+    )
+    parser.add_argument("--no-memory", action="store_true", help="Skip the memory pass")
+    parser.add_argument(
+        "--output",
+        help="Result file (default: benchmarks/results/relaywarden-<version>-<timestamp>.json)",
+    )
+    args = parser.parse_args(argv)
+
+    modes = ["sync", "async"] if args.mode == "all" else [args.mode]
+    report = run(args.size, modes, args.scenario, args.latency, not args.no_memory)
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.datetime.now().strftime("%Y%m%dT%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"relaywarden-{__version__}-{stamp}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,19 +4,66 @@ RelayWarden Python SDK
 Official Python SDK for the RelayWarden API v1.
 """
 
+from relaywarden.async_client import AsyncClient
+from relaywarden.attachments import Attachment
+from relaywarden.cache import ResponseCache
+from relaywarden.checkpoint import FileCheckpointStore
 from relaywarden.client import Client
 from relaywarden.exceptions import (
     APIError,
     AuthenticationError,
     RateLimitError,
+    TemplateRenderError,
     ValidationError,
+    WebhookVerificationError,
 )
+from relaywarden.export import ColumnarExporter
+from relaywarden.metrics import InMemoryMetrics, MetricsMiddleware, MetricsSink
+from relaywarden.middleware import Middleware, RequestContext
+from relaywarden.outbox import AsyncOutbox, Outbox
+from relaywarden.ratelimit import RateLimiter
+from relaywarden.reconcile import AsyncWebhookReconciler, WebhookReconciler
+from relaywarden.retry import RetryBudget, RetryPolicy
+from relaywarden.serialization import BodyEncoder
+from relaywarden.suppression_index import SuppressionIndex
+from relaywarden.templating import AsyncLocalRenderer, LocalRenderer
+from relaywarden.tracing import TracingMiddleware
+from relaywarden.watcher import AsyncDeliveryWatcher, DeliveryWatcher
+from relaywarden.webhooks import WebhookEvent, WebhookVerifier
 
 __version__ = "1.0.0"
 __all__ = [
+    "AsyncClient",
+    "AsyncDeliveryWatcher",
+    "AsyncLocalRenderer",
+    "AsyncOutbox",
+    "AsyncWebhookReconciler",
     "Client",
     "APIError",
+    "Attachment",
     "AuthenticationError",
+    "BodyEncoder",
+    "ColumnarExporter",
+    "DeliveryWatcher",
+    "FileCheckpointStore",
+    "InMemoryMetrics",
+    "LocalRenderer",
+    "MetricsMiddleware",
+    "MetricsSink",
+    "Middleware",
+    "Outbox",
     "RateLimitError",
+    "RateLimiter",
+    "RequestContext",
+    "ResponseCache",
+    "RetryBudget",
+    "RetryPolicy",
+    "SuppressionIndex",
+    "TemplateRenderError",
+    "TracingMiddleware",
     "ValidationError",
+    "WebhookEvent",
+    "WebhookReconciler",
+    "WebhookVerificationError",
+    "WebhookVerifier",
 ]
@@ -0,0 +1,325 @@
+"""Transport-independent state and helpers shared by the sync and async clients."""
+
+import time
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+
+from relaywarden.cache import ResponseCache
+from relaywarden.exceptions import APIError, AuthenticationError, RateLimitError, ValidationError
+from relaywarden.metrics import MetricsMiddleware, MetricsSink
+from relaywarden.middleware import Middleware, RequestContext, is_success
+from relaywarden.ratelimit import RateLimiter
+from relaywarden.retry import RetryPolicy
+from relaywarden.serialization import BodyEncoder, EncodedBody, StreamingBody
+from relaywarden.tracing import TracingMiddleware
+
+
+class BaseClient:
+    """Configuration, scoping headers and error mapping shared by all clients."""
+
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        max_retries: int = 3,
+        timeout: int = 30,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        middleware: Optional[Iterable[Middleware]] = None,
+        metrics: Optional[MetricsSink] = None,
+        tracer: Optional[Any] = None,
+        cache: Optional[ResponseCache] = None,
+        body_encoder: Optional[BodyEncoder] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        self.rate_limiter = rate_limiter
+        self.middleware: List[Middleware] = list(middleware or [])
+        self.metrics = metrics
+        self.cache = cache
+        self.body_encoder = body_encoder
+        if metrics is not None:
+            self.middleware.append(MetricsMiddleware(metrics))
+        if tracer is not None:
+            self.middleware.append(TracingMiddleware(tracer))
+        self._project_id: Optional[str] = None
+        self._team_id: Optional[str] = None
+        self._scope_headers: Dict[str, str] = {}
+
+    @property
+    def project_id(self) -> Optional[str]:
+        """The project ID sent as ``X-Project-Id``."""
+        return self._project_id
+
+    @project_id.setter
+    def project_id(self, project_id: Optional[str]) -> None:
+        self._project_id = project_id
+        self._scope_headers = self._get_default_headers()
+
+    @property
+    def team_id(self) -> Optional[str]:
+        """The team ID sent as ``X-Team-Id``."""
+        return self._team_id
+
+    @team_id.setter
+    def team_id(self, team_id: Optional[str]) -> None:
+        self._team_id = team_id
+        self._scope_headers = self._get_default_headers()
+
+    def add_middleware(self, middleware: Middleware) -> None:
+        """Append a middleware to the request pipeline."""
+        self.middleware.append(middleware)
+
+    def set_project_id(self, project_id: Optional[str]) -> None:
+        """Set the project ID for project-scoped operations."""
+        self.project_id = project_id
+
+    def get_project_id(self) -> Optional[str]:
+        """Get the current project ID."""
+        return self.project_id
+
+    def set_team_id(self, team_id: Optional[str]) -> None:
+        """Set the team ID."""
+        self.team_id = team_id
+
+    def get_team_id(self) -> Optional[str]:
+        """Get the current team ID."""
+        return self.team_id
+
+    def _get_auth_headers(self) -> Dict[str, str]:
+        """Get the headers sent with every request."""
+        return {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+
+    def _get_default_headers(self) -> Dict[str, str]:
+        """Get default headers including project/team IDs."""
+        headers = {}
+        if self._project_id:
+            headers["X-Project-Id"] = self._project_id
+        if self._team_id:
+            headers["X-Team-Id"] = self._team_id
+        return headers
+
+    def _build_context(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        data: Any,
+        headers: Optional[Dict[str, str]],
+    ) -> RequestContext:
+        """Create the per-call context, reusing the cached scope headers when possible."""
+        if headers or self.middleware:
+            request_headers = {**self._scope_headers, **(headers or {})}
+        else:
+            # Nothing can modify the headers for this call, so share the cached dict
+            request_headers = self._scope_headers
+        return RequestContext(
+            method, path, self.base_url + path, params, data, request_headers, time.monotonic()
+        )
+
+    def _encode_body(self, data: Any) -> Union[EncodedBody, StreamingBody, None]:
+        """
+        Encode a request body with the ``body_encoder``.
+
+        Returns:
+            The body to send, or None to let the transport encode ``data`` as JSON
+        """
+        if data is None or isinstance(data, (EncodedBody, StreamingBody)):
+            return data
+        if self.body_encoder is not None:
+            return self.body_encoder.encode(data)
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return EncodedBody(bytes(data))
+        return None
+
+    def _body_headers(
+        self, headers: Dict[str, str], body: Union[EncodedBody, StreamingBody, None]
+    ) -> Dict[str, str]:
+        """Add the headers describing an encoded body to an attempt's headers."""
+        if body is None:
+            return headers
+        body_headers = body.headers
+        return {**headers, **body_headers} if body_headers else headers
+
+    def _compression_rejected(
+        self, ctx: RequestContext, response: Any, body: Union[EncodedBody, StreamingBody, None]
+    ) -> bool:
+        """Whether the server refused a body compressed by the ``body_encoder`` (415)."""
+        return (
+            response.status_code == 415
+            and body is not None
+            and body is not ctx.data
+            and self.body_encoder is not None
+            and self.body_encoder.reject(body)
+        )
+
+    def _end_rejected_attempt(self, ctx: RequestContext, response: Any) -> None:
+        """
+        Run the hooks of an attempt whose compressed body was refused, so every
+        ``before_request`` is paired with ``after_response`` and ``on_retry``
+        before the body is resent uncompressed.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(response.headers)
+        for middleware in self.middleware:
+            middleware.after_response(ctx, response)
+        error = self._handle_error_response(response, None)
+        for middleware in self.middleware:
+            middleware.on_retry(ctx, error, 0.0)
+
+    def _parse_body(self, response: Any) -> Optional[Dict[str, Any]]:
+        """Decode a successful response: None for 204, {} for an empty body."""
+        if response.status_code == 204:
+            return None
+        if response.content:
+            if self.body_encoder is not None:
+                return self.body_encoder.serializer.loads(response.content)
+            return response.json()
+        return {}
+
+    def _check_response(self, ctx: RequestContext, response: Any) -> Optional[float]:
+        """
+        Run response hooks and classify an attempt's response.
+
+        Returns:
+            None when the response is successful, otherwise seconds to wait before
+            retrying
+
+        Raises:
+            APIError: When the error response is not retried
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(response.headers)
+        if self.body_encoder is not None:
+            self.body_encoder.observe(response.headers)
+        for middleware in self.middleware:
+            middleware.after_response(ctx, response)
+
+        if is_success(response.status_code):
+            self.retry_policy.record_success()
+            return None
+
+        error_data = None
+        if response.content:
+            try:
+                error_data = response.json()
+            except ValueError:
+                pass
+
+        api_error = self._handle_error_response(response, error_data)
+        retry_after = None
+        if isinstance(api_error, RateLimitError):
+            retry_after = self._parse_retry_after(response.headers)
+            if self.rate_limiter is not None and retry_after is not None:
+                self.rate_limiter.block_for(retry_after)
+        return self._retry_or_raise(ctx, api_error, True, retry_after)
+
+    def _transport_retryable(self, ctx: RequestContext, error: Exception) -> bool:
+        """
+        Whether a transport error may be retried.
+
+        Errors raised while connecting are safe to retry for any request. Later
+        errors, such as read timeouts, may hit a request the server already
+        processed, so they are retried only for idempotent requests.
+        """
+        if not self._is_retryable_error(error):
+            return False
+        return self._is_connect_error(error) or self.retry_policy.is_idempotent(
+            ctx.method, ctx.headers
+        )
+
+    def _is_retryable_error(self, error: Exception) -> bool:
+        """Check if a transport error is transient."""
+        raise NotImplementedError
+
+    def _is_connect_error(self, error: Exception) -> bool:
+        """Check if a transport error happened before the request was sent."""
+        raise NotImplementedError
+
+    def _retry_or_raise(
+        self,
+        ctx: RequestContext,
+        error: Exception,
+        retryable: bool,
+        retry_after: Optional[float] = None,
+    ) -> float:
+        """
+        Ask the retry policy whether to retry a failed attempt.
+
+        Transport errors are raised as ``APIError`` chained to the original exception.
+        """
+        delay = None
+        if retryable:
+            delay = self.retry_policy.get_delay(
+                ctx.attempt,
+                ctx.method,
+                ctx.headers,
+                error,
+                time.monotonic() - ctx.started,
+                retry_after,
+            )
+
+        if delay is None:
+            final = error
+            if not isinstance(error, APIError):
+                final = APIError(f"Request failed: {str(error)}", 0)
+                final.__cause__ = error
+            for middleware in self.middleware:
+                middleware.on_error(ctx, final)
+            raise final
+
+        for middleware in self.middleware:
+            middleware.on_retry(ctx, error, delay)
+        return delay
+
+    def _handle_error_response(
+        self, response: Any, error_data: Optional[Dict[str, Any]]
+    ) -> APIError:
+        """
+        Handle error responses from the API.
+
+        ``response`` only needs ``status_code`` and ``headers`` attributes, so both
+        ``requests`` and ``httpx`` responses are accepted.
+        """
+        status_code = response.status_code
+        request_id = ""
+        error_code = ""
+        message = "An error occurred"
+        details = []
+
+        if error_data:
+            if "meta" in error_data and "request_id" in error_data["meta"]:
+                request_id = error_data["meta"]["request_id"]
+
+            if "error" in error_data:
+                error = error_data["error"]
+                error_code = error.get("code", "")
+                message = error.get("message", "An error occurred")
+                details = error.get("details", [])
+
+        if status_code == 401:
+            return AuthenticationError(message, status_code, request_id)
+        elif status_code == 422:
+            return ValidationError(message, details, request_id, status_code)
+        elif status_code == 429:
+            retry_after = self._parse_retry_after(response.headers)
+            return RateLimitError(
+                message, status_code, request_id, 60 if retry_after is None else retry_after
+            )
+        else:
+            return APIError(message, status_code, error_code, request_id, details)
+
+    def _parse_retry_after(self, headers: Mapping[str, str]) -> Optional[int]:
+        """Parse the ``Retry-After`` header in seconds, if present and numeric."""
+        if "Retry-After" in headers:
+            try:
+                return int(headers["Retry-After"])
+            except ValueError:
+                pass
+        return None
@@ -0,0 +1,395 @@
+"""Asyncio client for interacting with the RelayWarden API."""
+
+import asyncio
+import time
+from typing import Any, Dict, Iterable, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra installed
+    httpx = None  # type: ignore[assignment]
+
+from relaywarden._base_client import BaseClient
+from relaywarden.cache import ResponseCache
+from relaywarden.exceptions import APIError
+from relaywarden.metrics import MetricsSink
+from relaywarden.middleware import Middleware, is_success
+from relaywarden.ratelimit import RateLimiter
+from relaywarden.resources.audit_logs import AsyncAuditLogs
+from relaywarden.resources.compliance import AsyncCompliance
+from relaywarden.resources.domains import AsyncDomains
+from relaywarden.resources.events import AsyncEvents
+from relaywarden.resources.identity import AsyncIdentity
+from relaywarden.resources.messages import AsyncMessages
+from relaywarden.resources.projects import AsyncProjects
+from relaywarden.resources.senders import AsyncSenders
+from relaywarden.resources.service_accounts import AsyncServiceAccounts
+from relaywarden.resources.suppressions import AsyncSuppressions
+from relaywarden.resources.templates import AsyncTemplates
+from relaywarden.resources.usage import AsyncUsage
+from relaywarden.resources.webhooks import AsyncWebhooks
+from relaywarden.retry import RetryPolicy
+from relaywarden.serialization import BodyEncoder
+from relaywarden.watcher import AsyncDeliveryWatcher
+
+
+class AsyncClient(BaseClient):
+    """Asyncio client for interacting with the RelayWarden API."""
+
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        max_retries: int = 3,
+        timeout: int = 30,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        middleware: Optional[Iterable[Middleware]] = None,
+        metrics: Optional[MetricsSink] = None,
+        tracer: Optional[Any] = None,
+        cache: Optional[ResponseCache] = None,
+        body_encoder: Optional[BodyEncoder] = None,
+        transport: Optional[Any] = None,
+    ):
+        """
+        Initialize a new asyncio RelayWarden API client.
+
+        Requires the optional ``httpx`` dependency (``pip install relaywarden[async]``).
+
+        Args:
+            base_url: The base URL of the API (e.g., 'https://api.relaywarden.eu/api/v1')
+            token: Your API token
+            max_retries: Maximum number of retry attempts (default: 3)
+            timeout: Request timeout in seconds (default: 30)
+            max_connections: Maximum number of concurrent connections (default: 100)
+            max_keepalive_connections: Idle connections kept open for reuse (default: 20)
+            connect_timeout: Connect timeout in seconds (default: ``timeout``)
+            read_timeout: Read timeout in seconds (default: ``timeout``)
+            retry_policy: Backoff, retry budget and deadline settings
+                (default: ``RetryPolicy(max_retries=max_retries)``)
+            rate_limiter: Optional ``RateLimiter`` pacing requests from the server's
+                rate-limit headers; share one instance between clients using the same token
+            middleware: Hooks run around every request (see ``Middleware``)
+            metrics: Optional sink receiving latency, retry and throughput metrics,
+                e.g. ``InMemoryMetrics()``
+            tracer: Optional OpenTelemetry tracer, e.g. ``trace.get_tracer(__name__)``;
+                every call is wrapped in a client span (see ``TracingMiddleware``)
+            cache: Optional ``ResponseCache`` serving slow-changing GET endpoints
+                locally; writes through this client invalidate affected entries
+            body_encoder: Optional ``BodyEncoder`` serialising request bodies with
+                orjson/msgspec and compressing large ones, e.g. ``BodyEncoder()``
+            transport: Optional custom ``httpx.AsyncBaseTransport`` (mainly for testing)
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncClient requires httpx. Install it with: pip install relaywarden[async]"
+            )
+
+        super().__init__(
+            base_url,
+            token,
+            max_retries,
+            timeout,
+            retry_policy,
+            rate_limiter,
+            middleware,
+            metrics,
+            tracer,
+            cache,
+            body_encoder,
+        )
+        self.connect_timeout = connect_timeout if connect_timeout is not None else timeout
+        self.read_timeout = read_timeout if read_timeout is not None else timeout
+
+        self.session = httpx.AsyncClient(
+            headers=self._get_auth_headers(),
+            timeout=httpx.Timeout(timeout, connect=self.connect_timeout, read=self.read_timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            transport=transport,
+        )
+
+        # Initialize resources
+        self._identity: Optional[AsyncIdentity] = None
+        self._projects: Optional[AsyncProjects] = None
+        self._service_accounts: Optional[AsyncServiceAccounts] = None
+        self._domains: Optional[AsyncDomains] = None
+        self._senders: Optional[AsyncSenders] = None
+        self._templates: Optional[AsyncTemplates] = None
+        self._messages: Optional[AsyncMessages] = None
+        self._events: Optional[AsyncEvents] = None
+        self._webhooks: Optional[AsyncWebhooks] = None
+        self._suppressions: Optional[AsyncSuppressions] = None
+        self._usage: Optional[AsyncUsage] = None
+        self._audit_logs: Optional[AsyncAuditLogs] = None
+        self._compliance: Optional[AsyncCompliance] = None
+        self._delivery_watcher: Optional[AsyncDeliveryWatcher] = None
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Stop the delivery watcher, if started, and close the underlying connection pool."""
+        if self._delivery_watcher is not None:
+            await self._delivery_watcher.aclose()
+        await self.session.aclose()
+
+    @property
+    def identity(self) -> AsyncIdentity:
+        """Access the Identity resource."""
+        if self._identity is None:
+            self._identity = AsyncIdentity(self)
+        return self._identity
+
+    @property
+    def projects(self) -> AsyncProjects:
+        """Access the Projects resource."""
+        if self._projects is None:
+            self._projects = AsyncProjects(self)
+        return self._projects
+
+    @property
+    def service_accounts(self) -> AsyncServiceAccounts:
+        """Access the ServiceAccounts resource."""
+        if self._service_accounts is None:
+            self._service_accounts = AsyncServiceAccounts(self)
+        return self._service_accounts
+
+    @property
+    def domains(self) -> AsyncDomains:
+        """Access the Domains resource."""
+        if self._domains is None:
+            self._domains = AsyncDomains(self)
+        return self._domains
+
+    @property
+    def senders(self) -> AsyncSenders:
+        """Access the Senders resource."""
+        if self._senders is None:
+            self._senders = AsyncSenders(self)
+        return self._senders
+
+    @property
+    def templates(self) -> AsyncTemplates:
+        """Access the Templates resource."""
+        if self._templates is None:
+            self._templates = AsyncTemplates(self)
+        return self._templates
+
+    @property
+    def messages(self) -> AsyncMessages:
+        """Access the Messages resource."""
+        if self._messages is None:
+            self._messages = AsyncMessages(self)
+        return self._messages
+
+    @property
+    def events(self) -> AsyncEvents:
+        """Access the Events resource."""
+        if self._events is None:
+            self._events = AsyncEvents(self)
+        return self._events
+
+    @property
+    def webhooks(self) -> AsyncWebhooks:
+        """Access the Webhooks resource."""
+        if self._webhooks is None:
+            self._webhooks = AsyncWebhooks(self)
+        return self._webhooks
+
+    @property
+    def suppressions(self) -> AsyncSuppressions:
+        """Access the Suppressions resource."""
+        if self._suppressions is None:
+            self._suppressions = AsyncSuppressions(self)
+        return self._suppressions
+
+    @property
+    def usage(self) -> AsyncUsage:
+        """Access the Usage resource."""
+        if self._usage is None:
+            self._usage = AsyncUsage(self)
+        return self._usage
+
+    @property
+    def audit_logs(self) -> AsyncAuditLogs:
+        """Access the AuditLogs resource."""
+        if self._audit_logs is None:
+            self._audit_logs = AsyncAuditLogs(self)
+        return self._audit_logs
+
+    @property
+    def compliance(self) -> AsyncCompliance:
+        """Access the Compliance resource."""
+        if self._compliance is None:
+            self._compliance = AsyncCompliance(self)
+        return self._compliance
+
+    @property
+    def delivery_watcher(self) -> AsyncDeliveryWatcher:
+        """Access the shared AsyncDeliveryWatcher waiting for messages to be delivered."""
+        if self._delivery_watcher is None:
+            self._delivery_watcher = AsyncDeliveryWatcher(self)
+        return self._delivery_watcher
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Make an HTTP request with retry logic.
+
+        Args:
+            method: HTTP method (GET, POST, PATCH, DELETE)
+            path: API path
+            data: Request body: JSON-serialisable data, serialised JSON bytes, or
+                an ``EncodedBody`` sent unchanged
+            headers: Additional headers
+            params: Query parameters
+
+        Returns:
+            Response data or None for 204 responses
+
+        Raises:
+            APIError: For API errors
+            AuthenticationError: For authentication failures
+            ValidationError: For validation errors
+            RateLimitError: For rate limit errors
+        """
+        cache = self.cache
+        if cache is not None:
+            if method == "GET":
+                key = cache.key(path, params, self._scope_headers)
+                if key is not None:
+                    entry, fresh = cache.lookup(key)
+                    if fresh:
+                        return entry.value()
+                    conditional = cache.conditional_headers(entry)
+                    if conditional:
+                        headers = {**(headers or {}), **conditional}
+                    response = await self._send(method, path, params, data, headers)
+                    return cache.store(key, response, entry)
+            else:
+                body = self._parse_body(await self._send(method, path, params, data, headers))
+                cache.invalidate(path)
+                return body
+        return self._parse_body(await self._send(method, path, params, data, headers))
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+    ) -> Any:
+        """
+        Run a call through the request pipeline and return the successful response.
+
+        With ``stream=True`` the body of the returned response is not read yet; the
+        caller must consume it and call ``aclose()``.
+        """
+        ctx = self._build_context(method, path, params, data, headers)
+        body = source = None
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            for middleware in self.middleware:
+                middleware.before_request(ctx)
+            if ctx.data is not source:
+                # Encoded once per call, and again only if middleware replaced the body
+                source = ctx.data
+                body = self._encode_body(source)
+            try:
+                request = self.session.build_request(
+                    ctx.method,
+                    ctx.url,
+                    params=ctx.params,
+                    json=ctx.data if body is None else None,
+                    content=body.async_content if body is not None else None,
+                    headers=self._body_headers(ctx.headers, body),
+                    timeout=self._attempt_timeout(ctx.started),
+                )
+                response = await self.session.send(request, stream=stream)
+                if stream and not is_success(response.status_code):
+                    # Error bodies are small and needed to build the exception
+                    await response.aread()
+            except httpx.TransportError as e:
+                delay = self._retry_or_raise(ctx, e, self._transport_retryable(ctx, e))
+            except APIError as e:
+                # Deadline exceeded before the attempt was sent
+                self._retry_or_raise(ctx, e, False)
+            else:
+                if self._compression_rejected(ctx, response, body):
+                    # Resend uncompressed; compression stays off for this client
+                    await response.aclose()
+                    self._end_rejected_attempt(ctx, response)
+                    source = None
+                    continue
+                delay = self._check_response(ctx, response)
+                if delay is None:
+                    return response
+                await response.aclose()
+
+            await asyncio.sleep(delay)
+            ctx.attempt += 1
+
+    def _attempt_timeout(self, started: float) -> Any:
+        """Timeouts for the next attempt, shortened to fit the deadline."""
+        remaining = self.retry_policy.remaining(time.monotonic() - started)
+        if remaining is None:
+            return httpx.USE_CLIENT_DEFAULT
+        if remaining <= 0:
+            raise APIError("Request deadline exceeded", 0)
+        return httpx.Timeout(
+            min(self.timeout, remaining),
+            connect=min(self.connect_timeout, remaining),
+            read=min(self.read_timeout, remaining),
+        )
+
+    def _is_retryable_error(self, error: Exception) -> bool:
+        """Check if an error is retryable."""
+        return isinstance(error, (httpx.NetworkError, httpx.TimeoutException))
+
+    def _is_connect_error(self, error: Exception) -> bool:
+        """Check if a transport error happened before the request was sent."""
+        return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+
+    async def get(
+        self, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Make a GET request."""
+        return await self.request("GET", path, params=params)
+
+    async def post(
+        self,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Make a POST request."""
+        return await self.request("POST", path, data, headers)
+
+    async def patch(
+        self, path: str, data: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Make a PATCH request."""
+        return await self.request("PATCH", path, data)
+
+    async def delete(self, path: str) -> None:
+        """Make a DELETE request."""
+        await self.request("DELETE", path)
@@ -0,0 +1,260 @@
+"""Message attachments streamed from files instead of held in memory."""
+
+from __future__ import annotations
+
+import base64
+import mimetypes
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from relaywarden.serialization import Serializer, StreamingBody
+
+if TYPE_CHECKING:
+    from relaywarden._base_client import BaseClient
+
+# Bytes read per chunk; a multiple of 3 so every chunk base64-encodes without padding
+CHUNK_SIZE = 3 * 64 * 1024
+
+# Endpoint storing an attachment once so messages can reference it by id
+ATTACHMENTS_PATH = "/attachments"
+
+
+def encoded_size(size: int) -> int:
+    """Length of the base64 encoding of ``size`` bytes."""
+    return (size + 2) // 3 * 4
+
+
+class Attachment:
+    """
+    A file attached to a message, read and base64-encoded chunk by chunk while the
+    request is sent.
+
+    Put attachments in a message's ``attachments`` list. ``Messages.send`` uploads
+    each one once per project and references it by id when the API supports
+    uploads; otherwise the attachment is streamed inline. Either way at most one
+    chunk of it is in memory at a time, and the same ``Attachment`` can be sent
+    with any number of messages, also from several threads.
+    """
+
+    def __init__(
+        self,
+        source: Union[str, "os.PathLike[str]", bytes, IO[bytes]],
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        disposition: str = "attachment",
+        content_id: Optional[str] = None,
+        upload: bool = True,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        """
+        Args:
+            source: File path, bytes, or a binary file object. Non-seekable file
+                objects are spooled to a temporary file first so they can be resent
+            filename: Attachment filename (default: the file's name)
+            content_type: MIME type (default: guessed from the filename)
+            disposition: ``"attachment"`` or ``"inline"``
+            content_id: Content-ID for inline images referenced as ``cid:``
+            upload: Upload once and reference by id when the API supports it;
+                when False the attachment is always sent inline
+            chunk_size: Bytes read per chunk; rounded down to a multiple of 3
+        """
+        self.chunk_size = max(3, chunk_size - chunk_size % 3)
+        self._path: Optional[str] = None
+        self._bytes: Optional[bytes] = None
+        self._file: Optional[IO[bytes]] = None
+        self._start = 0
+        if isinstance(source, (str, os.PathLike)):
+            self._path = os.fspath(source)
+            self.size = os.path.getsize(self._path)
+            filename = filename or os.path.basename(self._path)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            self._bytes = bytes(source)
+            self.size = len(self._bytes)
+        else:
+            if not _seekable(source):
+                source = _spool(source, self.chunk_size)
+            self._file = source
+            self._start = source.tell()
+            self.size = source.seek(0, os.SEEK_END) - self._start
+            source.seek(self._start)
+            name = getattr(source, "name", None)
+            if filename is None and isinstance(name, str):
+                filename = os.path.basename(name)
+        self.filename = filename or "attachment"
+        self.content_type = (
+            content_type or mimetypes.guess_type(self.filename)[0] or "application/octet-stream"
+        )
+        self.disposition = disposition
+        self.content_id = content_id
+        self.upload = upload
+        # Upload ids per (base URL, project), so each project uploads once
+        self._uploads: Dict[Tuple[str, Optional[str]], str] = {}
+        self._upload_lock = threading.Lock()
+        self._read_lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"Attachment({self.filename!r}, {self.size} bytes)"
+
+    @property
+    def encoded_size(self) -> int:
+        """Length of the base64-encoded content."""
+        return encoded_size(self.size)
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Yield the raw content in chunks of ``chunk_size`` bytes."""
+        size = self.chunk_size
+        if self._bytes is not None:
+            view = memoryview(self._bytes)
+            for offset in range(0, self.size, size):
+                yield bytes(view[offset : offset + size])
+        elif self._path is not None:
+            with open(self._path, "rb") as f:
+                while True:
+                    chunk = _read_exact(f, size)
+                    if not chunk:
+                        return
+                    yield chunk
+        else:
+            # A shared file object: seek before every read so concurrent sends
+            # of the same attachment do not interfere
+            for offset in range(self._start, self._start + self.size, size):
+                with self._read_lock:
+                    self._file.seek(offset)
+                    chunk = _read_exact(self._file, size)
+                if not chunk:
+                    return
+                yield chunk
+
+    def iter_base64(self) -> Iterator[bytes]:
+        """Yield the base64-encoded content chunk by chunk."""
+        for chunk in self.iter_chunks():
+            yield base64.b64encode(chunk)
+
+    def metadata(self) -> Dict[str, Any]:
+        """The attachment's fields other than its content."""
+        fields = {
+            "filename": self.filename,
+            "content_type": self.content_type,
+            "disposition": self.disposition,
+        }
+        if self.content_id is not None:
+            fields["content_id"] = self.content_id
+        return fields
+
+    def reference(self, attachment_id: str) -> Dict[str, Any]:
+        """The message field referencing an uploaded copy of this attachment."""
+        return {**self.metadata(), "attachment_id": attachment_id}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The attachment with its whole content inline, as a plain dict."""
+        return {**self.metadata(), "content": b"".join(self.iter_base64()).decode("ascii")}
+
+    def upload_body(self, serializer: Optional[Serializer] = None) -> StreamingBody:
+        """The streamed request body uploading this attachment."""
+        token = _token()
+        return _stream_json({**self.metadata(), "content": token}, token, [self], serializer)
+
+
+def _seekable(source: Any) -> bool:
+    try:
+        return bool(source.seekable())
+    except (AttributeError, ValueError):
+        return False
+
+
+def _spool(source: IO[bytes], chunk_size: int) -> IO[bytes]:
+    """Copy a non-seekable stream into a temporary file (in memory while small)."""
+    spooled = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+    shutil.copyfileobj(source, spooled, chunk_size)
+    spooled.seek(0)
+    return spooled
+
+
+def _read_exact(f: IO[bytes], size: int) -> bytes:
+    """Read ``size`` bytes, or fewer only at the end of the file."""
+    chunk = f.read(size)
+    if not chunk or len(chunk) == size:
+        return chunk
+    parts = [chunk]
+    missing = size - len(chunk)
+    while missing:
+        more = f.read(missing)
+        if not more:
+            break
+        parts.append(more)
+        missing -= len(more)
+    return b"".join(parts)
+
+
+def _token() -> str:
+    return f"relaywarden-attachment-{uuid.uuid4().hex}"
+
+
+def _stream_json(
+    payload: Dict[str, Any],
+    token: str,
+    attachments: List[Attachment],
+    serializer: Optional[Serializer],
+) -> StreamingBody:
+    """
+    Serialise ``payload``, whose attachment contents are ``token`` strings, and
+    stream each attachment's base64 content in place of its token.
+    """
+    serialized = (serializer or Serializer()).dumps(payload)
+    parts = serialized.split(token.encode("ascii"))
+    if len(parts) != len(attachments) + 1:  # pragma: no cover - tokens are unique
+        raise ValueError("Could not place attachment content in the request body")
+    length = sum(map(len, parts)) + sum(attachment.encoded_size for attachment in attachments)
+
+    def chunks() -> Iterator[bytes]:
+        for part, attachment in zip(parts, attachments):
+            yield part
+            yield from attachment.iter_base64()
+        yield parts[-1]
+
+    return StreamingBody(chunks, length)
+
+
+def has_attachments(data: Any) -> bool:
+    """Whether a message payload has ``Attachment`` objects in its ``attachments``."""
+    if not isinstance(data, dict):
+        return False
+    return any(isinstance(item, Attachment) for item in data.get("attachments") or ())
+
+
+def stream_message(
+    data: Dict[str, Any], serializer: Optional[Serializer] = None
+) -> Union[Dict[str, Any], StreamingBody]:
+    """
+    Build the request body of a message whose ``attachments`` contain ``Attachment``
+    objects, streaming their content inline.
+
+    Returns:
+        A ``StreamingBody``, or ``data`` unchanged when it has no ``Attachment``
+    """
+    if not has_attachments(data):
+        return data
+    token = _token()
+    streamed = []
+    attachments = []
+    for item in data["attachments"]:
+        if isinstance(item, Attachment):
+            attachments.append(item)
+            item = {**item.metadata(), "content": token}
+        streamed.append(item)
+    return _stream_json({**data, "attachments": streamed}, token, attachments, serializer)
+
+
+def upload_key(client: BaseClient) -> Tuple[str, Optional[str]]:
+    """Attachments are uploaded once per API and project."""
+    return (client.base_url, client.project_id)
+
+
+def serializer_for(client: BaseClient) -> Optional[Serializer]:
+    """The serializer of the client's ``body_encoder``, if it has one."""
+    encoder = client.body_encoder
+    return encoder.serializer if encoder is not None else None
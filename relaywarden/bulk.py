@@ -0,0 +1,217 @@
+"""Bounded-concurrency helpers for bulk operations."""
+
+import asyncio
+import contextvars
+import itertools
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+)
+
+
+class BulkResult:
+    """Outcome of a single item in a bulk operation."""
+
+    __slots__ = ("index", "item", "idempotency_key", "response", "error")
+
+    def __init__(
+        self,
+        index: int,
+        item: Any,
+        idempotency_key: Optional[str] = None,
+        response: Optional[Dict[str, Any]] = None,
+        error: Optional[BaseException] = None,
+    ):
+        self.index = index
+        self.item = item
+        self.idempotency_key = idempotency_key
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item succeeded."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"BulkResult(index={self.index}, {status})"
+
+
+class BulkProgress:
+    """Running totals of a chunked bulk operation, passed to progress callbacks."""
+
+    __slots__ = ("items_done", "items_failed", "chunks_done", "chunks_failed", "started")
+
+    def __init__(self) -> None:
+        self.items_done = 0
+        self.items_failed = 0
+        self.chunks_done = 0
+        self.chunks_failed = 0
+        self.started = time.monotonic()
+
+    def record(self, result: BulkResult, size: int) -> None:
+        """Count a finished chunk of ``size`` items."""
+        if result.ok:
+            self.chunks_done += 1
+            self.items_done += size
+        else:
+            self.chunks_failed += 1
+            self.items_failed += size
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the operation started."""
+        return time.monotonic() - self.started
+
+    @property
+    def items_per_second(self) -> float:
+        """Average throughput of successfully processed items."""
+        elapsed = self.elapsed
+        return self.items_done / elapsed if elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"BulkProgress(items_done={self.items_done}, items_failed={self.items_failed}, "
+            f"chunks_done={self.chunks_done}, chunks_failed={self.chunks_failed})"
+        )
+
+
+class KeyedResults(dict):
+    """
+    Responses of a bulk lookup keyed by id.
+
+    Ids whose lookup failed are absent from the mapping and listed in ``errors``
+    with the exception raised for them.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.errors: Dict[str, BaseException] = {}
+
+    @property
+    def ok(self) -> bool:
+        """Whether every id was looked up successfully."""
+        return not self.errors
+
+    def __repr__(self) -> str:
+        return f"KeyedResults(found={len(self)}, errors={len(self.errors)})"
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Lazily split an iterable into lists of at most ``size`` items."""
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def bounded_map(
+    func: Callable[[Any], Any], items: Iterable[Any], concurrency: int = 10
+) -> Iterator[BulkResult]:
+    """
+    Run ``func`` over ``items`` on a thread pool, yielding results as they finish.
+
+    The input is consumed lazily and at most ``concurrency`` items are in flight,
+    so arbitrarily long streams run in constant memory. Exceptions raised by
+    ``func`` are captured on the result instead of aborting the batch.
+
+    Args:
+        func: Callable applied to each item
+        items: Any iterable, including generators
+        concurrency: Maximum number of items processed at once
+
+    Returns:
+        Iterator of BulkResult in completion order
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    source = iter(enumerate(items))
+    pending: Dict[Future, Any] = {}
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="relaywarden-bulk")
+    try:
+        while True:
+            while len(pending) < concurrency:
+                try:
+                    index, item = next(source)
+                except StopIteration:
+                    break
+                # Run in a copy of the caller's context so tracing spans nest correctly
+                future = executor.submit(contextvars.copy_context().run, func, item)
+                pending[future] = (index, item)
+
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, item = pending.pop(future)
+                error = future.exception()
+                if error is None:
+                    yield BulkResult(index, item, response=future.result())
+                else:
+                    yield BulkResult(index, item, error=error)
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+async def async_bounded_map(
+    func: Callable[[Any], Awaitable[Any]], items: Iterable[Any], concurrency: int = 10
+) -> AsyncIterator[BulkResult]:
+    """
+    Asyncio counterpart of :func:`bounded_map` running ``func`` as tasks.
+
+    Args:
+        func: Coroutine function applied to each item
+        items: Any iterable, including generators
+        concurrency: Maximum number of items processed at once
+
+    Returns:
+        Async iterator of BulkResult in completion order
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    source = iter(enumerate(items))
+    pending: Dict["asyncio.Task[Any]", Any] = {}
+    try:
+        while True:
+            while len(pending) < concurrency:
+                try:
+                    index, item = next(source)
+                except StopIteration:
+                    break
+                pending[asyncio.ensure_future(func(item))] = (index, item)
+
+            if not pending:
+                return
+
+            done: Set["asyncio.Task[Any]"]
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index, item = pending.pop(task)
+                error = task.exception()
+                if error is None:
+                    yield BulkResult(index, item, response=task.result())
+                else:
+                    yield BulkResult(index, item, error=error)
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,185 @@
+"""Opt-in TTL cache with ETag revalidation for slow-changing read endpoints."""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from relaywarden.metrics import endpoint_template
+
+# Seconds each endpoint template is served from cache before being revalidated
+DEFAULT_TTLS: Dict[str, float] = {
+    "/me": 300.0,
+    "/templates/{id}": 300.0,
+    "/domains/{id}/dns-records": 300.0,
+    "/senders": 60.0,
+    "/senders/{id}": 60.0,
+    "/compliance/exports/config": 300.0,
+    "/compliance/retention": 300.0,
+    # Quota changes with every request; cache just long enough to absorb bursts
+    "/limits": 5.0,
+}
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str], ...]]
+
+
+class CacheEntry:
+    """A cached response body with its validator and expiry."""
+
+    __slots__ = ("content", "etag", "expires_at")
+
+    def __init__(self, content: bytes, etag: Optional[str], expires_at: float):
+        self.content = content
+        self.etag = etag
+        self.expires_at = expires_at
+
+    def value(self) -> Optional[Dict[str, Any]]:
+        """Decode a fresh copy of the body, so callers may mutate it freely."""
+        return json.loads(self.content) if self.content else {}
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of GET responses for a client.
+
+    Only endpoints with a TTL are cached; TTLs are keyed by route template such as
+    ``/templates/{id}``. Entries are served locally until they expire, then
+    revalidated with ``If-None-Match`` when the API sent an ``ETag`` (a ``304``
+    refreshes the entry without transferring the body). Any successful write
+    (``POST``/``PATCH``/``PUT``/``DELETE``) through the client drops every cached
+    entry of the same top-level collection, e.g. updating ``/templates/{id}``
+    invalidates all ``/templates`` entries.
+
+    Entries are keyed by path, query parameters and project/team scope. Use one
+    cache per API token.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        max_entries: int = 1024,
+        default_ttl: Optional[float] = None,
+    ):
+        """
+        Args:
+            ttls: TTL in seconds per endpoint template, merged over ``DEFAULT_TTLS``;
+                a TTL of 0 disables caching for that endpoint
+            max_entries: Maximum number of cached responses; the least recently
+                used entry is evicted beyond this
+            default_ttl: TTL for GET endpoints not listed in ``ttls`` (default: not cached)
+        """
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """Get the TTL of an API path, or None when it is not cached."""
+        ttl = self.ttls.get(endpoint_template(path), self.default_ttl)
+        return ttl if ttl else None
+
+    def key(
+        self, path: str, params: Optional[Mapping[str, Any]], scope: Mapping[str, str]
+    ) -> Optional[CacheKey]:
+        """Build the cache key of a GET request, or None when the path is not cached."""
+        if self.ttl_for(path) is None:
+            return None
+        query = tuple(sorted((k, str(v)) for k, v in params.items())) if params else ()
+        # Header names are part of the key so a project and a team sharing an id differ
+        return (path, query, tuple(sorted(scope.items())))
+
+    def lookup(self, key: CacheKey) -> Tuple[Optional[CacheEntry], bool]:
+        """
+        Find the entry for a key.
+
+        Returns:
+            ``(entry, fresh)``; a stale entry is returned only when it can be
+            revalidated with its ETag
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, False
+            self._entries.move_to_end(key)
+            if now < entry.expires_at:
+                self.hits += 1
+                return entry, True
+            self.misses += 1
+            if entry.etag is None:
+                del self._entries[key]
+                return None, False
+            return entry, False
+
+    def conditional_headers(self, entry: Optional[CacheEntry]) -> Dict[str, str]:
+        """Headers revalidating a stale entry."""
+        if entry is None or entry.etag is None:
+            return {}
+        return {"If-None-Match": entry.etag}
+
+    def store(
+        self, key: CacheKey, response: Any, entry: Optional[CacheEntry]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Cache a response (or refresh ``entry`` on ``304``) and return the decoded body.
+        """
+        ttl = self.ttl_for(key[0]) or 0.0
+        expires_at = time.monotonic() + ttl
+        if response.status_code == 304 and entry is not None:
+            with self._lock:
+                entry.expires_at = expires_at
+                self.revalidations += 1
+            return entry.value()
+
+        content = response.content
+        if response.status_code != 200 or "no-store" in response.headers.get("Cache-Control", ""):
+            return json.loads(content) if content else {}
+
+        new_entry = CacheEntry(content, response.headers.get("ETag"), expires_at)
+        with self._lock:
+            self._entries[key] = new_entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return new_entry.value()
+
+    def invalidate(self, path: str) -> None:
+        """Drop every entry in the top-level collection of ``path``."""
+        collection = "/" + path.strip("/").split("/", 1)[0]
+        prefix = collection + "/"
+        with self._lock:
+            stale = [
+                key for key in self._entries if key[0] == collection or key[0].startswith(prefix)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit, miss, revalidation, eviction and invalidation counts."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,75 @@
+"""Small persistent key-value stores for resumable, incremental jobs."""
+
+import copy
+import json
+import os
+import threading
+from typing import Any, Dict, Optional
+
+
+class CheckpointStore:
+    """
+    Base class of checkpoint stores.
+
+    A checkpoint is a JSON-serializable dict saved under a string key. Subclass
+    and override :meth:`load` and :meth:`save` to keep checkpoints elsewhere,
+    e.g. in a database shared by several workers.
+    """
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the checkpoint saved under ``key``, or None."""
+        raise NotImplementedError
+
+    def save(self, key: str, value: Dict[str, Any]) -> None:
+        """Save the checkpoint under ``key``, replacing any previous one."""
+        raise NotImplementedError
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """Checkpoints kept in memory for the lifetime of the process."""
+
+    def __init__(self) -> None:
+        self._data: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            value = self._data.get(key)
+            return copy.deepcopy(value) if value is not None else None
+
+    def save(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._data[key] = copy.deepcopy(value)
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    Checkpoints kept in a local JSON file.
+
+    Every save rewrites the file atomically, so an interrupted process leaves
+    either the previous or the new checkpoint behind, never a partial one.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._read().get(key)
+
+    def save(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            data = self._read()
+            data[key] = value
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
@@ -1,11 +1,17 @@
 """Main client for interacting with the RelayWarden API."""
 
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import requests
-
-from relaywarden.exceptions import APIError, AuthenticationError, RateLimitError, ValidationError
+from urllib3.exceptions import NewConnectionError
+
+from relaywarden._base_client import BaseClient
+from relaywarden.cache import ResponseCache
+from relaywarden.exceptions import APIError
+from relaywarden.metrics import MetricsSink
+from relaywarden.middleware import Middleware
+from relaywarden.ratelimit import RateLimiter
 from relaywarden.resources.audit_logs import AuditLogs
 from relaywarden.resources.compliance import Compliance
 from relaywarden.resources.domains import Domains
@@ -19,9 +25,13 @@ from relaywarden.resources.suppressions import Suppressions
 from relaywarden.resources.templates import Templates
 from relaywarden.resources.usage import Usage
 from relaywarden.resources.webhooks import Webhooks
+from relaywarden.retry import RetryPolicy
+from relaywarden.serialization import BodyEncoder
+from relaywarden.transport import PooledHTTPAdapter
+from relaywarden.watcher import DeliveryWatcher
 
 
-class Client:
+class Client(BaseClient):
     """Main client for interacting with the RelayWarden API."""
 
     def __init__(
@@ -30,6 +40,19 @@ class Client:
         token: str,
         max_retries: int = 3,
         timeout: int = 30,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        tcp_keepalive: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        middleware: Optional[Iterable[Middleware]] = None,
+        metrics: Optional[MetricsSink] = None,
+        tracer: Optional[Any] = None,
+        cache: Optional[ResponseCache] = None,
+        body_encoder: Optional[BodyEncoder] = None,
     ):
         """
         Initialize a new RelayWarden API client.
@@ -39,22 +62,54 @@ class Client:
             token: Your API token
             max_retries: Maximum number of retry attempts (default: 3)
             timeout: Request timeout in seconds (default: 30)
+            pool_connections: Number of per-host connection pools to cache (default: 10)
+            pool_maxsize: Maximum connections kept open per host; size this to the
+                number of threads sharing the client (default: 10)
+            pool_block: Wait for a free connection when the pool is exhausted instead
+                of opening an overflow connection that is closed after use (default: False)
+            connect_timeout: Connect timeout in seconds (default: ``timeout``)
+            read_timeout: Read timeout in seconds (default: ``timeout``)
+            tcp_keepalive: Enable TCP keep-alive probes on pooled connections (default: False)
+            retry_policy: Backoff, retry budget and deadline settings
+                (default: ``RetryPolicy(max_retries=max_retries)``)
+            rate_limiter: Optional ``RateLimiter`` pacing requests from the server's
+                rate-limit headers; share one instance between clients using the same token
+            middleware: Hooks run around every request (see ``Middleware``)
+            metrics: Optional sink receiving latency, retry and throughput metrics,
+                e.g. ``InMemoryMetrics()``
+            tracer: Optional OpenTelemetry tracer, e.g. ``trace.get_tracer(__name__)``;
+                every call is wrapped in a client span (see ``TracingMiddleware``)
+            cache: Optional ``ResponseCache`` serving slow-changing GET endpoints
+                locally; writes through this client invalidate affected entries
+            body_encoder: Optional ``BodyEncoder`` serialising request bodies with
+                orjson/msgspec and compressing large ones, e.g. ``BodyEncoder()``
         """
-        self.base_url = base_url.rstrip("/")
-        self.token = token
-        self.max_retries = max_retries
-        self.timeout = timeout
-        self.project_id: Optional[str] = None
-        self.team_id: Optional[str] = None
-
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Authorization": f"Bearer {self.token}",
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            }
+        super().__init__(
+            base_url,
+            token,
+            max_retries,
+            timeout,
+            retry_policy,
+            rate_limiter,
+            middleware,
+            metrics,
+            tracer,
+            cache,
+            body_encoder,
         )
+        self.connect_timeout = connect_timeout if connect_timeout is not None else timeout
+        self.read_timeout = read_timeout if read_timeout is not None else timeout
+
+        self.adapter = PooledHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            tcp_keepalive=tcp_keepalive,
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+        self.session.headers.update(self._get_auth_headers())
 
         # Initialize resources
         self._identity: Optional[Identity] = None
@@ -70,22 +125,7 @@ class Client:
         self._usage: Optional[Usage] = None
         self._audit_logs: Optional[AuditLogs] = None
         self._compliance: Optional[Compliance] = None
-
-    def set_project_id(self, project_id: Optional[str]) -> None:
-        """Set the project ID for project-scoped operations."""
-        self.project_id = project_id
-
-    def get_project_id(self) -> Optional[str]:
-        """Get the current project ID."""
-        return self.project_id
-
-    def set_team_id(self, team_id: Optional[str]) -> None:
-        """Set the team ID."""
-        self.team_id = team_id
-
-    def get_team_id(self) -> Optional[str]:
-        """Get the current team ID."""
-        return self.team_id
+        self._delivery_watcher: Optional[DeliveryWatcher] = None
 
     @property
     def identity(self) -> Identity:
@@ -178,21 +218,30 @@ class Client:
             self._compliance = Compliance(self)
         return self._compliance
 
-    def _get_default_headers(self) -> Dict[str, str]:
-        """Get default headers including project/team IDs."""
-        headers = {}
-        if self.project_id:
-            headers["X-Project-Id"] = self.project_id
-        if self.team_id:
-            headers["X-Team-Id"] = self.team_id
-        return headers
+    @property
+    def delivery_watcher(self) -> DeliveryWatcher:
+        """Access the shared DeliveryWatcher waiting for messages to be delivered."""
+        if self._delivery_watcher is None:
+            self._delivery_watcher = DeliveryWatcher(self)
+        return self._delivery_watcher
+
+    def close(self) -> None:
+        """Stop the delivery watcher, if started, and close all pooled connections."""
+        if self._delivery_watcher is not None:
+            self._delivery_watcher.close()
+        self.session.close()
+
+    def pool_stats(self) -> List[Dict[str, Any]]:
+        """Get per-host connection pool usage (see ``PooledHTTPAdapter.pool_stats``)."""
+        return self.adapter.pool_stats()
 
     def request(
         self,
         method: str,
         path: str,
-        data: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
         headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Make an HTTP request with retry logic.
@@ -200,8 +249,10 @@ class Client:
         Args:
             method: HTTP method (GET, POST, PATCH, DELETE)
             path: API path
-            data: Request body data
+            data: Request body: JSON-serialisable data, serialised JSON bytes, or
+                an ``EncodedBody`` sent unchanged
             headers: Additional headers
+            params: Query parameters
 
         Returns:
             Response data or None for 204 responses
@@ -212,92 +263,90 @@ class Client:
             ValidationError: For validation errors
             RateLimitError: For rate limit errors
         """
-        url = f"{self.base_url}{path}"
-        request_headers = {**self._get_default_headers(), **(headers or {})}
+        cache = self.cache
+        if cache is not None:
+            if method == "GET":
+                key = cache.key(path, params, self._scope_headers)
+                if key is not None:
+                    entry, fresh = cache.lookup(key)
+                    if fresh:
+                        return entry.value()
+                    conditional = cache.conditional_headers(entry)
+                    if conditional:
+                        headers = {**(headers or {}), **conditional}
+                    response = self._send(method, path, params, data, headers)
+                    return cache.store(key, response, entry)
+            else:
+                body = self._parse_body(self._send(method, path, params, data, headers))
+                cache.invalidate(path)
+                return body
+        return self._parse_body(self._send(method, path, params, data, headers))
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Run a call through the request pipeline and return the successful response.
 
-        last_exception = None
-        for attempt in range(self.max_retries + 1):
+        Every attempt passes through the rate limiter and middleware hooks; failures
+        are retried according to ``retry_policy``.
+        """
+        ctx = self._build_context(method, path, params, data, headers)
+        body = source = None
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            for middleware in self.middleware:
+                middleware.before_request(ctx)
+            if ctx.data is not source:
+                # Encoded once per call, and again only if middleware replaced the body
+                source = ctx.data
+                body = self._encode_body(source)
             try:
                 response = self.session.request(
-                    method=method,
-                    url=url,
-                    json=data,
-                    headers=request_headers,
-                    timeout=self.timeout,
+                    method=ctx.method,
+                    url=ctx.url,
+                    params=ctx.params,
+                    json=ctx.data if body is None else None,
+                    data=body.content if body is not None else None,
+                    headers=self._body_headers(ctx.headers, body),
+                    timeout=self._attempt_timeout(ctx.started),
+                    stream=stream,
                 )
-
-                if response.status_code == 204:
-                    return None
-
-                if response.status_code >= 200 and response.status_code < 300:
-                    if response.content:
-                        return response.json()
-                    return {}
-
-                # Handle errors
-                error_data = None
-                if response.content:
-                    try:
-                        error_data = response.json()
-                    except ValueError:
-                        pass
-
-                api_error = self._handle_error_response(response, error_data)
-
-                # Retry on rate limit
-                if isinstance(api_error, RateLimitError) and attempt < self.max_retries:
-                    time.sleep(api_error.retry_after)
-                    last_exception = api_error
-                    continue
-
-                raise api_error
-
             except requests.exceptions.RequestException as e:
-                last_exception = e
-                if attempt < self.max_retries and self._is_retryable_error(e):
-                    time.sleep(0.1 * (attempt + 1))  # Exponential backoff
+                delay = self._retry_or_raise(ctx, e, self._transport_retryable(ctx, e))
+            except APIError as e:
+                # Deadline exceeded before the attempt was sent
+                self._retry_or_raise(ctx, e, False)
+            else:
+                if self._compression_rejected(ctx, response, body):
+                    # Resend uncompressed; compression stays off for this client
+                    response.close()
+                    self._end_rejected_attempt(ctx, response)
+                    source = None
                     continue
-                raise APIError(f"Request failed: {str(e)}", 0) from e
-
-        if last_exception:
-            raise last_exception
-
-        raise APIError(f"Request failed after {self.max_retries} retries")
-
-    def _handle_error_response(
-        self, response: requests.Response, error_data: Optional[Dict[str, Any]]
-    ) -> APIError:
-        """Handle error responses from the API."""
-        status_code = response.status_code
-        request_id = ""
-        error_code = ""
-        message = "An error occurred"
-        details = []
-
-        if error_data:
-            if "meta" in error_data and "request_id" in error_data["meta"]:
-                request_id = error_data["meta"]["request_id"]
-
-            if "error" in error_data:
-                error = error_data["error"]
-                error_code = error.get("code", "")
-                message = error.get("message", "An error occurred")
-                details = error.get("details", [])
-
-        if status_code == 401:
-            return AuthenticationError(message, status_code, request_id)
-        elif status_code == 422:
-            return ValidationError(message, details, request_id, status_code)
-        elif status_code == 429:
-            retry_after = 60
-            if "Retry-After" in response.headers:
-                try:
-                    retry_after = int(response.headers["Retry-After"])
-                except ValueError:
-                    pass
-            return RateLimitError(message, status_code, request_id, retry_after)
-        else:
-            return APIError(message, status_code, error_code, request_id, details)
+                delay = self._check_response(ctx, response)
+                if delay is None:
+                    return response
+                response.close()
+
+            time.sleep(delay)
+            ctx.attempt += 1
+
+    def _attempt_timeout(self, started: float) -> Tuple[float, float]:
+        """Connect/read timeouts for the next attempt, shortened to fit the deadline."""
+        remaining = self.retry_policy.remaining(time.monotonic() - started)
+        if remaining is None:
+            return (self.connect_timeout, self.read_timeout)
+        if remaining <= 0:
+            raise APIError("Request deadline exceeded", 0)
+        return (min(self.connect_timeout, remaining), min(self.read_timeout, remaining))
 
     def _is_retryable_error(self, error: Exception) -> bool:
         """Check if an error is retryable."""
@@ -307,58 +356,17 @@ class Client:
             return True
         return False
 
+    def _is_connect_error(self, error: Exception) -> bool:
+        """Check if a transport error happened before the request was sent."""
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+            return isinstance(getattr(error.args[0], "reason", None), NewConnectionError)
+        return False
+
     def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """Make a GET request."""
-        url = f"{self.base_url}{path}"
-        request_headers = self._get_default_headers()
-
-        last_exception = None
-        for attempt in range(self.max_retries + 1):
-            try:
-                response = self.session.get(
-                    url=url,
-                    params=params,
-                    headers=request_headers,
-                    timeout=self.timeout,
-                )
-
-                if response.status_code == 204:
-                    return None
-
-                if response.status_code >= 200 and response.status_code < 300:
-                    if response.content:
-                        return response.json()
-                    return {}
-
-                # Handle errors
-                error_data = None
-                if response.content:
-                    try:
-                        error_data = response.json()
-                    except ValueError:
-                        pass
-
-                api_error = self._handle_error_response(response, error_data)
-
-                # Retry on rate limit
-                if isinstance(api_error, RateLimitError) and attempt < self.max_retries:
-                    time.sleep(api_error.retry_after)
-                    last_exception = api_error
-                    continue
-
-                raise api_error
-
-            except requests.exceptions.RequestException as e:
-                last_exception = e
-                if attempt < self.max_retries and self._is_retryable_error(e):
-                    time.sleep(0.1 * (attempt + 1))  # Exponential backoff
-                    continue
-                raise APIError(f"Request failed: {str(e)}", 0) from e
-
-        if last_exception:
-            raise last_exception
-
-        raise APIError(f"Request failed after {self.max_retries} retries")
+        return self.request("GET", path, params=params)
 
     def post(
         self, path: str, data: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None
@@ -65,3 +65,27 @@ class ValidationError(APIError):
 
     def __str__(self) -> str:
         return f"Validation failed: {self.message} [Request ID: {self.request_id}]"
+
+
+class WebhookVerificationError(APIError):
+    """Exception raised when a received webhook fails signature or freshness checks."""
+
+    def __init__(self, message: str, code: int = 400):
+        super().__init__(message, code, "invalid_webhook")
+        self.message = message
+        self.code = code
+
+    def __str__(self) -> str:
+        return f"Webhook verification failed: {self.message}"
+
+
+class TemplateRenderError(APIError):
+    """Exception raised when a template cannot be compiled or rendered locally."""
+
+    def __init__(self, message: str, code: int = 422):
+        super().__init__(message, code, "template_error")
+        self.message = message
+        self.code = code
+
+    def __str__(self) -> str:
+        return f"Template rendering failed: {self.message}"
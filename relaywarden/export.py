@@ -0,0 +1,410 @@
+"""Streaming export of API records to day-partitioned columnar files."""
+
+from __future__ import annotations
+
+import csv
+import datetime
+import gzip
+import json
+import os
+import time
+import uuid
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - exercised only without the extra installed
+    pyarrow = None  # type: ignore[assignment]
+
+from relaywarden.bulk import BulkResult, async_bounded_map, bounded_map
+
+if TYPE_CHECKING:
+    from relaywarden.async_client import AsyncClient
+    from relaywarden.client import Client
+
+FORMATS = ("parquet", "arrow", "jsonl", "csv")
+EXTENSIONS = {
+    "parquet": ".parquet",
+    "arrow": ".arrow",
+    "jsonl": ".jsonl.gz",
+    "csv": ".csv.gz",
+}
+DEFAULT_COMPRESSION = {"parquet": "zstd", "arrow": "zstd", "jsonl": "gzip", "csv": "gzip"}
+
+# Fields holding a record's timestamp, tried in order to pick its partition
+PARTITION_FIELDS = ("created_at", "timestamp", "occurred_at")
+
+SCHEMA_FILE = "_schema.json"
+
+# Arrow types of the value types found in flattened records
+_ARROW_TYPES = {"int": "int64", "float": "float64", "bool": "bool_", "str": "string"}
+
+
+def column_type(types: Sequence[str]) -> Optional[str]:
+    """
+    The value type a column is stored as, given the value types seen in it.
+
+    Integers mixed with floats are stored as floats and any other mix as text
+    (``"str"``). None means no value has been seen yet.
+    """
+    kinds = set(types)
+    if not kinds:
+        return None
+    if kinds <= {"int", "float"}:
+        return "float" if "float" in kinds else "int"
+    if len(kinds) == 1:
+        return kinds.pop()
+    return "str"
+
+
+def default_format() -> str:
+    """Parquet when pyarrow is installed, otherwise gzipped JSON Lines."""
+    return "parquet" if pyarrow is not None else "jsonl"
+
+
+def flatten(record: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """
+    Flatten nested objects into dotted column names.
+
+    ``{"data": {"message_id": "m1"}}`` becomes ``{"data.message_id": "m1"}``;
+    lists are kept as JSON text so every column holds scalars.
+    """
+    flat: Dict[str, Any] = {}
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, name + "."))
+        elif isinstance(value, (list, tuple)):
+            flat[name] = json.dumps(value, separators=(",", ":"), default=str)
+        else:
+            flat[name] = value
+    return flat
+
+
+def partition_date(value: Any) -> str:
+    """Get the ``YYYY-MM-DD`` day of an ISO 8601 string or Unix timestamp (UTC)."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        moment = datetime.datetime.fromtimestamp(value, datetime.timezone.utc)
+        return moment.strftime("%Y-%m-%d")
+    if isinstance(value, str) and len(value) >= 10 and value[4] == "-" and value[7] == "-":
+        return value[:10]
+    return "unknown"
+
+
+class ExportSummary:
+    """What an export wrote."""
+
+    __slots__ = ("rows", "files", "partitions", "columns", "failed")
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.files: List[str] = []
+        self.partitions: List[str] = []
+        self.columns: List[str] = []
+        self.failed: List[BulkResult] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"ExportSummary(rows={self.rows}, files={len(self.files)}, "
+            f"partitions={len(self.partitions)}, columns={len(self.columns)}, "
+            f"failed={len(self.failed)})"
+        )
+
+
+class ColumnarExporter:
+    """
+    Append records to day-partitioned, compressed columnar files.
+
+    Records are flattened to dotted columns and buffered per day; a full buffer is
+    written as a new part file under ``<directory>/date=YYYY-MM-DD/``, so memory
+    stays bounded by ``max_buffered_rows`` no matter how many records stream
+    through, and files already on disk are never rewritten. The Hive-style layout
+    can be loaded directly, e.g. with ``pyarrow.dataset.dataset(directory,
+    partitioning="hive")`` or ``pandas.read_parquet(directory)``.
+
+    Each part file carries the columns of its own records. Columns that appear
+    later are simply added to later files. A column's type is decided from every
+    value seen so far in the export, not just the file's own records: integers
+    mixed with floats are stored as floats and any other mix as text, so parts
+    written after the first mix all agree. ``_schema.json`` in the directory lists
+    all columns with the value types seen so far.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        format: Optional[str] = None,
+        partition_by: Union[str, Sequence[str]] = PARTITION_FIELDS,
+        batch_size: int = 10_000,
+        max_buffered_rows: int = 50_000,
+        compression: Optional[str] = None,
+    ):
+        """
+        Args:
+            directory: Root directory of the export (created if missing)
+            format: ``parquet``, ``arrow`` (Arrow IPC), ``jsonl`` or ``csv``
+                (default: ``parquet`` with pyarrow installed, otherwise ``jsonl``)
+            partition_by: Timestamp field, or fields tried in order, deciding a
+                record's day partition
+            batch_size: Rows per part file
+            max_buffered_rows: Rows held in memory across all partitions before the
+                largest buffer is written early
+            compression: Codec for parquet/arrow files (default: ``zstd``); JSON
+                Lines and CSV files are always gzipped
+        """
+        format = format or default_format()
+        if format not in FORMATS:
+            raise ValueError(f"Unknown export format {format!r}; use one of {FORMATS}")
+        if format in ("parquet", "arrow") and pyarrow is None:
+            raise ImportError(
+                f"The {format} format requires pyarrow. Install it with: "
+                "pip install relaywarden[export]"
+            )
+        self.directory = directory
+        self.format = format
+        self.partition_by = (partition_by,) if isinstance(partition_by, str) else partition_by
+        self.batch_size = batch_size
+        self.max_buffered_rows = max_buffered_rows
+        self.compression = compression or DEFAULT_COMPRESSION[format]
+        self.summary = ExportSummary()
+        self._buffers: Dict[str, List[Dict[str, Any]]] = {}
+        self._buffered = 0
+        self._sequence = 0
+        self._run_id = f"{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}"
+        self._schema: Dict[str, List[str]] = self._load_schema()
+        os.makedirs(directory, exist_ok=True)
+
+    def __enter__(self) -> ColumnarExporter:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Buffer one record, writing a part file when its partition's buffer is full."""
+        row = flatten(record)
+        stamp = next((row[f] for f in self.partition_by if row.get(f) is not None), None)
+        day = partition_date(stamp)
+        buffer = self._buffers.setdefault(day, [])
+        buffer.append(row)
+        self._buffered += 1
+        if len(buffer) >= self.batch_size:
+            self._flush_partition(day)
+        elif self._buffered >= self.max_buffered_rows:
+            self._flush_partition(max(self._buffers, key=lambda d: len(self._buffers[d])))
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Buffer many records."""
+        for record in records:
+            self.add(record)
+
+    def flush(self) -> None:
+        """Write every buffered record."""
+        for day in list(self._buffers):
+            self._flush_partition(day)
+
+    def close(self) -> ExportSummary:
+        """Write the remaining records and the schema file."""
+        self.flush()
+        self._save_schema()
+        self.summary.columns = list(self._schema)
+        return self.summary
+
+    def _flush_partition(self, day: str) -> None:
+        rows = self._buffers.pop(day, None)
+        if not rows:
+            return
+        self._buffered -= len(rows)
+        columns = self._observe(rows)
+
+        partition_dir = os.path.join(self.directory, f"date={day}")
+        os.makedirs(partition_dir, exist_ok=True)
+        self._sequence += 1
+        name = f"part-{self._run_id}-{self._sequence:05d}{EXTENSIONS[self.format]}"
+        path = os.path.join(partition_dir, name)
+        tmp_path = f"{path}.tmp"
+        getattr(self, f"_write_{self.format}")(tmp_path, rows, columns)
+        os.replace(tmp_path, path)
+
+        self.summary.rows += len(rows)
+        self.summary.files.append(path)
+        if day not in self.summary.partitions:
+            self.summary.partitions.append(day)
+
+    def _observe(self, rows: List[Dict[str, Any]]) -> List[str]:
+        """Record the columns and value types of a batch; returns its columns in order."""
+        seen: Dict[str, None] = {}
+        for row in rows:
+            for name, value in row.items():
+                seen[name] = None
+                if value is None:
+                    continue
+                types = self._schema.setdefault(name, [])
+                type_name = type(value).__name__
+                if type_name not in types:
+                    types.append(type_name)
+        for name in seen:
+            self._schema.setdefault(name, [])
+        # Keep the export-wide column order so files line up where they overlap
+        return [name for name in self._schema if name in seen]
+
+    def _load_schema(self) -> Dict[str, List[str]]:
+        try:
+            with open(os.path.join(self.directory, SCHEMA_FILE), encoding="utf-8") as f:
+                return json.load(f).get("columns", {})
+        except FileNotFoundError:
+            return {}
+
+    def _save_schema(self) -> None:
+        path = os.path.join(self.directory, SCHEMA_FILE)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump({"format": self.format, "columns": self._schema}, f, indent=2)
+        os.replace(f"{path}.tmp", path)
+
+    def _arrow_table(self, rows: List[Dict[str, Any]], columns: List[str]) -> Any:
+        arrays = {}
+        for name in columns:
+            values = [row.get(name) for row in rows]
+            arrow_type = _ARROW_TYPES.get(column_type(self._schema.get(name, ())))
+            if arrow_type is None:
+                # No value seen yet, or a type without a fixed mapping: infer it
+                try:
+                    arrays[name] = pyarrow.array(values)
+                    continue
+                except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                    arrow_type = "string"
+            if arrow_type == "string":
+                values = [v if v is None or isinstance(v, str) else str(v) for v in values]
+            arrays[name] = pyarrow.array(values, getattr(pyarrow, arrow_type)())
+        return pyarrow.table(arrays)
+
+    def _write_parquet(self, path: str, rows: List[Dict[str, Any]], columns: List[str]) -> None:
+        table = self._arrow_table(rows, columns)
+        pyarrow.parquet.write_table(table, path, compression=self.compression)
+
+    def _write_arrow(self, path: str, rows: List[Dict[str, Any]], columns: List[str]) -> None:
+        table = self._arrow_table(rows, columns)
+        options = pyarrow.ipc.IpcWriteOptions(compression=self.compression)
+        with pyarrow.ipc.new_file(path, table.schema, options=options) as writer:
+            writer.write_table(table)
+
+    def _write_jsonl(self, path: str, rows: List[Dict[str, Any]], columns: List[str]) -> None:
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, separators=(",", ":"), default=str))
+                f.write("\n")
+
+    def _write_csv(self, path: str, rows: List[Dict[str, Any]], columns: List[str]) -> None:
+        with gzip.open(path, "wt", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, columns, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+def _timeline_entries(message_id: str, response: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Get the entries of a timeline response, each tagged with its message id."""
+    data = response.get("data", response)
+    if isinstance(data, dict):
+        data = data.get("events") or data.get("timeline") or []
+    return [{"message_id": message_id, **entry} for entry in data if isinstance(entry, dict)]
+
+
+def export_events(
+    client: Client,
+    directory: str,
+    filters: Optional[Dict[str, Any]] = None,
+    per_page: int = 100,
+    **options: Any,
+) -> ExportSummary:
+    """
+    Stream events matching ``filters`` into a :class:`ColumnarExporter`.
+
+    Pages are prefetched while the previous one is being written.
+
+    Args:
+        client: Client used for the requests
+        directory: Root directory of the export
+        filters: Optional query parameters, e.g. a ``created_after`` bound
+        per_page: Page size
+        **options: Options of :class:`ColumnarExporter` (``format``, ...)
+    """
+    with ColumnarExporter(directory, **options) as exporter:
+        exporter.extend(client.events.list_all(filters, per_page, prefetch=True))
+    return exporter.summary
+
+
+def export_timelines(
+    client: Client,
+    message_ids: Iterable[str],
+    directory: str,
+    concurrency: int = 8,
+    **options: Any,
+) -> ExportSummary:
+    """
+    Fetch message timelines concurrently and export their entries, one row each.
+
+    Timelines that cannot be fetched are listed in ``failed`` of the summary.
+    """
+    with ColumnarExporter(directory, **options) as exporter:
+        for result in bounded_map(client.messages.get_timeline, message_ids, concurrency):
+            if result.ok:
+                exporter.extend(_timeline_entries(result.item, result.response))
+            else:
+                exporter.summary.failed.append(result)
+    return exporter.summary
+
+
+async def async_export_events(
+    client: AsyncClient,
+    directory: str,
+    filters: Optional[Dict[str, Any]] = None,
+    per_page: int = 100,
+    **options: Any,
+) -> ExportSummary:
+    """Asyncio counterpart of :func:`export_events`; files are written on the event loop."""
+    with ColumnarExporter(directory, **options) as exporter:
+        items: AsyncIterable[Dict[str, Any]] = client.events.list_all(
+            filters, per_page, prefetch=True
+        )
+        async for item in items:
+            exporter.add(item)
+    return exporter.summary
+
+
+async def async_export_timelines(
+    client: AsyncClient,
+    message_ids: Iterable[str],
+    directory: str,
+    concurrency: int = 8,
+    **options: Any,
+) -> ExportSummary:
+    """Asyncio counterpart of :func:`export_timelines`."""
+    with ColumnarExporter(directory, **options) as exporter:
+        async for result in async_bounded_map(
+            client.messages.get_timeline, message_ids, concurrency
+        ):
+            if result.ok:
+                exporter.extend(_timeline_entries(result.item, result.response))
+            else:
+                exporter.summary.failed.append(result)
+    return exporter.summary
+
+
+def read_rows(path: str) -> List[Dict[str, Any]]:
+    """Read the rows of one JSON Lines or CSV part file, e.g. for inspection or tests."""
+    with gzip.open(path, "rt", encoding="utf-8", newline="") as f:
+        if path.endswith(EXTENSIONS["csv"]):
+            return list(csv.DictReader(f))
+        return [json.loads(line) for line in f if line.strip()]
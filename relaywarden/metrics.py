@@ -0,0 +1,335 @@
+"""Latency, throughput and retry instrumentation for the request pipeline."""
+
+import bisect
+import datetime
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from relaywarden.middleware import Middleware, RequestContext, is_success
+from relaywarden.transport import start_timings, stop_timings
+
+# Path segments that are part of the API's route templates; anything else is an ID
+STATIC_SEGMENTS = frozenset(
+    {
+        "audit-logs",
+        "batch",
+        "cancel",
+        "checks",
+        "compliance",
+        "config",
+        "daily",
+        "deliveries",
+        "diagnostics",
+        "dkim",
+        "dns-records",
+        "domains",
+        "enable-production",
+        "endpoints",
+        "events",
+        "export",
+        "exports",
+        "import",
+        "limits",
+        "me",
+        "messages",
+        "projects",
+        "render",
+        "replay",
+        "resend",
+        "retention",
+        "rotate",
+        "senders",
+        "service-accounts",
+        "suppressions",
+        "teams",
+        "templates",
+        "test",
+        "test-send",
+        "timeline",
+        "tokens",
+        "usage",
+        "verify",
+        "versions",
+        "webhooks",
+    }
+)
+
+_TEMPLATE_CACHE_SIZE = 4096
+_SEGMENT_RE = re.compile(r"[^/]+")
+
+# Upper bounds in seconds of the latency histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_template_cache: Dict[str, str] = {}
+
+
+def endpoint_template(path: str) -> str:
+    """
+    Collapse IDs in an API path into a route template.
+
+    ``/messages/5f0c.../timeline`` becomes ``/messages/{id}/timeline`` so metrics
+    are aggregated per endpoint rather than per resource.
+    """
+    template = _template_cache.get(path)
+    if template is None:
+        template = _SEGMENT_RE.sub(
+            lambda m: m.group(0) if m.group(0) in STATIC_SEGMENTS else "{id}", path
+        )
+        if len(_template_cache) < _TEMPLATE_CACHE_SIZE:
+            _template_cache[path] = template
+    return template
+
+
+class MetricsSink:
+    """
+    Destination for SDK metrics.
+
+    Subclass this to forward metrics to Prometheus, StatsD, OpenTelemetry or any
+    other backend. ``tags`` always includes ``method`` and ``endpoint``.
+    """
+
+    def observe(self, name: str, value: float, tags: Dict[str, str]) -> None:
+        """Record one sample of a distribution (latencies, in seconds)."""
+
+    def increment(self, name: str, value: float, tags: Dict[str, str]) -> None:
+        """Add ``value`` to a counter."""
+
+    def gauge(self, name: str, delta: float, tags: Dict[str, str]) -> None:
+        """Move a gauge up or down by ``delta``."""
+
+
+class Histogram:
+    """Fixed-bucket histogram with count, sum, min and max."""
+
+    __slots__ = ("buckets", "counts", "count", "total", "min", "max")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> float:
+        """Estimate the ``q``-th percentile (0-100) by interpolating within buckets."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+
+TagKey = Tuple[Tuple[str, str], ...]
+
+
+class InMemoryMetrics(MetricsSink):
+    """Thread-safe, zero-dependency metrics collector."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._histograms: Dict[Tuple[str, TagKey], Histogram] = {}
+        self._counters: Dict[Tuple[str, TagKey], float] = {}
+        self._gauges: Dict[Tuple[str, TagKey], float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, value: float, tags: Dict[str, str]) -> None:
+        key = (name, tuple(sorted(tags.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self.buckets)
+            histogram.add(value)
+
+    def increment(self, name: str, value: float, tags: Dict[str, str]) -> None:
+        key = (name, tuple(sorted(tags.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def gauge(self, name: str, delta: float, tags: Dict[str, str]) -> None:
+        key = (name, tuple(sorted(tags.items())))
+        with self._lock:
+            self._gauges[key] = self._gauges.get(key, 0) + delta
+
+    def histogram(self, name: str, **tags: str) -> Optional[Histogram]:
+        """Get the histogram for a metric name and exact tag set."""
+        return self._histograms.get((name, tuple(sorted(tags.items()))))
+
+    def counter(self, name: str, **tags: str) -> float:
+        """Get a counter value, summed over all series matching the given tags."""
+        with self._lock:
+            return sum(
+                value
+                for (metric, key), value in self._counters.items()
+                if metric == name and all(item in key for item in tags.items())
+            )
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get all metrics as plain data, e.g. for logging or JSON export."""
+        with self._lock:
+            return {
+                "histograms": [
+                    {"name": name, "tags": dict(key), **histogram.summary()}
+                    for (name, key), histogram in self._histograms.items()
+                ],
+                "counters": [
+                    {"name": name, "tags": dict(key), "value": value}
+                    for (name, key), value in self._counters.items()
+                ],
+                "gauges": [
+                    {"name": name, "tags": dict(key), "value": value}
+                    for (name, key), value in self._gauges.items()
+                ],
+            }
+
+    def reset(self) -> None:
+        """Drop recorded histograms and counters; gauges keep tracking live state."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+
+def _header_length(headers: Any) -> Optional[int]:
+    try:
+        return int(headers.get("Content-Length"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _request_size(response: Any) -> int:
+    request = getattr(response, "request", None)
+    body = getattr(request, "body", None)
+    if body is None:
+        # httpx keeps the encoded body on ``request.content``
+        body = getattr(request, "content", None)
+    if isinstance(body, (bytes, str)):
+        return len(body)
+    return 0
+
+
+def _response_size(response: Any) -> int:
+    length = _header_length(getattr(response, "headers", None))
+    if length is not None:
+        return length
+    content = getattr(response, "_content", None)
+    if isinstance(content, bytes):
+        return len(content)
+    return 0
+
+
+class MetricsMiddleware(Middleware):
+    """
+    Middleware recording request metrics into a :class:`MetricsSink`.
+
+    Recorded metrics (seconds unless noted):
+
+    - ``relaywarden.request.duration``: whole call including retries, tagged by status
+    - ``relaywarden.attempt.duration``: each attempt
+    - ``relaywarden.ttfb``: time to response headers
+    - ``relaywarden.pool_wait``, ``relaywarden.connect``, ``relaywarden.tls``:
+      connection-level phases (sync ``Client`` only; ``connect`` covers DNS and TCP)
+    - ``relaywarden.retries``, ``relaywarden.rate_limited``, ``relaywarden.errors``: counters
+    - ``relaywarden.bytes_sent``, ``relaywarden.bytes_received``: counters, in bytes
+    - ``relaywarden.in_flight``: gauge of attempts currently on the wire
+    """
+
+    def __init__(self, sink: MetricsSink):
+        self.sink = sink
+
+    def _tags(self, ctx: RequestContext) -> Dict[str, str]:
+        tags = ctx.extras.get("metrics.tags")
+        if tags is None:
+            tags = ctx.extras["metrics.tags"] = {
+                "method": ctx.method,
+                "endpoint": endpoint_template(ctx.path),
+            }
+        return tags
+
+    def _end_attempt(self, ctx: RequestContext) -> Optional[float]:
+        started = ctx.extras.pop("metrics.attempt_started", None)
+        if started is None:
+            return None
+        self.sink.gauge("relaywarden.in_flight", -1, self._tags(ctx))
+        return time.perf_counter() - started
+
+    def before_request(self, ctx: RequestContext) -> None:
+        tags = self._tags(ctx)
+        self.sink.gauge("relaywarden.in_flight", 1, tags)
+        start_timings()
+        ctx.extras["metrics.attempt_started"] = time.perf_counter()
+
+    def after_response(self, ctx: RequestContext, response: Any) -> None:
+        duration = self._end_attempt(ctx)
+        tags = self._tags(ctx)
+        sink = self.sink
+
+        if duration is not None:
+            sink.observe("relaywarden.attempt.duration", duration, tags)
+        timings = stop_timings()
+        if timings:
+            for phase, seconds in timings.items():
+                sink.observe(f"relaywarden.{phase}", seconds, tags)
+        try:
+            elapsed = getattr(response, "elapsed", None)
+        except RuntimeError:
+            # httpx only knows the elapsed time once the body stream was closed
+            elapsed = None
+        if isinstance(elapsed, datetime.timedelta):
+            sink.observe("relaywarden.ttfb", elapsed.total_seconds(), tags)
+
+        sink.increment("relaywarden.bytes_sent", _request_size(response), tags)
+        sink.increment("relaywarden.bytes_received", _response_size(response), tags)
+
+        status = response.status_code
+        if status == 429:
+            sink.increment("relaywarden.rate_limited", 1, tags)
+        if is_success(status):
+            self._observe_call(ctx, str(status))
+
+    def on_retry(self, ctx: RequestContext, error: Exception, delay: float) -> None:
+        self._end_attempt(ctx)
+        stop_timings()
+        self.sink.increment("relaywarden.retries", 1, self._tags(ctx))
+
+    def on_error(self, ctx: RequestContext, error: Exception) -> None:
+        self._end_attempt(ctx)
+        stop_timings()
+        status = str(getattr(error, "code", 0))
+        self.sink.increment("relaywarden.errors", 1, {**self._tags(ctx), "status": status})
+        self._observe_call(ctx, status)
+
+    def _observe_call(self, ctx: RequestContext, status: str) -> None:
+        self.sink.observe(
+            "relaywarden.request.duration",
+            time.monotonic() - ctx.started,
+            {**self._tags(ctx), "status": status},
+        )
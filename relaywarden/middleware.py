@@ -0,0 +1,71 @@
+"""Middleware hooks around every request made by a client."""
+
+from typing import Any, Dict, Optional
+
+
+def is_success(status_code: int) -> bool:
+    """Whether a response completes the call: any 2xx, or 304 to a conditional GET."""
+    return 200 <= status_code < 300 or status_code == 304
+
+
+class RequestContext:
+    """
+    State of one API call, shared by every attempt and passed to each hook.
+
+    Middleware may modify ``headers``, ``params`` and ``data`` in ``before_request``
+    and keep its own per-call state in ``extras``.
+    """
+
+    __slots__ = (
+        "method",
+        "path",
+        "url",
+        "params",
+        "data",
+        "headers",
+        "attempt",
+        "started",
+        "extras",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        data: Any,
+        headers: Dict[str, str],
+        started: float,
+    ):
+        self.method = method
+        self.path = path
+        self.url = url
+        self.params = params
+        self.data = data
+        self.headers = headers
+        self.attempt = 0
+        self.started = started
+        self.extras: Dict[str, Any] = {}
+
+
+class Middleware:
+    """
+    Base class for request middleware.
+
+    Override any of the hooks; the defaults do nothing. Hooks run synchronously in
+    the calling thread (or on the event loop for ``AsyncClient``), so they should be
+    cheap and must not block.
+    """
+
+    def before_request(self, ctx: RequestContext) -> None:
+        """Called before each attempt is sent."""
+
+    def after_response(self, ctx: RequestContext, response: Any) -> None:
+        """Called for each attempt that received an HTTP response, including errors."""
+
+    def on_retry(self, ctx: RequestContext, error: Exception, delay: float) -> None:
+        """Called when a failed attempt will be retried after ``delay`` seconds."""
+
+    def on_error(self, ctx: RequestContext, error: Exception) -> None:
+        """Called once when the call fails for good, before ``error`` is raised."""
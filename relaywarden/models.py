@@ -0,0 +1,384 @@
+"""Typed, slotted models for API responses."""
+
+from __future__ import annotations
+
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+M = TypeVar("M", bound="Model")
+
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, ModelList):
+        return value.to_list()
+    if isinstance(value, list):
+        return [_dump(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _dump(item) for key, item in value.items()}
+    return value
+
+
+class Model:
+    """
+    Base class of response models.
+
+    Each subclass lists its fields in ``__slots__``; a trailing underscore maps
+    an attribute to a key that is a Python keyword (``from_`` reads ``"from"``).
+    ``_nested`` maps fields holding objects, or lists of objects, to their model.
+
+    By default every field is decoded when the model is created and the source
+    dict is released, so a model takes less memory than the dict it came from.
+    With ``lazy=True`` the source dict is kept and each field is decoded, and
+    cached, the first time it is read, which is cheapest when only a few fields
+    of many records are used. Missing fields read as None. Keys without a field
+    stay available through ``model["key"]``, and ``to_dict()`` returns the
+    record as plain data again.
+    """
+
+    __slots__ = ("_data", "_extra")
+
+    # Set for every subclass by __init_subclass__
+    _keys: Dict[str, str] = {}
+    _names: Dict[str, str] = {}
+    _nested: Dict[str, Type["Model"]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        keys: Dict[str, str] = {}
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get("__slots__", ()):
+                if not name.startswith("_"):
+                    keys[name] = name[:-1] if name.endswith("_") else name
+        cls._keys = keys
+        cls._names = {key: name for name, key in keys.items()}
+
+    def __init__(self, data: Mapping[str, Any], lazy: bool = False):
+        """
+        Args:
+            data: The record, e.g. the ``data`` of a response envelope
+            lazy: Decode fields on first access instead of now
+        """
+        if lazy:
+            self._data: Optional[Mapping[str, Any]] = data
+            self._extra: Optional[Dict[str, Any]] = None
+            return
+        self._data = None
+        extra = None
+        names = self._names
+        nested = self._nested
+        for key, value in data.items():
+            name = names.get(key)
+            if name is None:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+            else:
+                if name in nested:
+                    value = _decode(value, nested[name], False)
+                object.__setattr__(self, name, value)
+        self._extra = extra
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for fields not decoded yet (unset slots)
+        key = self._keys.get(name)
+        if key is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        data = self._data
+        if data is None:
+            return None
+        value = data.get(key)
+        if name in self._nested:
+            value = _decode(value, self._nested[name], True)
+        object.__setattr__(self, name, value)
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        name = self._names.get(key)
+        if name is not None:
+            return getattr(self, name)
+        source = self._data if self._data is not None else self._extra or {}
+        return source[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a field or unmodelled key by its API name."""
+        try:
+            value = self[key]
+        except KeyError:
+            return default
+        return default if value is None else value
+
+    def _set_fields(self) -> Iterator[tuple]:
+        """``(key, value)`` of every field present on an eagerly decoded model."""
+        for name, key in self._keys.items():
+            try:
+                yield key, object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the model, including nested models, back to plain data."""
+        data = self._data
+        if data is None:
+            result = {key: _dump(value) for key, value in self._set_fields()}
+            if self._extra:
+                result.update(_dump(self._extra))
+            return result
+        result = {}
+        names = self._names
+        for key, value in data.items():
+            name = names.get(key)
+            if name is not None:
+                try:
+                    value = object.__getattribute__(self, name)
+                except AttributeError:
+                    pass
+            result[key] = _dump(value)
+        return result
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Model):
+            return NotImplemented
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        identifier = self.get("id")
+        if identifier is None:
+            return f"{type(self).__name__}()"
+        return f"{type(self).__name__}(id={identifier!r})"
+
+
+class ModelList(Sequence):
+    """A list of records decoded into models when an item is first read."""
+
+    __slots__ = ("_items", "_model", "_lazy", "_decoded")
+
+    def __init__(self, items: List[Any], model: Type[Model], lazy: bool = False):
+        self._items = items
+        self._model = model
+        self._lazy = lazy
+        self._decoded: List[Optional[Model]] = [None] * len(items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Any]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+        item = self._decoded[index]
+        if item is None:
+            raw = self._items[index]
+            if not isinstance(raw, Mapping):
+                return raw
+            item = self._decoded[index] = self._model(raw, self._lazy)
+        return item
+
+    def to_list(self) -> List[Any]:
+        """Convert every item back to plain data."""
+        return [
+            _dump(item) if item is not None else _dump(raw)
+            for item, raw in zip(self._decoded, self._items)
+        ]
+
+    def __repr__(self) -> str:
+        return f"ModelList({self._model.__name__}, {len(self)} items)"
+
+
+def _decode(value: Any, model: Type[Model], lazy: bool) -> Any:
+    if isinstance(value, Mapping):
+        return model(value, lazy)
+    if isinstance(value, list):
+        if lazy:
+            return ModelList(value, model, True)
+        return [model(item) if isinstance(item, Mapping) else item for item in value]
+    return value
+
+
+class Address(Model):
+    """An email address with an optional display name."""
+
+    __slots__ = ("email", "name")
+
+
+class Message(Model):
+    """A sent message, as returned by ``Messages.get`` and ``Messages.list``."""
+
+    __slots__ = (
+        "id",
+        "message_id",
+        "project_id",
+        "status",
+        "subject",
+        "from_",
+        "to",
+        "cc",
+        "bcc",
+        "reply_to",
+        "tags",
+        "metadata",
+        "created_at",
+        "updated_at",
+    )
+    _nested = {"from_": Address, "to": Address, "cc": Address, "bcc": Address, "reply_to": Address}
+
+
+class TimelineEntry(Model):
+    """One status change in a message's delivery timeline."""
+
+    __slots__ = ("status", "timestamp", "details")
+
+
+class Event(Model):
+    """A delivery or engagement event."""
+
+    __slots__ = ("id", "type", "message_id", "recipient", "data", "created_at")
+
+
+class DnsRecord(Model):
+    """A DNS record required to verify a domain."""
+
+    __slots__ = ("type", "name", "value", "status")
+
+
+class Domain(Model):
+    """A sending domain."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "status",
+        "dns_records",
+        "verified_at",
+        "created_at",
+        "updated_at",
+    )
+    _nested = {"dns_records": DnsRecord}
+
+
+class Sender(Model):
+    """A verified sender identity."""
+
+    __slots__ = ("id", "email", "name", "domain_id", "status", "created_at", "updated_at")
+
+
+class Suppression(Model):
+    """A suppressed recipient."""
+
+    __slots__ = ("id", "email", "reason", "source", "created_at", "expires_at")
+
+
+class Template(Model):
+    """An email template or one of its versions."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "version",
+        "subject",
+        "html_body",
+        "text_body",
+        "created_at",
+        "updated_at",
+    )
+
+
+class Project(Model):
+    """A project."""
+
+    __slots__ = ("id", "name", "team_id", "created_at", "updated_at")
+
+
+class WebhookEndpoint(Model):
+    """A webhook endpoint."""
+
+    __slots__ = ("id", "url", "events", "status", "created_at", "updated_at")
+
+
+class WebhookDelivery(Model):
+    """One delivery attempt of an event to a webhook endpoint."""
+
+    __slots__ = (
+        "id",
+        "event_id",
+        "endpoint_id",
+        "status",
+        "response_code",
+        "attempts",
+        "created_at",
+    )
+
+
+class AuditLog(Model):
+    """An audit log entry."""
+
+    __slots__ = (
+        "id",
+        "action",
+        "actor",
+        "resource_type",
+        "resource_id",
+        "ip_address",
+        "created_at",
+    )
+
+
+def parse(
+    response: Optional[Mapping[str, Any]], model: Type[M], lazy: bool = False
+) -> Union[M, ModelList, None]:
+    """
+    Decode a response envelope into models.
+
+    Args:
+        response: A resource method's response, e.g. ``client.messages.get(...)``
+        model: Model class of the records, e.g. ``Message``
+        lazy: Decode fields on first access (see ``Model``)
+
+    Returns:
+        A model for a single record, a ``ModelList`` for a list response (items
+        are decoded when read), or None for an empty response
+    """
+    if not response:
+        return None
+    data = response.get("data", response)
+    if isinstance(data, list):
+        return ModelList(data, model, lazy)
+    return model(data, lazy)
+
+
+def iter_models(
+    items: Iterable[Mapping[str, Any]], model: Type[M], lazy: bool = True
+) -> Iterator[M]:
+    """Wrap records from an iterator such as ``Events.list_all`` in models."""
+    for item in items:
+        yield model(item, lazy)
+
+
+async def async_iter_models(
+    items: AsyncIterable[Mapping[str, Any]], model: Type[M], lazy: bool = True
+) -> AsyncIterator[M]:
+    """Wrap records from an async iterator such as ``AsyncEvents.list_all`` in models."""
+    async for item in items:
+        yield model(item, lazy)
@@ -0,0 +1,502 @@
+"""Durable local outbox for at-least-once message sending."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+
+from relaywarden.attachments import has_attachments, serializer_for
+from relaywarden.bulk import BulkResult, async_bounded_map, bounded_map
+from relaywarden.exceptions import APIError, RateLimitError
+from relaywarden.serialization import Serializer
+
+if TYPE_CHECKING:
+    from relaywarden.async_client import AsyncClient
+    from relaywarden.client import Client
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    idempotency_key TEXT NOT NULL UNIQUE,
+    payload BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    failed INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (failed, next_attempt_at);
+"""
+
+# Status codes of errors that may succeed later, besides 5xx; other API errors
+# are permanent
+_RETRYABLE_STATUSES = frozenset({0, 408, 425, 429})
+
+# A conflict on an idempotent send: the API already accepted a message with the
+# same idempotency key, e.g. from an attempt whose response was lost
+_ALREADY_SENT_STATUS = 409
+
+# (row id, idempotency key, payload, attempts)
+_Row = Tuple[int, str, bytes, int]
+
+
+def _already_sent(error: Optional[BaseException]) -> bool:
+    return isinstance(error, APIError) and error.code == _ALREADY_SENT_STATUS
+
+
+def _is_retryable(error: BaseException) -> bool:
+    if isinstance(error, APIError):
+        return error.code in _RETRYABLE_STATUSES or error.code >= 500
+    return not isinstance(error, (TypeError, ValueError))
+
+
+class _BaseOutbox:
+    def __init__(
+        self,
+        client: Any,
+        path: str,
+        concurrency: int = 4,
+        batch_size: int = 100,
+        min_backoff: float = 1.0,
+        max_backoff: float = 300.0,
+        max_attempts: Optional[int] = None,
+        poll_interval: float = 5.0,
+        synchronous: str = "NORMAL",
+        on_sent: Optional[Callable[[str, Dict[str, Any]], Any]] = None,
+        on_failed: Optional[Callable[[str, BaseException], Any]] = None,
+    ):
+        """
+        Args:
+            client: Client the messages are sent with
+            path: SQLite database file; created if missing
+            concurrency: Maximum number of sends in flight
+            batch_size: Messages taken from the store per flush
+            min_backoff: Seconds before the first retry of a failed send; doubles
+                per attempt, with jitter
+            max_backoff: Upper bound of the retry delay
+            max_attempts: Attempts after which a message is given up on and kept
+                as failed (default: retry transient errors forever)
+            poll_interval: Longest time the flusher sleeps between checks of the
+                store
+            synchronous: SQLite ``synchronous`` mode; ``"NORMAL"`` survives process
+                crashes, ``"FULL"`` also survives power loss
+            on_sent: Called with the idempotency key and response of each sent message
+            on_failed: Called with the idempotency key and error of each message
+                given up on
+        """
+        if synchronous.upper() not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise ValueError(f"Unsupported synchronous mode: {synchronous}")
+        self.client = client
+        self.path = path
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.on_sent = on_sent
+        self.on_failed = on_failed
+        self.serializer = serializer_for(client) or Serializer()
+        self._lock = threading.RLock()
+        self._in_flight: Set[int] = set()
+        self._closed = False
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(f"PRAGMA synchronous={synchronous.upper()}")
+        self._db.executescript(_SCHEMA)
+        # Flusher state: a thread and condition for Outbox, a task and events for
+        # AsyncOutbox
+        self._thread: Optional[threading.Thread] = None
+        self._condition = threading.Condition(self._lock)
+        self._wake = False
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._event: Optional[asyncio.Event] = None
+        self._progress: Optional[asyncio.Event] = None
+
+    def _enqueue(self, data: Any, idempotency_key: Optional[str]) -> str:
+        """Record a message; enqueueing the same key again is a no-op."""
+        if has_attachments(data):
+            raise ValueError("Attachment objects cannot be stored in the outbox; inline them")
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            payload = bytes(data)
+        elif isinstance(data, dict):
+            payload = self.serializer.dumps(data)
+        else:
+            raise TypeError("Outbox messages must be dicts or serialised JSON bytes")
+        key = idempotency_key or str(uuid.uuid4())
+        now = time.time()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Outbox is closed")
+            self._db.execute(
+                "INSERT OR IGNORE INTO outbox (idempotency_key, payload, created_at,"
+                " next_attempt_at) VALUES (?, ?, ?, ?)",
+                (key, payload, now, now),
+            )
+        return key
+
+    def _claim(self, now: float) -> List[_Row]:
+        """Take up to ``batch_size`` due messages that are not being sent already."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, idempotency_key, payload, attempts FROM outbox"
+                " WHERE failed = 0 AND next_attempt_at <= ? ORDER BY id LIMIT ?",
+                (now, self.batch_size + len(self._in_flight)),
+            ).fetchall()
+            claimed = [row for row in rows if row[0] not in self._in_flight][: self.batch_size]
+            self._in_flight.update(row[0] for row in claimed)
+        return claimed
+
+    def _backoff(self, attempts: int, error: BaseException) -> float:
+        delay = min(self.max_backoff, self.min_backoff * 2 ** (attempts - 1))
+        delay *= random.uniform(0.5, 1.0)
+        if isinstance(error, RateLimitError):
+            delay = max(delay, error.retry_after)
+        return delay
+
+    def _complete(self, results: List[BulkResult]) -> List[BulkResult]:
+        """
+        Record the outcome of a flush and run the callbacks.
+
+        Returns:
+            The results, with ``item`` and ``idempotency_key`` set to the message's key
+        """
+        given_up = self._record(results)
+        self._notify(results, given_up)
+        return results
+
+    def _record(self, results: List[BulkResult]) -> List[BulkResult]:
+        """
+        Record the outcome of a flush in one transaction.
+
+        Returns:
+            The results of the messages given up on
+        """
+        now = time.time()
+        given_up = []
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                for result in results:
+                    row_id, key, _, attempts = result.item
+                    if _already_sent(result.error):
+                        result.response, result.error = {}, None
+                    if result.ok:
+                        self._db.execute("DELETE FROM outbox WHERE id = ?", (row_id,))
+                        continue
+                    attempts += 1
+                    retry = _is_retryable(result.error) and (
+                        self.max_attempts is None or attempts < self.max_attempts
+                    )
+                    self._db.execute(
+                        "UPDATE outbox SET attempts = ?, next_attempt_at = ?, last_error = ?,"
+                        " failed = ? WHERE id = ?",
+                        (
+                            attempts,
+                            now + self._backoff(attempts, result.error),
+                            str(result.error),
+                            0 if retry else 1,
+                            row_id,
+                        ),
+                    )
+                    if not retry:
+                        given_up.append(result)
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            finally:
+                self._in_flight.difference_update(result.item[0] for result in results)
+        return given_up
+
+    def _notify(self, results: List[BulkResult], given_up: List[BulkResult]) -> None:
+        """Set each result's ``item`` to its idempotency key and run the callbacks."""
+        for result in results:
+            result.item = result.idempotency_key = result.item[1]
+            if result.ok and self.on_sent is not None:
+                self.on_sent(result.item, result.response)
+        if self.on_failed is not None:
+            for result in given_up:
+                self.on_failed(result.item, result.error)
+
+    def _wait_time(self) -> float:
+        """Seconds until the next message is due, at most ``poll_interval``."""
+        with self._lock:
+            (due,) = self._db.execute(
+                "SELECT MIN(next_attempt_at) FROM outbox WHERE failed = 0"
+            ).fetchone()
+        if due is None:
+            return self.poll_interval
+        return min(self.poll_interval, max(0.0, due - time.time()))
+
+    def pending(self) -> int:
+        """Number of messages waiting to be sent, including those being retried."""
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM outbox WHERE failed = 0").fetchone()[0]
+
+    def failed(self) -> List[Dict[str, Any]]:
+        """Messages given up on, oldest first, with their last error."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT idempotency_key, payload, attempts, last_error, created_at FROM outbox"
+                " WHERE failed = 1 ORDER BY id"
+            ).fetchall()
+        return [
+            {
+                "idempotency_key": key,
+                "message": self.serializer.loads(payload),
+                "attempts": attempts,
+                "error": error,
+                "created_at": created_at,
+            }
+            for key, payload, attempts, error, created_at in rows
+        ]
+
+    def retry_failed(self, idempotency_keys: Optional[List[str]] = None) -> int:
+        """
+        Queue failed messages (all, or those with the given keys) for sending again.
+
+        Returns:
+            Number of messages re-queued
+        """
+        now = time.time()
+        with self._lock:
+            if idempotency_keys is None:
+                cursor = self._db.execute(
+                    "UPDATE outbox SET failed = 0, attempts = 0, next_attempt_at = ?"
+                    " WHERE failed = 1",
+                    (now,),
+                )
+            else:
+                cursor = self._db.executemany(
+                    "UPDATE outbox SET failed = 0, attempts = 0, next_attempt_at = ?"
+                    " WHERE failed = 1 AND idempotency_key = ?",
+                    [(now, key) for key in idempotency_keys],
+                )
+        return cursor.rowcount
+
+
+class Outbox(_BaseOutbox):
+    """
+    Durable local queue in front of ``Messages.send``.
+
+    ``send()`` records the message with its idempotency key in a SQLite database
+    (in WAL mode) and returns at once; a background thread sends queued messages
+    with up to ``concurrency`` requests in flight, ``batch_size`` at a time.
+    Transient failures (network errors, 408, 429, 5xx) are retried with
+    exponential backoff; other errors mark the message as failed, see
+    ``failed()`` and ``retry_failed()``. A 409 Conflict means the API already
+    accepted a message with that idempotency key, so it counts as sent (with an
+    empty response).
+
+    Messages are only removed from the store once the API accepted them, so
+    after a crash or restart everything not yet confirmed is sent again. The
+    idempotency key makes those repeats safe.
+    """
+
+    client: Client
+
+    def __enter__(self) -> "Outbox":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """
+        Start the background flusher, if not running yet.
+
+        It also resumes sending messages left in the store by a previous run;
+        ``send()`` and ``drain()`` start it as well.
+        """
+        with self._lock:
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(
+                    target=self._run, name="relaywarden-outbox", daemon=True
+                )
+                self._thread.start()
+
+    def send(self, data: Any, idempotency_key: Optional[str] = None) -> str:
+        """
+        Queue a message for sending.
+
+        Args:
+            data: Message payload, or its serialised JSON bytes
+            idempotency_key: Idempotency key (default: a random UUID); queueing
+                a key that is still in the outbox does nothing
+
+        Returns:
+            The message's idempotency key
+        """
+        key = self._enqueue(data, idempotency_key)
+        self.start()
+        with self._lock:
+            self._wake = True
+            self._condition.notify_all()
+        return key
+
+    def flush(self) -> List[BulkResult]:
+        """
+        Send one batch of due messages now, in the calling thread.
+
+        Returns:
+            BulkResult per message attempted, keyed by idempotency key
+        """
+        rows = self._claim(time.time())
+        if not rows:
+            return []
+        send = self.client.messages.send
+        results = list(bounded_map(lambda row: send(row[2], row[1]), rows, self.concurrency))
+        return self._complete(results)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued message was sent or given up on.
+
+        Returns:
+            False if ``timeout`` seconds passed first
+        """
+        self.start()
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._condition:
+            while self.pending():
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop the flusher after its current batch; unsent messages stay stored."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        with self._lock:
+            self._db.close()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if self._closed:
+                    return
+                self._wake = False
+            try:
+                results = self.flush()
+            except Exception:
+                # Database or callback errors; the messages stay stored and are retried
+                results = []
+            with self._lock:
+                self._condition.notify_all()
+                if self._closed:
+                    return
+                if results or self._wake:
+                    continue
+                self._condition.wait(self._wait_time())
+
+
+class AsyncOutbox(_BaseOutbox):
+    """
+    Asyncio counterpart of :class:`Outbox`.
+
+    The flusher runs as a task on the event loop of the first ``start()``,
+    ``send()`` or ``async with``. Database access runs in worker threads; the
+    ``on_sent`` and ``on_failed`` callbacks run on the event loop.
+    """
+
+    client: AsyncClient
+
+    async def __aenter__(self) -> "AsyncOutbox":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def start(self) -> None:
+        """Start the flusher task on the running event loop, if not running yet."""
+        if self._task is None and not self._closed:
+            self._event = asyncio.Event()
+            self._progress = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def send(self, data: Any, idempotency_key: Optional[str] = None) -> str:
+        """Queue a message for sending; see ``Outbox.send``."""
+        key = await asyncio.to_thread(self._enqueue, data, idempotency_key)
+        self.start()
+        self._event.set()
+        return key
+
+    async def flush(self) -> List[BulkResult]:
+        """Send one batch of due messages now; see ``Outbox.flush``."""
+        rows = await asyncio.to_thread(self._claim, time.time())
+        if not rows:
+            return []
+        send = self.client.messages.send
+        results = [
+            result
+            async for result in async_bounded_map(
+                lambda row: send(row[2], row[1]), rows, self.concurrency
+            )
+        ]
+        # The database is updated in a worker thread, the callbacks run on the loop
+        given_up = await asyncio.to_thread(self._record, results)
+        self._notify(results, given_up)
+        return results
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued message was sent or given up on; see ``Outbox.drain``."""
+        self.start()
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while await asyncio.to_thread(self.pending):
+            remaining = deadline - time.monotonic() if deadline is not None else None
+            if remaining is not None and remaining <= 0:
+                return False
+            self._progress.clear()
+            try:
+                await asyncio.wait_for(self._progress.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+        return True
+
+    async def aclose(self) -> None:
+        """Stop the flusher; unsent messages stay stored."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        with self._lock:
+            self._db.close()
+
+    async def _run(self) -> None:
+        event = self._event
+        while not self._closed:
+            event.clear()
+            try:
+                results = await self.flush()
+            except Exception:
+                # Database or callback errors; the messages stay stored and are retried
+                results = []
+            self._progress.set()
+            if results or event.is_set():
+                continue
+            wait = await asyncio.to_thread(self._wait_time)
+            try:
+                await asyncio.wait_for(event.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
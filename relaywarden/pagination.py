@@ -0,0 +1,131 @@
+"""Lazy iteration over paginated list endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, Optional
+
+if TYPE_CHECKING:
+    from relaywarden.async_client import AsyncClient
+    from relaywarden.client import Client
+
+
+def _page_params(
+    filters: Optional[Dict[str, Any]], per_page: Optional[int], page: int
+) -> Dict[str, Any]:
+    params = dict(filters or {})
+    if per_page is not None:
+        params["per_page"] = per_page
+    params["page"] = page
+    return params
+
+
+def _has_next_page(response: Dict[str, Any]) -> bool:
+    """Check the pagination ``meta`` of a list response for a following page."""
+    if not response.get("data"):
+        return False
+    meta = response.get("meta") or {}
+    current_page = meta.get("current_page")
+    last_page = meta.get("last_page")
+    if current_page is None or last_page is None:
+        return False
+    return current_page < last_page
+
+
+def iter_pages(
+    client: Client,
+    path: str,
+    filters: Optional[Dict[str, Any]] = None,
+    per_page: Optional[int] = None,
+    prefetch: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over every page of a list endpoint, requesting pages lazily.
+
+    Args:
+        client: Client used for the requests
+        path: API path of the list endpoint
+        filters: Optional query parameters sent with every page
+        per_page: Optional page size
+        prefetch: Fetch the next page in the background while the current one
+            is being consumed
+
+    Returns:
+        Iterator of page envelopes (``data`` and ``meta``)
+    """
+    page = int((filters or {}).get("page", 1))
+    if not prefetch:
+        while True:
+            response = client.get(path, _page_params(filters, per_page, page)) or {}
+            yield response
+            if not _has_next_page(response):
+                return
+            page += 1
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="relaywarden-prefetch") as executor:
+        future = executor.submit(client.get, path, _page_params(filters, per_page, page))
+        while future is not None:
+            response = future.result() or {}
+            future = None
+            if _has_next_page(response):
+                page += 1
+                future = executor.submit(client.get, path, _page_params(filters, per_page, page))
+            yield response
+
+
+def iter_items(
+    client: Client,
+    path: str,
+    filters: Optional[Dict[str, Any]] = None,
+    per_page: Optional[int] = None,
+    prefetch: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """Iterate over every item of a list endpoint, one page in memory at a time."""
+    for response in iter_pages(client, path, filters, per_page, prefetch):
+        yield from response.get("data") or []
+
+
+async def async_iter_pages(
+    client: AsyncClient,
+    path: str,
+    filters: Optional[Dict[str, Any]] = None,
+    per_page: Optional[int] = None,
+    prefetch: bool = False,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Asyncio counterpart of :func:`iter_pages`; prefetching uses a task."""
+    page = int((filters or {}).get("page", 1))
+    task: Optional[asyncio.Task[Any]] = None
+    try:
+        response = await client.get(path, _page_params(filters, per_page, page)) or {}
+        while True:
+            has_next = _has_next_page(response)
+            if has_next and prefetch:
+                task = asyncio.ensure_future(
+                    client.get(path, _page_params(filters, per_page, page + 1))
+                )
+            yield response
+            if not has_next:
+                return
+            page += 1
+            if task is not None:
+                response = await task or {}
+                task = None
+            else:
+                response = await client.get(path, _page_params(filters, per_page, page)) or {}
+    finally:
+        if task is not None:
+            task.cancel()
+
+
+async def async_iter_items(
+    client: AsyncClient,
+    path: str,
+    filters: Optional[Dict[str, Any]] = None,
+    per_page: Optional[int] = None,
+    prefetch: bool = False,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Asyncio counterpart of :func:`iter_items`."""
+    async for response in async_iter_pages(client, path, filters, per_page, prefetch):
+        for item in response.get("data") or []:
+            yield item
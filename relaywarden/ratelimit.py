@@ -0,0 +1,134 @@
+"""Client-side pacing driven by the server's rate-limit headers."""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+LIMIT_HEADERS = ("X-RateLimit-Limit", "RateLimit-Limit")
+REMAINING_HEADERS = ("X-RateLimit-Remaining", "RateLimit-Remaining")
+RESET_HEADERS = ("X-RateLimit-Reset", "RateLimit-Reset")
+
+# Reset values above this are absolute epoch timestamps rather than delta seconds
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def _header_number(headers: Mapping[str, str], names: Any) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+class RateLimiter:
+    """
+    Adaptive limiter that spreads requests evenly over the current quota window.
+
+    The limiter learns the limit, remaining quota and reset time from every response
+    and delays outgoing requests so that the remaining quota lasts until the window
+    resets, rather than bursting into 429s. A single instance is thread-safe and can
+    be shared by several ``Client`` and ``AsyncClient`` instances using the same token.
+    """
+
+    def __init__(self, reserve: int = 1, max_delay: float = 60.0):
+        """
+        Args:
+            reserve: Requests per window held back as headroom for other processes
+            max_delay: Upper bound in seconds for a single pacing delay
+        """
+        self.reserve = reserve
+        self.max_delay = max_delay
+        self.limit: Optional[float] = None
+        self.remaining: Optional[float] = None
+        self._reset_at: Optional[float] = None
+        self._next_slot = 0.0
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Update the quota state from response headers."""
+        remaining = _header_number(headers, REMAINING_HEADERS)
+        if remaining is None:
+            return
+        limit = _header_number(headers, LIMIT_HEADERS)
+        reset = _header_number(headers, RESET_HEADERS)
+        self._set_state(limit, remaining, reset)
+
+    def update_from_limits(self, limits: Dict[str, Any]) -> None:
+        """
+        Update the quota state from a ``Usage.get_limits()`` response.
+
+        Looks for ``limit``/``remaining``/``reset`` keys in ``data.rate_limit`` or
+        directly in ``data``.
+        """
+        data = limits.get("data") or {}
+        state = data.get("rate_limit") or data
+        if not isinstance(state, dict) or state.get("remaining") is None:
+            return
+        try:
+            remaining = float(state["remaining"])
+            limit = float(state["limit"]) if state.get("limit") is not None else None
+            reset = float(state["reset"]) if state.get("reset") is not None else None
+        except (TypeError, ValueError):
+            return
+        self._set_state(limit, remaining, reset)
+
+    def _set_state(self, limit: Optional[float], remaining: float, reset: Optional[float]) -> None:
+        now = time.monotonic()
+        reset_at = None
+        if reset is not None:
+            if reset > _EPOCH_THRESHOLD:
+                reset = reset - time.time()
+            reset_at = now + max(0.0, reset)
+        with self._lock:
+            if limit is not None:
+                self.limit = limit
+            self.remaining = remaining
+            self._reset_at = reset_at
+
+    def block_for(self, seconds: float) -> None:
+        """Hold back all requests for ``seconds``, e.g. after a 429."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def reserve_delay(self) -> float:
+        """Claim a slot for one request and return how long to wait before sending it."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._blocked_until)
+
+            if self.remaining is None or self._reset_at is None:
+                return min(start - now, self.max_delay)
+
+            if now >= self._reset_at:
+                # The window has rolled over; assume a full quota until told otherwise
+                self.remaining = self.limit
+                self._reset_at = None
+                return min(start - now, self.max_delay)
+
+            budget = (self.remaining or 0) - self.reserve
+            if budget < 1:
+                return min(max(start, self._reset_at) - now, self.max_delay)
+
+            slot = max(start, self._next_slot)
+            interval = max(0.0, self._reset_at - slot) / budget
+            self._next_slot = slot + interval
+            self.remaining -= 1
+            return min(slot - now, self.max_delay)
+
+    def acquire(self) -> None:
+        """Block the calling thread until the next request may be sent."""
+        delay = self.reserve_delay()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until the next request may be sent."""
+        delay = self.reserve_delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
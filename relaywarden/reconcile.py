@@ -0,0 +1,383 @@
+"""Recovery of webhook deliveries that failed while a receiver was unavailable."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
+
+from relaywarden.bulk import BulkResult, async_bounded_map, bounded_map
+from relaywarden.checkpoint import CheckpointStore, MemoryCheckpointStore
+
+if TYPE_CHECKING:
+    from relaywarden.async_client import AsyncClient
+    from relaywarden.client import Client
+
+SUCCEEDED_STATUSES = frozenset({"succeeded", "delivered", "success"})
+FAILED_STATUSES = frozenset({"failed", "error", "exhausted"})
+
+CHECKPOINT_KEY = "webhook-reconciler"
+
+
+class _Pacer:
+    """Spread calls evenly at no more than ``rate`` per second across threads."""
+
+    def __init__(self, rate: Optional[float]):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def reserve_delay(self) -> float:
+        if not self.interval:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+            return slot - now
+
+    def acquire(self) -> None:
+        delay = self.reserve_delay()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        delay = self.reserve_delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class ReconcileReport:
+    """Outcome of one reconciliation run."""
+
+    __slots__ = ("endpoints", "scanned", "missed", "replayed", "failed", "scan_errors", "elapsed")
+
+    def __init__(self) -> None:
+        self.endpoints = 0
+        self.scanned = 0
+        self.missed: List[Dict[str, Any]] = []
+        self.replayed: List[Dict[str, Any]] = []
+        self.failed: List[BulkResult] = []
+        self.scan_errors: Dict[str, BaseException] = {}
+        self.elapsed = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether every endpoint was scanned and every missed delivery replayed."""
+        return not self.failed and not self.scan_errors
+
+    def __repr__(self) -> str:
+        return (
+            f"ReconcileReport(endpoints={self.endpoints}, scanned={self.scanned}, "
+            f"missed={len(self.missed)}, replayed={len(self.replayed)}, "
+            f"failed={len(self.failed)}, scan_errors={len(self.scan_errors)})"
+        )
+
+
+def _plan(deliveries: List[Dict[str, Any]], replayed: Dict[str, str]) -> List[Dict[str, Any]]:
+    """
+    Pick the deliveries to replay from one endpoint's scanned deliveries.
+
+    An event is missed when none of its deliveries succeeded and none is still
+    being attempted; its latest failed delivery is replayed unless an earlier run
+    already replayed it.
+    """
+    by_event: Dict[str, List[Dict[str, Any]]] = {}
+    for delivery in deliveries:
+        by_event.setdefault(delivery.get("event_id") or delivery["id"], []).append(delivery)
+
+    missed = []
+    for attempts in by_event.values():
+        statuses = {attempt.get("status") for attempt in attempts}
+        if statuses & SUCCEEDED_STATUSES or not statuses <= FAILED_STATUSES:
+            continue
+        latest = max(attempts, key=lambda attempt: attempt.get("created_at") or "")
+        if latest["id"] not in replayed:
+            missed.append(latest)
+    return missed
+
+
+def _inclusive_bound(cursor: str) -> str:
+    """
+    A timestamp a second before ``cursor``, so a strict ``created_after`` filter
+    also returns deliveries created at the cursor itself.
+    """
+    try:
+        moment = datetime.datetime.fromisoformat(cursor.replace("Z", "+00:00"))
+    except ValueError:
+        return cursor
+    earlier = moment - datetime.timedelta(seconds=1)
+    if cursor.endswith("Z"):
+        return earlier.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return earlier.isoformat()
+
+
+def _unseen(state: Dict[str, Any], deliveries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop scanned deliveries the cursor has already moved past."""
+    cursor = state.get("cursor")
+    if cursor is None:
+        return deliveries
+    boundary_ids = set(state.get("ids", ()))
+    return [
+        d
+        for d in deliveries
+        if (d.get("created_at") or "") > cursor
+        or (d.get("created_at") == cursor and d["id"] not in boundary_ids)
+    ]
+
+
+def _advance(
+    state: Dict[str, Any],
+    deliveries: List[Dict[str, Any]],
+    unsettled: Iterable[Dict[str, Any]],
+    replayed: Iterable[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Move an endpoint's cursor past everything that needs no further attention.
+
+    The cursor stops before the oldest delivery that is still in flight or whose
+    replay failed, so the next run scans it again.
+    """
+    blocked = [
+        d.get("created_at") or ""
+        for d in deliveries
+        if d.get("status") not in SUCCEEDED_STATUSES | FAILED_STATUSES
+    ]
+    blocked.extend(d.get("created_at") or "" for d in unsettled)
+    horizon = min(blocked) if blocked else None
+    settled = [
+        d["created_at"]
+        for d in deliveries
+        if d.get("created_at") and (horizon is None or d["created_at"] < horizon)
+    ]
+
+    cursor = state.get("cursor")
+    boundary_ids = set(state.get("ids", ()))
+    if settled and (cursor is None or max(settled) > cursor):
+        cursor = max(settled)
+        boundary_ids = set()
+    # The next scan includes the cursor's timestamp, so remember which deliveries
+    # at that timestamp are settled; later ones created at the same time are not
+    boundary_ids.update(
+        d["id"]
+        for d in deliveries
+        if d.get("created_at") == cursor and (horizon is None or d["created_at"] < horizon)
+    )
+    done = {**state.get("replayed", {}), **{d["id"]: d.get("created_at") or "" for d in replayed}}
+    # Replays older than the cursor are never scanned again, so forget them
+    done = {
+        key: created_at
+        for key, created_at in done.items()
+        if cursor is None or created_at >= cursor
+    }
+    return {"cursor": cursor, "ids": sorted(boundary_ids), "replayed": done}
+
+
+class _BaseReconciler:
+    def __init__(
+        self,
+        client: Union[Client, AsyncClient],
+        checkpoint: Optional[CheckpointStore] = None,
+        since: Optional[str] = None,
+        scan_concurrency: int = 8,
+        replay_concurrency: int = 4,
+        max_replays_per_second: Optional[float] = None,
+        since_filter: str = "created_after",
+        per_page: Optional[int] = None,
+        checkpoint_key: str = CHECKPOINT_KEY,
+    ):
+        """
+        Args:
+            client: Client used for the scans and replays
+            checkpoint: Where cursors are kept between runs (default: in memory;
+                use ``FileCheckpointStore`` to persist them)
+            since: Timestamp to start from for endpoints without a checkpoint
+                (default: all retained deliveries)
+            scan_concurrency: Maximum number of endpoints scanned at once
+            replay_concurrency: Maximum number of replays in flight
+            max_replays_per_second: Optional cap on the replay rate
+            since_filter: Query parameter selecting deliveries created after a timestamp
+            per_page: Page size of the delivery scans
+            checkpoint_key: Key of the checkpoint in the store
+        """
+        self.client = client
+        self.checkpoint = checkpoint if checkpoint is not None else MemoryCheckpointStore()
+        self.since = since
+        self.scan_concurrency = scan_concurrency
+        self.replay_concurrency = replay_concurrency
+        self.since_filter = since_filter
+        self.per_page = per_page
+        self.checkpoint_key = checkpoint_key
+        self._pacer = _Pacer(max_replays_per_second)
+
+    def _load_states(self) -> Dict[str, Dict[str, Any]]:
+        saved = self.checkpoint.load(self.checkpoint_key) or {}
+        return saved.get("endpoints", {})
+
+    def _filters(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        cursor = state.get("cursor")
+        if cursor:
+            # Rescan the cursor's timestamp; deliveries already settled there are
+            # dropped by _unseen
+            return {self.since_filter: _inclusive_bound(cursor)}
+        return {self.since_filter: self.since} if self.since else {}
+
+    def _finish(
+        self,
+        report: ReconcileReport,
+        states: Dict[str, Dict[str, Any]],
+        scans: Dict[str, List[Dict[str, Any]]],
+        dry_run: bool,
+        started: float,
+    ) -> ReconcileReport:
+        report.elapsed = time.monotonic() - started
+        if dry_run:
+            return report
+        failed_by_endpoint: Dict[str, List[Dict[str, Any]]] = {}
+        for result in report.failed:
+            failed_by_endpoint.setdefault(result.item["_endpoint_id"], []).append(result.item)
+        replayed_by_endpoint: Dict[str, List[Dict[str, Any]]] = {}
+        for delivery in report.replayed:
+            replayed_by_endpoint.setdefault(delivery["_endpoint_id"], []).append(delivery)
+        for endpoint_id, deliveries in scans.items():
+            states[endpoint_id] = _advance(
+                states.get(endpoint_id, {}),
+                deliveries,
+                failed_by_endpoint.get(endpoint_id, []),
+                replayed_by_endpoint.get(endpoint_id, []),
+            )
+        self.checkpoint.save(self.checkpoint_key, {"endpoints": states})
+        return report
+
+    @staticmethod
+    def _collect_scan(
+        report: ReconcileReport,
+        states: Dict[str, Dict[str, Any]],
+        scans: Dict[str, List[Dict[str, Any]]],
+        result: BulkResult,
+    ) -> None:
+        endpoint_id = result.item
+        if not result.ok:
+            report.scan_errors[endpoint_id] = result.error
+            return
+        deliveries = _unseen(states.get(endpoint_id, {}), result.response)
+        scans[endpoint_id] = deliveries
+        report.scanned += len(deliveries)
+        replayed = states.get(endpoint_id, {}).get("replayed", {})
+        for delivery in _plan(deliveries, replayed):
+            report.missed.append({**delivery, "_endpoint_id": endpoint_id})
+
+    @staticmethod
+    def _collect_replay(report: ReconcileReport, result: BulkResult) -> None:
+        if result.ok:
+            report.replayed.append(result.item)
+        else:
+            report.failed.append(result)
+
+
+class WebhookReconciler(_BaseReconciler):
+    """
+    Find webhook deliveries that never succeeded and replay them.
+
+    Each run scans the deliveries of all endpoints concurrently, starting at a
+    per-endpoint checkpoint, and replays the latest failed delivery of every
+    event that has no successful delivery. Replays run in parallel, paced by
+    ``max_replays_per_second`` and by the client's ``RateLimiter`` if it has one.
+
+    The checkpoint only moves past deliveries that are settled, so deliveries
+    still being retried by RelayWarden, and replays that failed, are looked at
+    again by the next run. Reruns are therefore incremental and safe to schedule
+    (e.g. every few minutes, or once after an outage).
+    """
+
+    client: Client
+
+    def _scan(self, endpoint_id: str, states: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        filters = self._filters(states.get(endpoint_id, {}))
+        return list(
+            self.client.webhooks.iter_deliveries(endpoint_id, filters, self.per_page, prefetch=True)
+        )
+
+    def _replay(self, delivery: Dict[str, Any]) -> Dict[str, Any]:
+        self._pacer.acquire()
+        return self.client.webhooks.replay_delivery(delivery["id"])
+
+    def find_missed(self) -> ReconcileReport:
+        """Scan for missed deliveries without replaying them or moving the checkpoint."""
+        return self.run(dry_run=True)
+
+    def run(self, dry_run: bool = False) -> ReconcileReport:
+        """
+        Scan all endpoints and replay the missed deliveries.
+
+        Args:
+            dry_run: Only report what would be replayed
+
+        Returns:
+            ReconcileReport; ``missed`` lists the deliveries found, each with an
+            added ``_endpoint_id`` key
+        """
+        started = time.monotonic()
+        report = ReconcileReport()
+        states = self._load_states()
+        endpoint_ids = [endpoint["id"] for endpoint in self.client.webhooks.iter_endpoints()]
+        report.endpoints = len(endpoint_ids)
+
+        scans: Dict[str, List[Dict[str, Any]]] = {}
+        for result in bounded_map(
+            lambda endpoint_id: self._scan(endpoint_id, states), endpoint_ids, self.scan_concurrency
+        ):
+            self._collect_scan(report, states, scans, result)
+
+        if not dry_run:
+            for result in bounded_map(self._replay, report.missed, self.replay_concurrency):
+                self._collect_replay(report, result)
+        return self._finish(report, states, scans, dry_run, started)
+
+
+class AsyncWebhookReconciler(_BaseReconciler):
+    """Asyncio counterpart of :class:`WebhookReconciler`."""
+
+    client: AsyncClient
+
+    async def _scan(
+        self, endpoint_id: str, states: Dict[str, Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        filters = self._filters(states.get(endpoint_id, {}))
+        return [
+            delivery
+            async for delivery in self.client.webhooks.iter_deliveries(
+                endpoint_id, filters, self.per_page, prefetch=True
+            )
+        ]
+
+    async def _replay(self, delivery: Dict[str, Any]) -> Dict[str, Any]:
+        await self._pacer.acquire_async()
+        return await self.client.webhooks.replay_delivery(delivery["id"])
+
+    async def find_missed(self) -> ReconcileReport:
+        """Scan for missed deliveries without replaying them or moving the checkpoint."""
+        return await self.run(dry_run=True)
+
+    async def run(self, dry_run: bool = False) -> ReconcileReport:
+        """Scan all endpoints and replay the missed deliveries; see ``WebhookReconciler.run``."""
+        started = time.monotonic()
+        report = ReconcileReport()
+        states = self._load_states()
+        endpoint_ids = [endpoint["id"] async for endpoint in self.client.webhooks.iter_endpoints()]
+        report.endpoints = len(endpoint_ids)
+
+        scans: Dict[str, List[Dict[str, Any]]] = {}
+        async for result in async_bounded_map(
+            lambda endpoint_id: self._scan(endpoint_id, states), endpoint_ids, self.scan_concurrency
+        ):
+            self._collect_scan(report, states, scans, result)
+
+        if not dry_run:
+            async for result in async_bounded_map(
+                self._replay, report.missed, self.replay_concurrency
+            ):
+                self._collect_replay(report, result)
+        return self._finish(report, states, scans, dry_run, started)
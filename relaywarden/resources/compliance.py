@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Dict
 
 if TYPE_CHECKING:
+    from relaywarden.async_client import AsyncClient
     from relaywarden.client import Client
 
 
@@ -25,3 +26,22 @@ class Compliance:
     def get_export_config(self) -> Dict[str, Any]:
         """Get available export formats and configuration."""
         return self.client.get("/compliance/exports/config") or {}
+
+
+class AsyncCompliance:
+    """Async Compliance resource for managing data retention and compliance settings."""
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def get_retention(self) -> Dict[str, Any]:
+        """Get data retention settings for the current team."""
+        return await self.client.get("/compliance/retention") or {}
+
+    async def update_retention(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Update data retention settings."""
+        return await self.client.patch("/compliance/retention", data) or {}
+
+    async def get_export_config(self) -> Dict[str, Any]:
+        """Get available export formats and configuration."""
+        return await self.client.get("/compliance/exports/config") or {}
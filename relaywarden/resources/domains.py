@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, Optional
+
+from relaywarden.pagination import async_iter_items, iter_items
 
 if TYPE_CHECKING:
+    from relaywarden.async_client import AsyncClient
     from relaywarden.client import Client
 
 
@@ -16,7 +19,16 @@ class Domains:
 
     def list(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """List all sending domains for the current project."""
-        return self.client.get("/domains") or {}
+        return self.client.get("/domains", filters) or {}
+
+    def list_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over every domain, fetching pages lazily."""
+        return iter_items(self.client, "/domains", filters, per_page, prefetch)
 
     def get(self, domain_id: str) -> Dict[str, Any]:
         """Get a specific domain by ID."""
@@ -53,3 +65,60 @@ class Domains:
     def enable_production(self, domain_id: str) -> Dict[str, Any]:
         """Enable a domain for production use."""
         return self.client.post(f"/domains/{domain_id}/enable-production") or {}
+
+
+class AsyncDomains:
+    """Async Domains resource for managing sending domains."""
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def list(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """List all sending domains for the current project."""
+        return await self.client.get("/domains", filters) or {}
+
+    async def list_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every domain, fetching pages lazily."""
+        async for item in async_iter_items(self.client, "/domains", filters, per_page, prefetch):
+            yield item
+
+    async def get(self, domain_id: str) -> Dict[str, Any]:
+        """Get a specific domain by ID."""
+        return await self.client.get(f"/domains/{domain_id}") or {}
+
+    async def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new sending domain."""
+        return await self.client.post("/domains", data) or {}
+
+    async def update(self, domain_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Update a domain."""
+        return await self.client.patch(f"/domains/{domain_id}", data) or {}
+
+    async def delete(self, domain_id: str) -> None:
+        """Delete a domain."""
+        await self.client.delete(f"/domains/{domain_id}")
+
+    async def get_dns_records(self, domain_id: str) -> Dict[str, Any]:
+        """Get DNS records required for domain verification."""
+        return await self.client.get(f"/domains/{domain_id}/dns-records") or {}
+
+    async def get_checks(self, domain_id: str) -> Dict[str, Any]:
+        """Get current status of domain verification checks."""
+        return await self.client.get(f"/domains/{domain_id}/checks") or {}
+
+    async def verify(self, domain_id: str) -> Dict[str, Any]:
+        """Initiate domain verification."""
+        return await self.client.post(f"/domains/{domain_id}/verify") or {}
+
+    async def rotate_dkim(self, domain_id: str) -> Dict[str, Any]:
+        """Rotate DKIM signing keys for a domain."""
+        return await self.client.post(f"/domains/{domain_id}/dkim/rotate") or {}
+
+    async def enable_production(self, domain_id: str) -> Dict[str, Any]:
+        """Enable a domain for production use."""
+        return await self.client.post(f"/domains/{domain_id}/enable-production") or {}
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from relaywarden.checkpoint import CheckpointStore
+from relaywarden.follow import AsyncFollower, Follower
+from relaywarden.pagination import async_iter_items, iter_items
 
 if TYPE_CHECKING:
+    from relaywarden.async_client import AsyncClient
     from relaywarden.client import Client
 
 
@@ -16,8 +21,128 @@ class Events:
 
     def list(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """List all events for the current team."""
-        return self.client.get("/events") or {}
+        return self.client.get("/events", filters) or {}
+
+    def list_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over every event, fetching pages lazily."""
+        return iter_items(self.client, "/events", filters, per_page, prefetch)
+
+    def follow(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        since: Optional[str] = None,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        per_page: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield new events as they are created, polling indefinitely.
+
+        Polls only ask for events newer than the last one seen, and the poll
+        interval adapts between ``min_interval`` and ``max_interval`` to traffic.
+        See ``relaywarden.follow.Follower``.
+
+        Args:
+            filters: Optional query parameters
+            checkpoint: Optional store persisting the position between runs
+            since: Timestamp to start after without a checkpoint (default: now)
+            min_interval: Seconds between polls while events keep arriving
+            max_interval: Maximum seconds between polls while idle
+            per_page: Page size of each poll
+        """
+        return iter(
+            Follower(
+                self.client,
+                "/events",
+                filters,
+                checkpoint,
+                since,
+                per_page,
+                min_interval,
+                max_interval,
+            )
+        )
+
+    def tail(
+        self,
+        checkpoint: CheckpointStore,
+        filters: Optional[Dict[str, Any]] = None,
+        since: Optional[str] = None,
+        per_page: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Fetch the events created since the previous call with the same checkpoint."""
+        follower = Follower(self.client, "/events", filters, checkpoint, since, per_page)
+        items = follower.poll()
+        follower.save()
+        return items
 
     def get(self, event_id: str) -> Dict[str, Any]:
         """Get a specific event by ID."""
         return self.client.get(f"/events/{event_id}") or {}
+
+
+class AsyncEvents:
+    """Async Events resource for viewing event history."""
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def list(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """List all events for the current team."""
+        return await self.client.get("/events", filters) or {}
+
+    async def list_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every event, fetching pages lazily."""
+        async for item in async_iter_items(self.client, "/events", filters, per_page, prefetch):
+            yield item
+
+    async def follow(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        since: Optional[str] = None,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        per_page: int = 100,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield new events as they are created, polling indefinitely."""
+        follower = AsyncFollower(
+            self.client,
+            "/events",
+            filters,
+            checkpoint,
+            since,
+            per_page,
+            min_interval,
+            max_interval,
+        )
+        async for item in follower:
+            yield item
+
+    async def tail(
+        self,
+        checkpoint: CheckpointStore,
+        filters: Optional[Dict[str, Any]] = None,
+        since: Optional[str] = None,
+        per_page: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Fetch the events created since the previous call with the same checkpoint."""
+        follower = AsyncFollower(self.client, "/events", filters, checkpoint, since, per_page)
+        items = await follower.poll()
+        follower.save()
+        return items
+
+    async def get(self, event_id: str) -> Dict[str, Any]:
+        """Get a specific event by ID."""
+        return await self.client.get(f"/events/{event_id}") or {}
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 if TYPE_CHECKING:
+    from relaywarden.async_client import AsyncClient
     from relaywarden.client import Client
 
 
@@ -31,3 +32,28 @@ class Identity:
             List of teams
         """
         return self.client.get("/teams") or {}
+
+
+class AsyncIdentity:
+    """Async Identity resource for user/team information."""
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def me(self) -> Dict[str, Any]:
+        """
+        Get information about the currently authenticated user or service account.
+
+        Returns:
+            User or service account information
+        """
+        return await self.client.get("/me") or {}
+
+    async def teams(self) -> Dict[str, Any]:
+        """
+        List all teams the authenticated user belongs to.
+
+        Returns:
+            List of teams
+        """
+        return await self.client.get("/teams") or {}
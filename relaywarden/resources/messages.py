@@ -2,26 +2,111 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+import asyncio
+import uuid
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from relaywarden.attachments import (
+    ATTACHMENTS_PATH,
+    Attachment,
+    has_attachments,
+    serializer_for,
+    stream_message,
+    upload_key,
+)
+from relaywarden.bulk import BulkResult, KeyedResults, async_bounded_map, bounded_map, chunked
+from relaywarden.exceptions import APIError
+from relaywarden.pagination import async_iter_items, iter_items
 
 if TYPE_CHECKING:
+    from relaywarden.async_client import AsyncClient
     from relaywarden.client import Client
 
 
+# Batch lookup endpoints, used when the API offers them
+BATCH_GET_PATH = "/messages/batch"
+BATCH_TIMELINE_PATH = "/messages/batch/timeline"
+
+# Statuses meaning the API has no batch endpoint, so lookups fan out instead
+_NO_BATCH_STATUSES = (404, 405, 501)
+
+# Statuses meaning the API has no attachment upload endpoint, so attachments are
+# sent inline instead
+_NO_UPLOAD_STATUSES = (404, 405, 501)
+
+
+def _random_key(message: Dict[str, Any]) -> str:
+    return str(uuid.uuid4())
+
+
+def _collect_batch(results: KeyedResults, ids: List[str], response: Dict[str, Any]) -> None:
+    """
+    Split a batch response into single-lookup shaped responses keyed by id.
+
+    ``data`` may be a list of objects carrying ``id``/``message_id`` or an object
+    keyed by id; ids missing from it are recorded as not found.
+    """
+    data = response.get("data") or {}
+    if isinstance(data, list):
+        data = {item.get("message_id") or item.get("id"): item for item in data}
+    for message_id in ids:
+        if message_id in data:
+            results[message_id] = {"data": data[message_id]}
+        else:
+            results.errors[message_id] = APIError("Message not found", 404, "not_found")
+
+
+def _uploaded_id(response: Optional[Dict[str, Any]]) -> str:
+    data = (response or {}).get("data") or {}
+    attachment_id = data.get("id") or data.get("attachment_id")
+    if not attachment_id:
+        raise APIError("Attachment upload response has no id", 0)
+    return attachment_id
+
+
+def _collect_single(results: KeyedResults, result: BulkResult) -> None:
+    if result.ok:
+        results[result.item] = result.response
+    else:
+        results.errors[result.item] = result.error
+
+
+def _collect_chunk(results: KeyedResults, result: BulkResult) -> None:
+    if result.ok:
+        _collect_batch(results, result.item, result.response)
+    else:
+        for message_id in result.item:
+            results.errors[message_id] = result.error
+
+
 class Messages:
     """Messages resource for sending and managing email messages."""
 
     def __init__(self, client: Client):
         self.client = client
+        self._batch_support: Dict[str, bool] = {}
+        self._upload_supported: Optional[bool] = None
 
-    def send(
-        self, data: Dict[str, Any], idempotency_key: Optional[str] = None
-    ) -> Dict[str, Any]:
+    def send(self, data: Dict[str, Any], idempotency_key: Optional[str] = None) -> Dict[str, Any]:
         """
         Send an email message.
 
         Args:
-            data: Message data
+            data: Message data, serialised JSON bytes or an ``EncodedBody``;
+                ``attachments`` may contain ``Attachment`` objects, which are
+                uploaded once or streamed rather than loaded into memory
             idempotency_key: Optional idempotency key
 
         Returns:
@@ -30,8 +115,78 @@ class Messages:
         headers = {}
         if idempotency_key:
             headers["Idempotency-Key"] = idempotency_key
+        if has_attachments(data):
+            data = self._attach(data)
         return self.client.post("/messages", data, headers) or {}
 
+    def upload_attachment(self, attachment: Attachment) -> Optional[str]:
+        """
+        Upload an attachment once, to be referenced by id from any message.
+
+        The id is cached on the attachment per project, so repeated calls (and
+        ``send``) do not upload it again.
+
+        Returns:
+            The attachment id, or None when the API does not support uploads
+        """
+        if self._upload_supported is False:
+            return None
+        key = upload_key(self.client)
+        with attachment._upload_lock:
+            attachment_id = attachment._uploads.get(key)
+            if attachment_id is not None:
+                return attachment_id
+            body = attachment.upload_body(serializer_for(self.client))
+            try:
+                response = self.client.post(ATTACHMENTS_PATH, body)
+            except APIError as e:
+                if e.code in _NO_UPLOAD_STATUSES:
+                    self._upload_supported = False
+                    return None
+                raise
+            self._upload_supported = True
+            attachment_id = attachment._uploads[key] = _uploaded_id(response)
+            return attachment_id
+
+    def _attach(self, data: Dict[str, Any]) -> Any:
+        """Replace uploadable attachments by references and stream the rest inline."""
+        attachments = []
+        for item in data["attachments"]:
+            if isinstance(item, Attachment) and item.upload:
+                attachment_id = self.upload_attachment(item)
+                if attachment_id is not None:
+                    item = item.reference(attachment_id)
+            attachments.append(item)
+        return stream_message({**data, "attachments": attachments}, serializer_for(self.client))
+
+    def send_many(
+        self,
+        messages: Iterable[Dict[str, Any]],
+        concurrency: int = 10,
+        idempotency_key: Optional[Callable[[Dict[str, Any]], str]] = None,
+    ) -> Iterator[BulkResult]:
+        """
+        Send many messages concurrently over the shared session.
+
+        The input is consumed lazily with at most ``concurrency`` sends in flight,
+        and results are yielded as they finish (not in input order). Every message
+        gets an idempotency key so that retries never produce duplicates.
+
+        Args:
+            messages: Iterable of message payloads
+            concurrency: Maximum number of concurrent sends (default: 10)
+            idempotency_key: Optional callable deriving a key from a payload;
+                a random UUID is used per message when omitted
+
+        Returns:
+            Iterator of BulkResult with ``response`` or ``error`` set per message
+        """
+        key_for = idempotency_key or _random_key
+        keyed = ((message, key_for(message)) for message in messages)
+        for result in bounded_map(lambda pair: self.send(*pair), keyed, concurrency):
+            result.item, result.idempotency_key = result.item
+            yield result
+
     def list(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         List all messages for the current project.
@@ -42,7 +197,16 @@ class Messages:
         Returns:
             List of messages
         """
-        return self.client.get("/messages") or {}
+        return self.client.get("/messages", filters) or {}
+
+    def list_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over every message, fetching pages lazily."""
+        return iter_items(self.client, "/messages", filters, per_page, prefetch)
 
     def get(self, message_id: str) -> Dict[str, Any]:
         """
@@ -68,6 +232,78 @@ class Messages:
         """
         return self.client.get(f"/messages/{message_id}/timeline") or {}
 
+    def get_many(
+        self, message_ids: Iterable[str], concurrency: int = 10, batch_size: int = 100
+    ) -> KeyedResults:
+        """
+        Get many messages at once.
+
+        Duplicate ids are fetched once. When the API offers a batch lookup
+        endpoint, ids are fetched ``batch_size`` at a time; otherwise one ``get``
+        per id runs with at most ``concurrency`` requests in flight. Which of the
+        two applies is detected on the first call.
+
+        Args:
+            message_ids: Message UUIDs
+            concurrency: Maximum number of requests in flight (default: 10)
+            batch_size: Ids per batch request (default: 100)
+
+        Returns:
+            KeyedResults mapping each id to its ``get`` response; failed ids are
+            listed with their exception in ``errors``
+        """
+        return self._lookup_many(message_ids, self.get, BATCH_GET_PATH, concurrency, batch_size)
+
+    def get_timelines(
+        self, message_ids: Iterable[str], concurrency: int = 10, batch_size: int = 100
+    ) -> KeyedResults:
+        """
+        Get the timelines of many messages at once.
+
+        Works like ``get_many``, mapping each id to its ``get_timeline`` response.
+        """
+        return self._lookup_many(
+            message_ids, self.get_timeline, BATCH_TIMELINE_PATH, concurrency, batch_size
+        )
+
+    def _lookup_many(
+        self,
+        message_ids: Iterable[str],
+        single: Callable[[str], Dict[str, Any]],
+        batch_path: str,
+        concurrency: int,
+        batch_size: int,
+    ) -> KeyedResults:
+        results = KeyedResults()
+        chunks = list(chunked(dict.fromkeys(message_ids), batch_size))
+        if chunks and self._batch_support.get(batch_path) is None:
+            # Probe with the first chunk; it is answered in full if the endpoint exists
+            try:
+                response = self._get_batch(batch_path, chunks[0])
+            except APIError as e:
+                # Without a batch endpoint every id, including the probed ones, is
+                # looked up singly; after a rejected or failed probe (e.g. 400, 422,
+                # 5xx) support stays undecided and only this call falls back
+                if e.code in _NO_BATCH_STATUSES:
+                    self._batch_support[batch_path] = False
+            else:
+                self._batch_support[batch_path] = True
+                _collect_batch(results, chunks.pop(0), response)
+
+        if self._batch_support.get(batch_path):
+            for result in bounded_map(
+                lambda chunk: self._get_batch(batch_path, chunk), chunks, concurrency
+            ):
+                _collect_chunk(results, result)
+        else:
+            remaining = [message_id for chunk in chunks for message_id in chunk]
+            for result in bounded_map(single, remaining, concurrency):
+                _collect_single(results, result)
+        return results
+
+    def _get_batch(self, path: str, message_ids: List[str]) -> Dict[str, Any]:
+        return self.client.get(path, {"ids": ",".join(message_ids)}) or {}
+
     def cancel(self, message_id: str) -> Dict[str, Any]:
         """
         Cancel a message that hasn't been sent yet.
@@ -91,3 +327,226 @@ class Messages:
             Resent message
         """
         return self.client.post(f"/messages/{message_id}/resend") or {}
+
+
+class AsyncMessages:
+    """Async Messages resource for sending and managing email messages."""
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+        self._batch_support: Dict[str, bool] = {}
+        self._upload_supported: Optional[bool] = None
+        self._uploading: Dict[Tuple[int, Tuple[str, Optional[str]]], "asyncio.Future[Any]"] = {}
+
+    async def send(
+        self, data: Dict[str, Any], idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Send an email message.
+
+        Args:
+            data: Message data, serialised JSON bytes or an ``EncodedBody``;
+                ``attachments`` may contain ``Attachment`` objects, which are
+                uploaded once or streamed rather than loaded into memory
+            idempotency_key: Optional idempotency key
+
+        Returns:
+            Message response
+        """
+        headers = {}
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+        if has_attachments(data):
+            data = await self._attach(data)
+        return await self.client.post("/messages", data, headers) or {}
+
+    async def upload_attachment(self, attachment: Attachment) -> Optional[str]:
+        """Upload an attachment once; see ``Messages.upload_attachment``."""
+        if self._upload_supported is False:
+            return None
+        key = upload_key(self.client)
+        attachment_id = attachment._uploads.get(key)
+        if attachment_id is not None:
+            return attachment_id
+        # Concurrent sends of the same attachment share one upload
+        pending_key = (id(attachment), key)
+        pending = self._uploading.get(pending_key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._upload(attachment, key))
+            self._uploading[pending_key] = pending
+            pending.add_done_callback(lambda _: self._uploading.pop(pending_key, None))
+        return await asyncio.shield(pending)
+
+    async def _upload(
+        self, attachment: Attachment, key: Tuple[str, Optional[str]]
+    ) -> Optional[str]:
+        body = attachment.upload_body(serializer_for(self.client))
+        try:
+            response = await self.client.post(ATTACHMENTS_PATH, body)
+        except APIError as e:
+            if e.code in _NO_UPLOAD_STATUSES:
+                self._upload_supported = False
+                return None
+            raise
+        self._upload_supported = True
+        attachment_id = attachment._uploads[key] = _uploaded_id(response)
+        return attachment_id
+
+    async def _attach(self, data: Dict[str, Any]) -> Any:
+        """Replace uploadable attachments by references and stream the rest inline."""
+        attachments = []
+        for item in data["attachments"]:
+            if isinstance(item, Attachment) and item.upload:
+                attachment_id = await self.upload_attachment(item)
+                if attachment_id is not None:
+                    item = item.reference(attachment_id)
+            attachments.append(item)
+        return stream_message({**data, "attachments": attachments}, serializer_for(self.client))
+
+    async def send_many(
+        self,
+        messages: Iterable[Dict[str, Any]],
+        concurrency: int = 10,
+        idempotency_key: Optional[Callable[[Dict[str, Any]], str]] = None,
+    ) -> AsyncIterator[BulkResult]:
+        """
+        Send many messages concurrently, yielding results as they finish.
+
+        Args:
+            messages: Iterable of message payloads
+            concurrency: Maximum number of concurrent sends (default: 10)
+            idempotency_key: Optional callable deriving a key from a payload;
+                a random UUID is used per message when omitted
+
+        Returns:
+            Async iterator of BulkResult with ``response`` or ``error`` set per message
+        """
+        key_for = idempotency_key or _random_key
+        keyed = ((message, key_for(message)) for message in messages)
+        async for result in async_bounded_map(lambda pair: self.send(*pair), keyed, concurrency):
+            result.item, result.idempotency_key = result.item
+            yield result
+
+    async def list(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        List all messages for the current project.
+
+        Args:
+            filters: Optional query parameters
+
+        Returns:
+            List of messages
+        """
+        return await self.client.get("/messages", filters) or {}
+
+    async def list_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every message, fetching pages lazily."""
+        async for item in async_iter_items(self.client, "/messages", filters, per_page, prefetch):
+            yield item
+
+    async def get(self, message_id: str) -> Dict[str, Any]:
+        """
+        Get a specific message by ID.
+
+        Args:
+            message_id: Message UUID
+
+        Returns:
+            Message information
+        """
+        return await self.client.get(f"/messages/{message_id}") or {}
+
+    async def get_timeline(self, message_id: str) -> Dict[str, Any]:
+        """
+        Get the complete timeline of events for a message.
+
+        Args:
+            message_id: Message UUID
+
+        Returns:
+            Message timeline
+        """
+        return await self.client.get(f"/messages/{message_id}/timeline") or {}
+
+    async def get_many(
+        self, message_ids: Iterable[str], concurrency: int = 10, batch_size: int = 100
+    ) -> KeyedResults:
+        """Get many messages at once; see ``Messages.get_many``."""
+        return await self._lookup_many(
+            message_ids, self.get, BATCH_GET_PATH, concurrency, batch_size
+        )
+
+    async def get_timelines(
+        self, message_ids: Iterable[str], concurrency: int = 10, batch_size: int = 100
+    ) -> KeyedResults:
+        """Get the timelines of many messages at once; see ``Messages.get_many``."""
+        return await self._lookup_many(
+            message_ids, self.get_timeline, BATCH_TIMELINE_PATH, concurrency, batch_size
+        )
+
+    async def _lookup_many(
+        self,
+        message_ids: Iterable[str],
+        single: Callable[[str], Awaitable[Dict[str, Any]]],
+        batch_path: str,
+        concurrency: int,
+        batch_size: int,
+    ) -> KeyedResults:
+        results = KeyedResults()
+        chunks = list(chunked(dict.fromkeys(message_ids), batch_size))
+        if chunks and self._batch_support.get(batch_path) is None:
+            # Probe with the first chunk; it is answered in full if the endpoint exists
+            try:
+                response = await self._get_batch(batch_path, chunks[0])
+            except APIError as e:
+                # Without a batch endpoint every id, including the probed ones, is
+                # looked up singly; after a rejected or failed probe (e.g. 400, 422,
+                # 5xx) support stays undecided and only this call falls back
+                if e.code in _NO_BATCH_STATUSES:
+                    self._batch_support[batch_path] = False
+            else:
+                self._batch_support[batch_path] = True
+                _collect_batch(results, chunks.pop(0), response)
+
+        if self._batch_support.get(batch_path):
+            async for result in async_bounded_map(
+                lambda chunk: self._get_batch(batch_path, chunk), chunks, concurrency
+            ):
+                _collect_chunk(results, result)
+        else:
+            remaining = [message_id for chunk in chunks for message_id in chunk]
+            async for result in async_bounded_map(single, remaining, concurrency):
+                _collect_single(results, result)
+        return results
+
+    async def _get_batch(self, path: str, message_ids: List[str]) -> Dict[str, Any]:
+        return await self.client.get(path, {"ids": ",".join(message_ids)}) or {}
+
+    async def cancel(self, message_id: str) -> Dict[str, Any]:
+        """
+        Cancel a message that hasn't been sent yet.
+
+        Args:
+            message_id: Message UUID
+
+        Returns:
+            Cancelled message
+        """
+        return await self.client.post(f"/messages/{message_id}/cancel") or {}
+
+    async def resend(self, message_id: str) -> Dict[str, Any]:
+        """
+        Resend a previously sent message.
+
+        Args:
+            message_id: Message UUID
+
+        Returns:
+            Resent message
+        """
+        return await self.client.post(f"/messages/{message_id}/resend") or {}
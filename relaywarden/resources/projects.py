@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, Optional
+
+from relaywarden.pagination import async_iter_items, iter_items
 
 if TYPE_CHECKING:
+    from relaywarden.async_client import AsyncClient
     from relaywarden.client import Client
 
 
@@ -24,8 +27,16 @@ class Projects:
         Returns:
             List of projects
         """
-        # Note: filters would need to be converted to query params in actual implementation
-        return self.client.get("/projects") or {}
+        return self.client.get("/projects", filters) or {}
+
+    def list_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over every project, fetching pages lazily."""
+        return iter_items(self.client, "/projects", filters, per_page, prefetch)
 
     def get(self, project_id: str) -> Dict[str, Any]:
         """
@@ -72,3 +83,78 @@ class Projects:
             project_id: Project UUID
         """
         self.client.delete(f"/projects/{project_id}")
+
+
+class AsyncProjects:
+    """Async Projects resource for managing projects."""
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def list(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        List all projects for the current team.
+
+        Args:
+            filters: Optional query parameters
+
+        Returns:
+            List of projects
+        """
+        return await self.client.get("/projects", filters) or {}
+
+    async def list_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every project, fetching pages lazily."""
+        async for item in async_iter_items(self.client, "/projects", filters, per_page, prefetch):
+            yield item
+
+    async def get(self, project_id: str) -> Dict[str, Any]:
+        """
+        Get a specific project by ID.
+
+        Args:
+            project_id: Project UUID
+
+        Returns:
+            Project information
+        """
+        return await self.client.get(f"/projects/{project_id}") or {}
+
+    async def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a new project.
+
+        Args:
+            data: Project data
+
+        Returns:
+            Created project
+        """
+        return await self.client.post("/projects", data) or {}
+
+    async def update(self, project_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Update a project.
+
+        Args:
+            project_id: Project UUID
+            data: Update data
+
+        Returns:
+            Updated project
+        """
+        return await self.client.patch(f"/projects/{project_id}", data) or {}
+
+    async def delete(self, project_id: str) -> None:
+        """
+        Delete a project.
+
+        Args:
+            project_id: Project UUID
+        """
+        await self.client.delete(f"/projects/{project_id}")
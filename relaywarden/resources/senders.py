@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, Optional
+
+from relaywarden.pagination import async_iter_items, iter_items
 
 if TYPE_CHECKING:
+    from relaywarden.async_client import AsyncClient
     from relaywarden.client import Client
 
 
@@ -16,7 +19,16 @@ class Senders:
 
     def list(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """List all sender addresses for the current project."""
-        return self.client.get("/senders") or {}
+        return self.client.get("/senders", filters) or {}
+
+    def list_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over every sender, fetching pages lazily."""
+        return iter_items(self.client, "/senders", filters, per_page, prefetch)
 
     def get(self, sender_id: str) -> Dict[str, Any]:
         """Get a specific sender by ID."""
@@ -33,3 +45,40 @@ class Senders:
     def verify(self, sender_id: str) -> Dict[str, Any]:
         """Initiate sender verification."""
         return self.client.post(f"/senders/{sender_id}/verify") or {}
+
+
+class AsyncSenders:
+    """Async Senders resource for managing sender addresses."""
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def list(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """List all sender addresses for the current project."""
+        return await self.client.get("/senders", filters) or {}
+
+    async def list_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every sender, fetching pages lazily."""
+        async for item in async_iter_items(self.client, "/senders", filters, per_page, prefetch):
+            yield item
+
+    async def get(self, sender_id: str) -> Dict[str, Any]:
+        """Get a specific sender by ID."""
+        return await self.client.get(f"/senders/{sender_id}") or {}
+
+    async def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new sender address."""
+        return await self.client.post("/senders", data) or {}
+
+    async def delete(self, sender_id: str) -> None:
+        """Delete a sender address."""
+        await self.client.delete(f"/senders/{sender_id}")
+
+    async def verify(self, sender_id: str) -> Dict[str, Any]:
+        """Initiate sender verification."""
+        return await self.client.post(f"/senders/{sender_id}/verify") or {}
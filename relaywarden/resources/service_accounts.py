@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, Optional
+
+from relaywarden.pagination import async_iter_items, iter_items
 
 if TYPE_CHECKING:
+    from relaywarden.async_client import AsyncClient
     from relaywarden.client import Client
 
 
@@ -16,7 +19,16 @@ class ServiceAccounts:
 
     def list(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """List all service accounts for the current team."""
-        return self.client.get("/service-accounts") or {}
+        return self.client.get("/service-accounts", filters) or {}
+
+    def list_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over every service account, fetching pages lazily."""
+        return iter_items(self.client, "/service-accounts", filters, per_page, prefetch)
 
     def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new service account."""
@@ -37,3 +49,46 @@ class ServiceAccounts:
     def delete_token(self, token_id: str) -> None:
         """Delete an API token."""
         self.client.delete(f"/tokens/{token_id}")
+
+
+class AsyncServiceAccounts:
+    """Async Service Accounts resource for managing service accounts and tokens."""
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def list(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """List all service accounts for the current team."""
+        return await self.client.get("/service-accounts", filters) or {}
+
+    async def list_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every service account, fetching pages lazily."""
+        async for item in async_iter_items(
+            self.client, "/service-accounts", filters, per_page, prefetch
+        ):
+            yield item
+
+    async def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new service account."""
+        return await self.client.post("/service-accounts", data) or {}
+
+    async def delete(self, service_account_id: str) -> None:
+        """Delete a service account."""
+        await self.client.delete(f"/service-accounts/{service_account_id}")
+
+    async def create_token(
+        self, service_account_id: str, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Create a new API token for a service account."""
+        return await self.client.post(
+            f"/service-accounts/{service_account_id}/tokens", data
+        ) or {}
+
+    async def delete_token(self, token_id: str) -> None:
+        """Delete an API token."""
+        await self.client.delete(f"/tokens/{token_id}")
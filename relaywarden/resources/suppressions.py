@@ -2,11 +2,76 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+import csv
+import hashlib
+import json
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from relaywarden.bulk import BulkProgress, BulkResult, async_bounded_map, bounded_map, chunked
+from relaywarden.pagination import async_iter_items, iter_items
+from relaywarden.streaming import (
+    DEFAULT_CHUNK_SIZE,
+    Destination,
+    async_iter_csv_rows,
+    async_iter_download,
+    async_write_chunks,
+    iter_csv_rows,
+    iter_download,
+    write_chunks,
+)
 
 if TYPE_CHECKING:
+    from relaywarden.async_client import AsyncClient
     from relaywarden.client import Client
 
+CSV_HEADERS = {"Accept": "text/csv"}
+
+ImportSource = Union[str, "IO[str]", Iterable[Union[str, Dict[str, Any]]]]
+ProgressCallback = Callable[[BulkProgress], None]
+
+
+def _suppression_rows(source: ImportSource) -> Iterator[Dict[str, Any]]:
+    """
+    Read suppressions lazily from a CSV path, a text file object or an iterable.
+
+    Iterables may hold address strings or suppression dicts; CSV columns become
+    dict keys and empty cells are dropped.
+    """
+    if isinstance(source, str):
+        with open(source, newline="", encoding="utf-8") as f:
+            yield from _suppression_rows(f)
+        return
+    if hasattr(source, "read"):
+        for row in csv.DictReader(source):  # type: ignore[arg-type]
+            yield {key: value for key, value in row.items() if key and value}
+        return
+    for item in source:
+        yield {"email": item} if isinstance(item, str) else item
+
+
+def _import_chunks(source: ImportSource, chunk_size: int) -> Iterator[Tuple[Dict[str, Any], str]]:
+    """
+    Split an import into request payloads, each with a key derived from its content.
+
+    Re-running an interrupted import therefore sends the same keys, and chunks
+    the API already applied are not imported twice.
+    """
+    for chunk in chunked(_suppression_rows(source), chunk_size):
+        digest = hashlib.sha256(json.dumps(chunk, sort_keys=True).encode("utf-8"))
+        yield {"suppressions": chunk}, f"suppressions-import-{digest.hexdigest()[:32]}"
+
 
 class Suppressions:
     """Suppressions resource for managing recipient suppressions."""
@@ -16,7 +81,16 @@ class Suppressions:
 
     def list(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """List all suppressions for the current team."""
-        return self.client.get("/suppressions") or {}
+        return self.client.get("/suppressions", filters) or {}
+
+    def list_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over every suppression, fetching pages lazily."""
+        return iter_items(self.client, "/suppressions", filters, per_page, prefetch)
 
     def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Add a recipient to the suppression list."""
@@ -26,13 +100,188 @@ class Suppressions:
         """Remove a recipient from the suppression list."""
         self.client.delete(f"/suppressions/{suppression_id}")
 
-    def import_suppressions(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def import_suppressions(
+        self, data: Dict[str, Any], idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Import multiple suppressions in bulk."""
-        return self.client.post("/suppressions/import", data) or {}
+        headers = {}
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+        return self.client.post("/suppressions/import", data, headers) or {}
+
+    def import_many(
+        self,
+        source: ImportSource,
+        chunk_size: int = 1000,
+        concurrency: int = 4,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Iterator[BulkResult]:
+        """
+        Import a suppression list of any size in concurrent chunks.
+
+        The source is read lazily, so memory stays bounded by
+        ``chunk_size * concurrency`` rows. Each chunk is sent with an idempotency
+        key derived from its content, which lets the retry policy retry failed
+        uploads safely. A failed chunk does not stop the import.
+
+        Args:
+            source: Path of a CSV file, a text file object with a CSV header
+                (e.g. ``email,reason``), or an iterable of addresses or dicts
+            chunk_size: Suppressions per request (default: 1000)
+            concurrency: Maximum number of chunks uploaded at once (default: 4)
+            on_progress: Optional callback receiving a ``BulkProgress`` after each chunk
+
+        Returns:
+            Iterator of BulkResult per chunk in completion order; ``item`` holds
+            the chunk's rows, so failed chunks can be resubmitted with
+            ``import_suppressions({"suppressions": result.item}, result.idempotency_key)``
+        """
+        progress = BulkProgress()
+        chunks = _import_chunks(source, chunk_size)
+        for result in bounded_map(
+            lambda pair: self.import_suppressions(*pair), chunks, concurrency
+        ):
+            payload, result.idempotency_key = result.item
+            result.item = payload["suppressions"]
+            progress.record(result, len(result.item))
+            if on_progress is not None:
+                on_progress(progress)
+            yield result
 
     def export(self) -> str:
-        """Export all suppressions as a CSV file."""
-        # Note: This endpoint returns CSV, not JSON
-        # In a production SDK, you might want to return bytes or handle CSV parsing
-        response = self.client.get("/suppressions/export")
-        return ""  # Simplified - actual implementation would handle CSV
+        """
+        Export all suppressions as CSV text.
+
+        Holds the whole export in memory; prefer ``export_rows`` or ``export_to``
+        for large lists.
+        """
+        return b"".join(self.export_chunks()).decode("utf-8")
+
+    def export_chunks(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE, max_resumes: int = 3
+    ) -> Iterator[bytes]:
+        """
+        Stream the CSV export as raw byte chunks.
+
+        Dropped connections are resumed with a ``Range`` request up to
+        ``max_resumes`` times.
+        """
+        return iter_download(
+            self.client, "/suppressions/export", CSV_HEADERS, None, chunk_size, max_resumes
+        )
+
+    def export_rows(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE, max_resumes: int = 3
+    ) -> Iterator[Dict[str, str]]:
+        """Stream the CSV export as dicts keyed by the header row."""
+        return iter_csv_rows(self.export_chunks(chunk_size, max_resumes))
+
+    def export_to(
+        self,
+        destination: Destination,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_resumes: int = 3,
+    ) -> int:
+        """
+        Write the CSV export to a file path or binary file-like object.
+
+        Returns:
+            Number of bytes written
+        """
+        return write_chunks(self.export_chunks(chunk_size, max_resumes), destination)
+
+
+class AsyncSuppressions:
+    """Async Suppressions resource for managing recipient suppressions."""
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def list(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """List all suppressions for the current team."""
+        return await self.client.get("/suppressions", filters) or {}
+
+    async def list_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every suppression, fetching pages lazily."""
+        async for item in async_iter_items(
+            self.client, "/suppressions", filters, per_page, prefetch
+        ):
+            yield item
+
+    async def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add a recipient to the suppression list."""
+        return await self.client.post("/suppressions", data) or {}
+
+    async def delete(self, suppression_id: str) -> None:
+        """Remove a recipient from the suppression list."""
+        await self.client.delete(f"/suppressions/{suppression_id}")
+
+    async def import_suppressions(
+        self, data: Dict[str, Any], idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Import multiple suppressions in bulk."""
+        headers = {}
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+        return await self.client.post("/suppressions/import", data, headers) or {}
+
+    async def import_many(
+        self,
+        source: ImportSource,
+        chunk_size: int = 1000,
+        concurrency: int = 4,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> AsyncIterator[BulkResult]:
+        """
+        Import a suppression list of any size in concurrent chunks.
+
+        See ``Suppressions.import_many``; file sources are read on the event loop.
+        """
+        progress = BulkProgress()
+        chunks = _import_chunks(source, chunk_size)
+        async for result in async_bounded_map(
+            lambda pair: self.import_suppressions(*pair), chunks, concurrency
+        ):
+            payload, result.idempotency_key = result.item
+            result.item = payload["suppressions"]
+            progress.record(result, len(result.item))
+            if on_progress is not None:
+                on_progress(progress)
+            yield result
+
+    async def export(self) -> str:
+        """
+        Export all suppressions as CSV text.
+
+        Holds the whole export in memory; prefer ``export_rows`` or ``export_to``
+        for large lists.
+        """
+        return b"".join([chunk async for chunk in self.export_chunks()]).decode("utf-8")
+
+    def export_chunks(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE, max_resumes: int = 3
+    ) -> AsyncIterator[bytes]:
+        """Stream the CSV export as raw byte chunks, resuming dropped connections."""
+        return async_iter_download(
+            self.client, "/suppressions/export", CSV_HEADERS, None, chunk_size, max_resumes
+        )
+
+    def export_rows(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE, max_resumes: int = 3
+    ) -> AsyncIterator[Dict[str, str]]:
+        """Stream the CSV export as dicts keyed by the header row."""
+        return async_iter_csv_rows(self.export_chunks(chunk_size, max_resumes))
+
+    async def export_to(
+        self,
+        destination: Destination,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_resumes: int = 3,
+    ) -> int:
+        """Write the CSV export to a file path or binary file-like object."""
+        return await async_write_chunks(self.export_chunks(chunk_size, max_resumes), destination)
@@ -2,9 +2,23 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+)
+
+from relaywarden.pagination import async_iter_items, iter_items
+from relaywarden.templating import AsyncLocalRenderer, LocalRenderer
 
 if TYPE_CHECKING:
+    from relaywarden.async_client import AsyncClient
     from relaywarden.client import Client
 
 
@@ -13,10 +27,20 @@ class Templates:
 
     def __init__(self, client: Client):
         self.client = client
+        self._renderer: Optional[LocalRenderer] = None
 
     def list(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """List all templates for the current project."""
-        return self.client.get("/templates") or {}
+        return self.client.get("/templates", filters) or {}
+
+    def list_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over every template, fetching pages lazily."""
+        return iter_items(self.client, "/templates", filters, per_page, prefetch)
 
     def get(self, template_id: str) -> Dict[str, Any]:
         """Get a specific template by ID."""
@@ -28,26 +52,181 @@ class Templates:
 
     def update(self, template_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update a template."""
-        return self.client.patch(f"/templates/{template_id}", data) or {}
+        response = self.client.patch(f"/templates/{template_id}", data) or {}
+        self._invalidate(template_id)
+        return response
 
     def delete(self, template_id: str) -> None:
         """Delete a template."""
         self.client.delete(f"/templates/{template_id}")
+        self._invalidate(template_id)
 
     def list_versions(
         self, template_id: str, filters: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """List all versions of a template."""
-        return self.client.get(f"/templates/{template_id}/versions") or {}
+        return self.client.get(f"/templates/{template_id}/versions", filters) or {}
+
+    def iter_versions(
+        self,
+        template_id: str,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over every template version, fetching pages lazily."""
+        return iter_items(
+            self.client, f"/templates/{template_id}/versions", filters, per_page, prefetch
+        )
 
     def create_version(self, template_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new version of a template."""
-        return self.client.post(f"/templates/{template_id}/versions", data) or {}
+        response = self.client.post(f"/templates/{template_id}/versions", data) or {}
+        self._invalidate(template_id)
+        return response
 
     def render(self, template_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Render a template with provided data."""
         return self.client.post(f"/templates/{template_id}/render", data) or {}
 
+    @property
+    def renderer(self) -> LocalRenderer:
+        """Get the local renderer caching compiled templates for this client."""
+        if self._renderer is None:
+            self._renderer = LocalRenderer(self.client)
+        return self._renderer
+
+    def _invalidate(self, template_id: str) -> None:
+        """Drop a template this client changed from the local renderer's cache."""
+        if self._renderer is not None:
+            self._renderer.invalidate(template_id)
+
+    def render_local(
+        self, template_id: str, data: Mapping[str, Any], version: Any = None
+    ) -> Dict[str, str]:
+        """
+        Render a template in-process, without a request per render.
+
+        The template is fetched and compiled on first use and cached; see
+        ``LocalRenderer`` for the supported syntax.
+
+        Args:
+            template_id: Template UUID
+            data: Template variables
+            version: Template version (default: the current version)
+
+        Returns:
+            Rendered fields, e.g. ``{"subject": ..., "html_body": ..., "text_body": ...}``
+
+        Raises:
+            TemplateRenderError: When the template uses syntax only the server supports
+        """
+        return self.renderer.render(template_id, data, version)
+
+    def render_local_many(
+        self, template_id: str, recipients: Iterable[Mapping[str, Any]], version: Any = None
+    ) -> List[Dict[str, str]]:
+        """Render a template in-process for many recipients' variables, in input order."""
+        return self.renderer.render_many(template_id, recipients, version)
+
     def test_send(self, template_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Send a test email using the template."""
         return self.client.post(f"/templates/{template_id}/test-send", data) or {}
+
+
+class AsyncTemplates:
+    """Async Templates resource for managing email templates."""
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+        self._renderer: Optional[AsyncLocalRenderer] = None
+
+    async def list(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """List all templates for the current project."""
+        return await self.client.get("/templates", filters) or {}
+
+    async def list_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every template, fetching pages lazily."""
+        async for item in async_iter_items(self.client, "/templates", filters, per_page, prefetch):
+            yield item
+
+    async def get(self, template_id: str) -> Dict[str, Any]:
+        """Get a specific template by ID."""
+        return await self.client.get(f"/templates/{template_id}") or {}
+
+    async def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new template."""
+        return await self.client.post("/templates", data) or {}
+
+    async def update(self, template_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Update a template."""
+        response = await self.client.patch(f"/templates/{template_id}", data) or {}
+        self._invalidate(template_id)
+        return response
+
+    async def delete(self, template_id: str) -> None:
+        """Delete a template."""
+        await self.client.delete(f"/templates/{template_id}")
+        self._invalidate(template_id)
+
+    async def list_versions(
+        self, template_id: str, filters: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """List all versions of a template."""
+        return await self.client.get(f"/templates/{template_id}/versions", filters) or {}
+
+    async def iter_versions(
+        self,
+        template_id: str,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every template version, fetching pages lazily."""
+        async for item in async_iter_items(
+            self.client, f"/templates/{template_id}/versions", filters, per_page, prefetch
+        ):
+            yield item
+
+    async def create_version(self, template_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new version of a template."""
+        response = await self.client.post(f"/templates/{template_id}/versions", data) or {}
+        self._invalidate(template_id)
+        return response
+
+    async def render(self, template_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Render a template with provided data."""
+        return await self.client.post(f"/templates/{template_id}/render", data) or {}
+
+    @property
+    def renderer(self) -> AsyncLocalRenderer:
+        """Get the local renderer caching compiled templates for this client."""
+        if self._renderer is None:
+            self._renderer = AsyncLocalRenderer(self.client)
+        return self._renderer
+
+    def _invalidate(self, template_id: str) -> None:
+        """Drop a template this client changed from the local renderer's cache."""
+        if self._renderer is not None:
+            self._renderer.invalidate(template_id)
+
+    async def render_local(
+        self, template_id: str, data: Mapping[str, Any], version: Any = None
+    ) -> Dict[str, str]:
+        """Render a template in-process; see ``Templates.render_local``."""
+        return await self.renderer.render(template_id, data, version)
+
+    async def render_local_many(
+        self, template_id: str, recipients: Iterable[Mapping[str, Any]], version: Any = None
+    ) -> List[Dict[str, str]]:
+        """Render a template in-process for many recipients' variables, in input order."""
+        return await self.renderer.render_many(template_id, recipients, version)
+
+    async def test_send(self, template_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a test email using the template."""
+        return await self.client.post(f"/templates/{template_id}/test-send", data) or {}
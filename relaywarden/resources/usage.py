@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 if TYPE_CHECKING:
+    from relaywarden.async_client import AsyncClient
     from relaywarden.client import Client
 
 
@@ -16,12 +17,45 @@ class Usage:
 
     def get_daily(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get daily usage statistics for the current team."""
-        return self.client.get("/usage/daily") or {}
+        return self.client.get("/usage/daily", filters) or {}
 
     def get_limits(self) -> Dict[str, Any]:
-        """Get current usage limits and remaining quota."""
-        return self.client.get("/limits") or {}
+        """
+        Get current usage limits and remaining quota.
+
+        The client's rate limiter, if any, is primed with the returned quota.
+        """
+        limits = self.client.get("/limits") or {}
+        if self.client.rate_limiter is not None:
+            self.client.rate_limiter.update_from_limits(limits)
+        return limits
 
     def get_diagnostics(self) -> Dict[str, Any]:
         """Get system health and diagnostic information."""
         return self.client.get("/diagnostics") or {}
+
+
+class AsyncUsage:
+    """Async Usage resource for viewing usage statistics and limits."""
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def get_daily(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Get daily usage statistics for the current team."""
+        return await self.client.get("/usage/daily", filters) or {}
+
+    async def get_limits(self) -> Dict[str, Any]:
+        """
+        Get current usage limits and remaining quota.
+
+        The client's rate limiter, if any, is primed with the returned quota.
+        """
+        limits = await self.client.get("/limits") or {}
+        if self.client.rate_limiter is not None:
+            self.client.rate_limiter.update_from_limits(limits)
+        return limits
+
+    async def get_diagnostics(self) -> Dict[str, Any]:
+        """Get system health and diagnostic information."""
+        return await self.client.get("/diagnostics") or {}
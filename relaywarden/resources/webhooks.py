@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, Optional
+
+from relaywarden.pagination import async_iter_items, iter_items
 
 if TYPE_CHECKING:
+    from relaywarden.async_client import AsyncClient
     from relaywarden.client import Client
 
 
@@ -18,7 +21,16 @@ class Webhooks:
         self, filters: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """List all webhook endpoints for the current project."""
-        return self.client.get("/webhooks/endpoints") or {}
+        return self.client.get("/webhooks/endpoints", filters) or {}
+
+    def iter_endpoints(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over every webhook endpoint, fetching pages lazily."""
+        return iter_items(self.client, "/webhooks/endpoints", filters, per_page, prefetch)
 
     def create_endpoint(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new webhook endpoint."""
@@ -38,7 +50,18 @@ class Webhooks:
         self, endpoint_id: str, filters: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """List all delivery attempts for a webhook endpoint."""
-        return self.client.get(f"/webhooks/endpoints/{endpoint_id}/deliveries") or {}
+        return self.client.get(f"/webhooks/endpoints/{endpoint_id}/deliveries", filters) or {}
+
+    def iter_deliveries(
+        self,
+        endpoint_id: str,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over every delivery attempt, fetching pages lazily."""
+        path = f"/webhooks/endpoints/{endpoint_id}/deliveries"
+        return iter_items(self.client, path, filters, per_page, prefetch)
 
     def test_endpoint(self, endpoint_id: str) -> Dict[str, Any]:
         """Send a test webhook to verify the endpoint is working."""
@@ -47,3 +70,68 @@ class Webhooks:
     def replay_delivery(self, delivery_id: str) -> Dict[str, Any]:
         """Replay a failed webhook delivery."""
         return self.client.post(f"/webhooks/deliveries/{delivery_id}/replay") or {}
+
+
+class AsyncWebhooks:
+    """Async Webhooks resource for managing webhook endpoints."""
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def list_endpoints(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """List all webhook endpoints for the current project."""
+        return await self.client.get("/webhooks/endpoints", filters) or {}
+
+    async def iter_endpoints(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every webhook endpoint, fetching pages lazily."""
+        async for item in async_iter_items(
+            self.client, "/webhooks/endpoints", filters, per_page, prefetch
+        ):
+            yield item
+
+    async def create_endpoint(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new webhook endpoint."""
+        return await self.client.post("/webhooks/endpoints", data) or {}
+
+    async def update_endpoint(
+        self, endpoint_id: str, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Update a webhook endpoint."""
+        return await self.client.patch(f"/webhooks/endpoints/{endpoint_id}", data) or {}
+
+    async def delete_endpoint(self, endpoint_id: str) -> None:
+        """Delete a webhook endpoint."""
+        await self.client.delete(f"/webhooks/endpoints/{endpoint_id}")
+
+    async def list_deliveries(
+        self, endpoint_id: str, filters: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """List all delivery attempts for a webhook endpoint."""
+        return await self.client.get(f"/webhooks/endpoints/{endpoint_id}/deliveries", filters) or {}
+
+    async def iter_deliveries(
+        self,
+        endpoint_id: str,
+        filters: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every delivery attempt, fetching pages lazily."""
+        path = f"/webhooks/endpoints/{endpoint_id}/deliveries"
+        async for item in async_iter_items(self.client, path, filters, per_page, prefetch):
+            yield item
+
+    async def test_endpoint(self, endpoint_id: str) -> Dict[str, Any]:
+        """Send a test webhook to verify the endpoint is working."""
+        return await self.client.post(f"/webhooks/endpoints/{endpoint_id}/test") or {}
+
+    async def replay_delivery(self, delivery_id: str) -> Dict[str, Any]:
+        """Replay a failed webhook delivery."""
+        return await self.client.post(f"/webhooks/deliveries/{delivery_id}/replay") or {}
@@ -0,0 +1,172 @@
+"""Retry policies for the request path."""
+
+import random
+import threading
+import time
+from typing import Callable, Collection, Mapping, Optional
+
+from relaywarden.exceptions import APIError, RateLimitError
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryBudget:
+    """
+    Token bucket that caps how many retries a client may issue.
+
+    Every retry spends one token. Tokens are earned back at ``min_per_second`` and
+    as a fraction (``ratio``) of each successful request, so retries stay a small
+    share of traffic during an outage instead of multiplying the load.
+    """
+
+    def __init__(self, capacity: float = 100.0, ratio: float = 0.1, min_per_second: float = 1.0):
+        """
+        Args:
+            capacity: Maximum number of stored retry tokens
+            ratio: Tokens earned per successful request
+            min_per_second: Tokens earned per second regardless of traffic
+        """
+        self.capacity = capacity
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.min_per_second)
+
+    def deposit(self) -> None:
+        """Record a successful request."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """Spend one token for a retry, returning False when the budget is exhausted."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    @property
+    def available(self) -> float:
+        """Number of retry tokens currently available."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+class RetryPolicy:
+    """
+    Full-jitter exponential backoff with a retry budget and a per-call deadline.
+
+    Retried are transient transport errors, 429 responses and ``retry_statuses``
+    responses for idempotent methods or requests carrying an ``Idempotency-Key``.
+    Other requests are retried after transport errors only when they happened
+    while connecting, before anything was sent.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.1,
+        backoff_max: float = 10.0,
+        retry_statuses: Collection[int] = (502, 503, 504),
+        max_retry_after: float = 30.0,
+        deadline: Optional[float] = None,
+        budget: Optional[RetryBudget] = None,
+        rng: Callable[[], float] = random.random,
+    ):
+        """
+        Args:
+            max_retries: Maximum number of retry attempts per call
+            backoff_base: Backoff ceiling in seconds for the first retry
+            backoff_max: Upper bound of the backoff ceiling in seconds
+            retry_statuses: HTTP statuses retried for idempotent requests
+            max_retry_after: Longest server-requested ``Retry-After`` wait in seconds;
+                longer waits raise ``RateLimitError`` immediately
+            deadline: Maximum total seconds per call including retries and waits
+            budget: Retry budget shared by all calls using this policy
+                (default: a new ``RetryBudget``)
+            rng: Source of uniform random numbers in [0, 1)
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.max_retry_after = max_retry_after
+        self.deadline = deadline
+        self.budget = budget if budget is not None else RetryBudget()
+        self.rng = rng
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay: uniform between 0 and ``base * 2 ** attempt`` (capped)."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return self.rng() * ceiling
+
+    def is_idempotent(self, method: str, headers: Mapping[str, str]) -> bool:
+        """Check whether a request can be safely repeated."""
+        return method.upper() in IDEMPOTENT_METHODS or "Idempotency-Key" in headers
+
+    def record_success(self) -> None:
+        """Record a successful call, earning back retry budget."""
+        self.budget.deposit()
+
+    def get_delay(
+        self,
+        attempt: int,
+        method: str,
+        headers: Mapping[str, str],
+        error: Exception,
+        elapsed: float,
+        retry_after: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry a failed attempt.
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            method: HTTP method of the request
+            headers: Request headers
+            error: ``APIError`` for error responses, or a transport exception
+                already classified as transient by the client
+            elapsed: Seconds spent on this call so far
+            retry_after: Parsed ``Retry-After`` header, if any
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        if isinstance(error, RateLimitError):
+            if retry_after is None:
+                delay = self.backoff(attempt)
+            elif retry_after > self.max_retry_after:
+                return None
+            else:
+                # Small jitter so clients told the same Retry-After do not retry in lockstep
+                delay = retry_after + self.rng() * min(1.0, self.backoff_base * (2**attempt))
+        elif isinstance(error, APIError):
+            if error.code not in self.retry_statuses or not self.is_idempotent(method, headers):
+                return None
+            delay = self.backoff(attempt)
+        else:
+            delay = self.backoff(attempt)
+
+        if self.deadline is not None and elapsed + delay >= self.deadline:
+            return None
+        if not self.budget.try_withdraw():
+            return None
+        return delay
+
+    def remaining(self, elapsed: float) -> Optional[float]:
+        """Seconds left before the deadline, or None when there is no deadline."""
+        if self.deadline is None:
+            return None
+        return self.deadline - elapsed
@@ -0,0 +1,307 @@
+"""Request body serialization and compression."""
+
+import asyncio
+import gzip
+import json
+import threading
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Mapping, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra installed
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised only without the extra installed
+    msgspec = None  # type: ignore[assignment]
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:  # pragma: no cover - depends on the Python version
+    try:
+        import zstandard as zstd
+    except ImportError:  # pragma: no cover - exercised only without the extra installed
+        zstd = None  # type: ignore[assignment]
+
+# Bodies smaller than this are sent uncompressed; compressing them costs more
+# CPU than it saves on the wire
+MIN_COMPRESS_SIZE = 1024
+
+# Content codings in order of preference when the server accepts several
+COMPRESSIONS = ("zstd", "gzip")
+
+
+class Serializer:
+    """Encodes request bodies to and decodes response bodies from JSON bytes."""
+
+    name = "json"
+
+    def dumps(self, data: Any) -> bytes:
+        """Encode ``data`` as UTF-8 JSON."""
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, content: bytes) -> Any:
+        """Decode a JSON body."""
+        return json.loads(content)
+
+
+class OrjsonSerializer(Serializer):
+    """Serializer backed by ``orjson``."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError(
+                "OrjsonSerializer requires orjson. Install it with: "
+                "pip install relaywarden[speedups]"
+            )
+
+    def dumps(self, data: Any) -> bytes:
+        # Integer keys are stringified like the stdlib encoder does
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, content: bytes) -> Any:
+        return orjson.loads(content)
+
+
+class MsgspecSerializer(Serializer):
+    """Serializer backed by ``msgspec``."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        if msgspec is None:
+            raise ImportError(
+                "MsgspecSerializer requires msgspec. Install it with: pip install msgspec"
+            )
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, data: Any) -> bytes:
+        return self._encoder.encode(data)
+
+    def loads(self, content: bytes) -> Any:
+        return self._decoder.decode(content)
+
+
+def default_serializer() -> Serializer:
+    """The fastest installed serializer: orjson, then msgspec, then the stdlib."""
+    if orjson is not None:
+        return OrjsonSerializer()
+    if msgspec is not None:
+        return MsgspecSerializer()
+    return Serializer()
+
+
+def supported_compressions() -> tuple:
+    """Content codings this installation can compress request bodies with."""
+    return tuple(name for name in COMPRESSIONS if name != "zstd" or zstd is not None)
+
+
+def compress(content: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """
+    Compress a body with a content coding.
+
+    Args:
+        content: Body to compress
+        encoding: ``"gzip"`` or ``"zstd"``
+        level: Compression level (default: 6 for gzip, 3 for zstd)
+    """
+    if encoding == "gzip":
+        return gzip.compress(content, compresslevel=6 if level is None else level, mtime=0)
+    if encoding == "zstd":
+        if zstd is None:
+            raise ImportError(
+                "zstd compression requires zstandard. Install it with: "
+                "pip install relaywarden[speedups]"
+            )
+        if hasattr(zstd, "ZstdCompressor"):
+            return zstd.ZstdCompressor(level=3 if level is None else level).compress(content)
+        return zstd.compress(content, level=3 if level is None else level)
+    raise ValueError(f"Unsupported compression: {encoding}")
+
+
+class EncodedBody:
+    """
+    A request body encoded once and sent as-is by every attempt.
+
+    Create one with ``BodyEncoder.encode`` to serialise (and compress) a payload
+    once, e.g. when the same body is sent to several projects, and pass it
+    wherever a request body is accepted.
+    """
+
+    __slots__ = ("content", "content_encoding")
+
+    def __init__(self, content: bytes, content_encoding: Optional[str] = None):
+        self.content = content
+        self.content_encoding = content_encoding
+
+    def __len__(self) -> int:
+        return len(self.content)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Headers describing the body."""
+        if self.content_encoding is None:
+            return {}
+        return {"Content-Encoding": self.content_encoding}
+
+    @property
+    def async_content(self) -> bytes:
+        """The body as passed to asyncio transports."""
+        return self.content
+
+
+class _SizedChunks:
+    """Iterable of body chunks with a known total size, so no chunked encoding is used."""
+
+    __slots__ = ("_chunks", "_length")
+
+    def __init__(self, chunks: Callable[[], Iterator[bytes]], length: int):
+        self._chunks = chunks
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self._chunks()
+
+
+class StreamingBody:
+    """
+    A request body produced chunk by chunk while it is sent.
+
+    ``chunks`` is called once per attempt and must yield exactly ``length``
+    bytes, so retries resend the body without it ever being held in memory.
+    Streaming bodies are sent with a ``Content-Length`` and are never compressed.
+    """
+
+    __slots__ = ("_chunks", "length")
+
+    content_encoding = None
+
+    def __init__(self, chunks: Callable[[], Iterator[bytes]], length: int):
+        self._chunks = chunks
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Headers describing the body."""
+        return {"Content-Length": str(self.length)}
+
+    @property
+    def content(self) -> _SizedChunks:
+        """The body as passed to ``requests``."""
+        return _SizedChunks(self._chunks, self.length)
+
+    @property
+    def async_content(self) -> AsyncIterator[bytes]:
+        """The body as passed to asyncio transports; chunks are produced in a worker thread."""
+        return self._aiter()
+
+    async def _aiter(self) -> AsyncIterator[bytes]:
+        chunks = self._chunks()
+        while True:
+            chunk = await asyncio.to_thread(next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
+
+class BodyEncoder:
+    """
+    Serialises and compresses request bodies for a client.
+
+    Bodies are encoded with ``serializer`` (orjson or msgspec when installed) and
+    compressed once they reach ``min_size`` bytes. With ``compression="auto"``
+    bodies are only compressed after a response advertised an accepted coding in
+    its ``Accept-Encoding`` header (RFC 7694). A ``415`` response to a compressed
+    body turns compression off and the call is resent uncompressed.
+
+    Bytes passed as a request body are taken to be serialised JSON and are only
+    compressed; ``EncodedBody`` and ``StreamingBody`` instances are sent unchanged.
+    """
+
+    def __init__(
+        self,
+        serializer: Optional[Serializer] = None,
+        compression: Optional[str] = "auto",
+        min_size: int = MIN_COMPRESS_SIZE,
+        level: Optional[int] = None,
+    ):
+        """
+        Args:
+            serializer: Serializer for request and response bodies
+                (default: ``default_serializer()``)
+            compression: ``"gzip"``, ``"zstd"``, ``"auto"`` to follow the server's
+                ``Accept-Encoding``, or None to never compress
+            min_size: Smallest serialised body in bytes that is compressed
+            level: Compression level (default: the codec's default)
+        """
+        if compression not in (None, "auto") + COMPRESSIONS:
+            raise ValueError(f"Unsupported compression: {compression}")
+        if compression == "zstd" and zstd is None:
+            raise ImportError(
+                "zstd compression requires zstandard. Install it with: "
+                "pip install relaywarden[speedups]"
+            )
+        self.serializer = serializer or default_serializer()
+        self.compression = compression
+        self.min_size = min_size
+        self.level = level
+        self._negotiated: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def active_compression(self) -> Optional[str]:
+        """The content coding currently applied to large bodies, if any."""
+        if self.compression == "auto":
+            return self._negotiated
+        return self.compression
+
+    def encode(self, data: Union[Any, bytes, EncodedBody]) -> Union[EncodedBody, StreamingBody]:
+        """Serialise (unless already bytes) and compress a request body."""
+        if isinstance(data, (EncodedBody, StreamingBody)):
+            return data
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            content = bytes(data)
+        else:
+            content = self.serializer.dumps(data)
+        encoding = self.active_compression
+        if encoding is None or len(content) < self.min_size:
+            return EncodedBody(content)
+        return EncodedBody(compress(content, encoding, self.level), encoding)
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Pick a coding from a response's ``Accept-Encoding`` header in ``"auto"`` mode."""
+        if self.compression != "auto" or self._negotiated is not None:
+            return
+        accepted = headers.get("Accept-Encoding")
+        if not accepted:
+            return
+        offered = {part.split(";")[0].strip().lower() for part in accepted.split(",")}
+        for encoding in supported_compressions():
+            if encoding in offered:
+                with self._lock:
+                    self._negotiated = encoding
+                return
+
+    def reject(self, body: EncodedBody) -> bool:
+        """
+        Turn compression off after the server refused a compressed body.
+
+        Returns:
+            Whether the body should be re-encoded and resent
+        """
+        if body.content_encoding is None:
+            return False
+        with self._lock:
+            self.compression = None
+            self._negotiated = None
+        return True
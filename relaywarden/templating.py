@@ -0,0 +1,339 @@
+"""Local rendering of RelayWarden templates with a compiled-template cache."""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from relaywarden.exceptions import TemplateRenderError
+
+if TYPE_CHECKING:
+    from relaywarden.async_client import AsyncClient
+    from relaywarden.client import Client
+
+# Template fields rendered, and the ones whose ``{{ }}`` output is HTML-escaped
+TEMPLATE_FIELDS = ("subject", "html_body", "text_body")
+HTML_FIELDS = frozenset({"html_body"})
+
+# ``@{{ ... }}`` (literal braces), ``{{ ... }}`` (escaped in HTML) and ``{!! ... !!}`` (raw)
+_TAG_RE = re.compile(r"@(\{\{.*?\}\})|\{\{\s*(.*?)\s*\}\}|\{!!\s*(.*?)\s*!!\}", re.S)
+_EXPRESSION_RE = re.compile(
+    r"""^\$(?P<name>[A-Za-z_]\w*)
+    (?P<path>(?:\.\w+|->\w+|\[\s*(?:'[^']*'|"[^"]*"|\d+)\s*\])*)
+    (?:\s*\?\?\s*(?P<default>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?))?$""",
+    re.X,
+)
+_ACCESS_RE = re.compile(r"""\.(\w+)|->(\w+)|\[\s*(?:'([^']*)'|"([^"]*)"|(\d+))\s*\]""")
+
+# Same output as PHP's htmlspecialchars(..., ENT_QUOTES), which the server uses
+_HTML_ESCAPES = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#039;"}
+)
+
+_MISSING = object()
+
+
+def _to_text(value: Any) -> str:
+    """Convert a variable to text the way PHP's string conversion does."""
+    if isinstance(value, str):
+        return value
+    if value is None or value is False:
+        return ""
+    if value is True:
+        return "1"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+    return str(value)
+
+
+def _parse_default(literal: Optional[str]) -> Any:
+    if literal is None:
+        return None
+    if literal[0] in "'\"":
+        return re.sub(r"\\(.)", r"\1", literal[1:-1])
+    return literal
+
+
+def _make_getter(expression: str) -> Callable[[Mapping[str, Any]], str]:
+    match = _EXPRESSION_RE.match(expression)
+    if match is None:
+        raise TemplateRenderError(f"Unsupported template expression: {{{{ {expression} }}}}")
+    path: List[Any] = [match.group("name")]
+    for access in _ACCESS_RE.finditer(match.group("path")):
+        *names, index = access.groups()
+        path.append(int(index) if index is not None else next(n for n in names if n is not None))
+    default = _to_text(_parse_default(match.group("default")))
+
+    if len(path) == 1:
+        name = path[0]
+
+        def get_variable(variables: Mapping[str, Any]) -> str:
+            value = variables.get(name)
+            return default if value is None else _to_text(value)
+
+        return get_variable
+
+    def get_path(variables: Mapping[str, Any]) -> str:
+        value: Any = variables
+        for key in path:
+            if isinstance(value, Mapping):
+                value = value.get(key, value.get(str(key), _MISSING))
+            elif isinstance(value, (list, tuple)) and isinstance(key, int) and key < len(value):
+                value = value[key]
+            else:
+                value = _MISSING
+            if value is _MISSING or value is None:
+                return default
+        return _to_text(value)
+
+    return get_path
+
+
+class CompiledField:
+    """One template field compiled to a format string and its variable getters."""
+
+    __slots__ = ("format", "getters", "escapes")
+
+    def __init__(self, source: str, html: bool):
+        parts: List[str] = []
+        self.getters: List[Callable[[Mapping[str, Any]], str]] = []
+        self.escapes: List[bool] = []
+        position = 0
+        for match in _TAG_RE.finditer(source):
+            parts.append(_escape_braces(source[position : match.start()]))
+            literal, escaped, raw = match.groups()
+            if literal is not None:
+                parts.append(_escape_braces(literal))
+            else:
+                parts.append("{%d}" % len(self.getters))
+                self.getters.append(_make_getter(escaped if escaped is not None else raw))
+                self.escapes.append(html and escaped is not None)
+            position = match.end()
+        parts.append(_escape_braces(source[position:]))
+        self.format = "".join(parts)
+
+    def render(self, variables: Mapping[str, Any]) -> str:
+        """Render the field for one set of variables."""
+        if not self.getters:
+            return self.format.format()
+        values = [
+            getter(variables).translate(_HTML_ESCAPES) if escape else getter(variables)
+            for getter, escape in zip(self.getters, self.escapes)
+        ]
+        return self.format.format(*values)
+
+    def render_many(self, recipients: Sequence[Mapping[str, Any]]) -> List[str]:
+        """Render the field for many sets of variables, one variable column at a time."""
+        if not self.getters:
+            return [self.format.format()] * len(recipients)
+        columns = []
+        for getter, escape in zip(self.getters, self.escapes):
+            column = list(map(getter, recipients))
+            if escape:
+                column = [value.translate(_HTML_ESCAPES) for value in column]
+            columns.append(column)
+        template = self.format.format
+        return [template(*values) for values in zip(*columns)]
+
+
+def _escape_braces(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+class CompiledTemplate:
+    """A template version compiled for fast, repeated local rendering."""
+
+    __slots__ = ("template_id", "version", "fields")
+
+    def __init__(self, template_id: str, version: Any, sources: Mapping[str, Optional[str]]):
+        self.template_id = template_id
+        self.version = version
+        self.fields = {
+            name: CompiledField(sources[name], name in HTML_FIELDS)
+            for name in TEMPLATE_FIELDS
+            if sources.get(name) is not None
+        }
+
+    def render(self, variables: Mapping[str, Any]) -> Dict[str, str]:
+        """Render every field for one recipient's variables."""
+        return {name: field.render(variables) for name, field in self.fields.items()}
+
+    def render_many(self, recipients: Iterable[Mapping[str, Any]]) -> List[Dict[str, str]]:
+        """Render every field for a batch of recipients, in input order."""
+        recipients = recipients if isinstance(recipients, Sequence) else list(recipients)
+        names = list(self.fields)
+        columns = [self.fields[name].render_many(recipients) for name in names]
+        return [dict(zip(names, values)) for values in zip(*columns)]
+
+
+def compile_template(
+    sources: Mapping[str, Optional[str]], template_id: str = "", version: Any = None
+) -> CompiledTemplate:
+    """
+    Compile the ``subject``, ``html_body`` and ``text_body`` of a template.
+
+    Other keys of ``sources``, such as a template payload's ``id``, are ignored.
+
+    Raises:
+        TemplateRenderError: When a field uses syntax the local renderer does not support
+    """
+    return CompiledTemplate(template_id, version, sources)
+
+
+def _template_payload(response: Dict[str, Any]) -> Dict[str, Any]:
+    data = response.get("data", response)
+    return data if isinstance(data, dict) else {}
+
+
+def _version_of(payload: Dict[str, Any]) -> Any:
+    for key in ("version", "current_version", "version_number"):
+        if payload.get(key) is not None:
+            return payload[key]
+    return None
+
+
+class _BaseRenderer:
+    def __init__(self, client: Any, max_templates: int = 256, refresh_interval: float = 60.0):
+        """
+        Args:
+            client: Client used to fetch templates
+            max_templates: Compiled template versions kept; the least recently
+                used is dropped beyond this
+            refresh_interval: Seconds the current version of a template is
+                assumed unchanged before it is fetched again
+        """
+        self.client = client
+        self.max_templates = max_templates
+        self.refresh_interval = refresh_interval
+        self._compiled: "OrderedDict[Tuple[str, Any], CompiledTemplate]" = OrderedDict()
+        self._current: Dict[str, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+
+    def _cached(self, template_id: str, version: Any) -> Optional[CompiledTemplate]:
+        with self._lock:
+            if version is None:
+                current = self._current.get(template_id)
+                if current is None or current[1] <= time.monotonic():
+                    return None
+                version = current[0]
+            compiled = self._compiled.get((template_id, version))
+            if compiled is not None:
+                self._compiled.move_to_end((template_id, version))
+            return compiled
+
+    def _store(self, template_id: str, payload: Dict[str, Any], current: bool) -> CompiledTemplate:
+        version = _version_of(payload)
+        compiled = compile_template(payload, template_id, version)
+        with self._lock:
+            self._compiled[(template_id, version)] = compiled
+            self._compiled.move_to_end((template_id, version))
+            while len(self._compiled) > self.max_templates:
+                self._compiled.popitem(last=False)
+            if current:
+                self._current[template_id] = (version, time.monotonic() + self.refresh_interval)
+        return compiled
+
+    def invalidate(self, template_id: Optional[str] = None) -> None:
+        """Forget compiled versions of one template, or of all templates."""
+        with self._lock:
+            if template_id is None:
+                self._compiled.clear()
+                self._current.clear()
+                return
+            self._current.pop(template_id, None)
+            for key in [key for key in self._compiled if key[0] == template_id]:
+                del self._compiled[key]
+
+
+class LocalRenderer(_BaseRenderer):
+    """
+    Render templates in-process instead of calling ``Templates.render``.
+
+    A template version is fetched once, compiled into a format string with one
+    getter per variable, and cached by template id and version. The current
+    version of a template is re-checked every ``refresh_interval`` seconds; pinned
+    versions never change and are never re-fetched.
+
+    Supported syntax is the subset of the server's Blade-style syntax used in
+    templates: ``{{ $var }}`` (HTML-escaped in ``html_body``), ``{!! $var !!}``
+    (never escaped), nested access such as ``{{ $user.name }}``,
+    ``{{ $user['name'] }}`` or ``{{ $items[0] }}``, defaults with
+    ``{{ $name ?? 'there' }}``, and ``@{{ ... }}`` for literal braces. Missing
+    variables render as empty text. Templates using anything else raise
+    ``TemplateRenderError`` when compiled; render those with ``Templates.render``.
+    """
+
+    client: Client
+
+    def get_compiled(self, template_id: str, version: Any = None) -> CompiledTemplate:
+        """Get the compiled template, fetching and compiling it on first use."""
+        compiled = self._cached(template_id, version)
+        if compiled is not None:
+            return compiled
+        if version is None:
+            payload = _template_payload(self.client.templates.get(template_id))
+            return self._store(template_id, payload, current=True)
+        for item in self.client.templates.iter_versions(template_id):
+            if str(_version_of(item)) == str(version):
+                return self._store(template_id, {**item, "version": version}, current=False)
+        raise TemplateRenderError(f"Template {template_id} has no version {version}", 404)
+
+    def render(
+        self, template_id: str, variables: Mapping[str, Any], version: Any = None
+    ) -> Dict[str, str]:
+        """Render a template's fields for one recipient."""
+        return self.get_compiled(template_id, version).render(variables)
+
+    def render_many(
+        self, template_id: str, recipients: Iterable[Mapping[str, Any]], version: Any = None
+    ) -> List[Dict[str, str]]:
+        """Render a template's fields for a batch of recipients, in input order."""
+        return self.get_compiled(template_id, version).render_many(recipients)
+
+
+class AsyncLocalRenderer(_BaseRenderer):
+    """Asyncio counterpart of :class:`LocalRenderer`; only fetching is asynchronous."""
+
+    client: AsyncClient
+
+    async def get_compiled(self, template_id: str, version: Any = None) -> CompiledTemplate:
+        """Get the compiled template, fetching and compiling it on first use."""
+        compiled = self._cached(template_id, version)
+        if compiled is not None:
+            return compiled
+        if version is None:
+            payload = _template_payload(await self.client.templates.get(template_id))
+            return self._store(template_id, payload, current=True)
+        async for item in self.client.templates.iter_versions(template_id):
+            if str(_version_of(item)) == str(version):
+                return self._store(template_id, {**item, "version": version}, current=False)
+        raise TemplateRenderError(f"Template {template_id} has no version {version}", 404)
+
+    async def render(
+        self, template_id: str, variables: Mapping[str, Any], version: Any = None
+    ) -> Dict[str, str]:
+        """Render a template's fields for one recipient."""
+        return (await self.get_compiled(template_id, version)).render(variables)
+
+    async def render_many(
+        self, template_id: str, recipients: Iterable[Mapping[str, Any]], version: Any = None
+    ) -> List[Dict[str, str]]:
+        """Render a template's fields for a batch of recipients, in input order."""
+        return (await self.get_compiled(template_id, version)).render_many(recipients)
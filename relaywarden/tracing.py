@@ -0,0 +1,139 @@
+"""OpenTelemetry-compatible tracing of API calls."""
+
+import re
+from typing import Any, Dict, Optional
+
+try:
+    from opentelemetry import propagate, trace
+except ImportError:  # pragma: no cover - exercised only without the extra installed
+    propagate = None  # type: ignore[assignment]
+    trace = None  # type: ignore[assignment]
+
+from relaywarden.metrics import endpoint_template
+from relaywarden.middleware import Middleware, RequestContext, is_success
+
+_REQUEST_ID_RE = re.compile(rb'"request_id"\s*:\s*"([^"]+)"')
+
+
+def format_traceparent(span_context: Any) -> str:
+    """Format a span context as a W3C ``traceparent`` header value."""
+    return "00-%032x-%016x-%02x" % (
+        span_context.trace_id,
+        span_context.span_id,
+        int(span_context.trace_flags),
+    )
+
+
+def _response_request_id(response: Any) -> Optional[str]:
+    """
+    Find the API request ID of a response without decoding its body.
+
+    Only bodies that have already been read are searched, so streamed responses
+    are left untouched.
+    """
+    headers = getattr(response, "headers", None) or {}
+    request_id = headers.get("X-Request-Id")
+    if request_id:
+        return request_id
+    # Both requests and httpx keep the loaded body on ``_content``
+    content = getattr(response, "_content", None)
+    if isinstance(content, bytes):
+        match = _REQUEST_ID_RE.search(content)
+        if match:
+            return match.group(1).decode("utf-8", "replace")
+    return None
+
+
+class TracingMiddleware(Middleware):
+    """
+    Middleware wrapping every API call in a client span.
+
+    One span covers the whole call including retries, which are recorded as span
+    events. The span is a child of the caller's current span (OpenTelemetry keeps it
+    in a context variable, so this works for threads and asyncio tasks alike) and
+    its context is sent in the ``traceparent`` header of every attempt.
+
+    Spans carry ``http.request.method``, ``url.full``, ``relaywarden.endpoint``
+    (the route template), ``http.response.status_code``, ``http.request.resend_count``
+    and ``relaywarden.request_id``.
+    """
+
+    def __init__(self, tracer: Optional[Any] = None, propagate_context: bool = True):
+        """
+        Args:
+            tracer: Tracer to create spans with (default: the global OpenTelemetry
+                tracer provider's ``relaywarden`` tracer)
+            propagate_context: Send ``traceparent`` headers to the API
+        """
+        if tracer is None:
+            if trace is None:
+                raise ImportError(
+                    "TracingMiddleware requires opentelemetry-api. "
+                    "Install it with: pip install relaywarden[tracing]"
+                )
+            tracer = trace.get_tracer("relaywarden")
+        self.tracer = tracer
+        self.propagate_context = propagate_context
+        self._span_kwargs: Dict[str, Any] = {}
+        if trace is not None:
+            self._span_kwargs["kind"] = trace.SpanKind.CLIENT
+
+    def before_request(self, ctx: RequestContext) -> None:
+        span = ctx.extras.get("tracing.span")
+        if span is None:
+            endpoint = endpoint_template(ctx.path)
+            span = ctx.extras["tracing.span"] = self.tracer.start_span(
+                f"{ctx.method} {endpoint}",
+                attributes={
+                    "http.request.method": ctx.method,
+                    "url.full": ctx.url,
+                    "relaywarden.endpoint": endpoint,
+                },
+                **self._span_kwargs,
+            )
+        elif ctx.attempt:
+            span.set_attribute("http.request.resend_count", ctx.attempt)
+
+        if self.propagate_context:
+            if propagate is not None:
+                propagate.inject(ctx.headers, context=trace.set_span_in_context(span))
+            else:
+                ctx.headers["traceparent"] = format_traceparent(span.get_span_context())
+
+    def after_response(self, ctx: RequestContext, response: Any) -> None:
+        span = ctx.extras.get("tracing.span")
+        if span is None:
+            return
+        status = response.status_code
+        span.set_attribute("http.response.status_code", status)
+        request_id = _response_request_id(response)
+        if request_id:
+            span.set_attribute("relaywarden.request_id", request_id)
+        if is_success(status):
+            ctx.extras.pop("tracing.span").end()
+
+    def on_retry(self, ctx: RequestContext, error: Exception, delay: float) -> None:
+        span = ctx.extras.get("tracing.span")
+        if span is not None:
+            span.add_event(
+                "relaywarden.retry",
+                {
+                    "relaywarden.attempt": ctx.attempt + 1,
+                    "relaywarden.retry_delay": delay,
+                    "exception.type": type(error).__name__,
+                    "exception.message": str(error),
+                },
+            )
+
+    def on_error(self, ctx: RequestContext, error: Exception) -> None:
+        span = ctx.extras.pop("tracing.span", None)
+        if span is None:
+            return
+        request_id = getattr(error, "request_id", None)
+        if request_id:
+            span.set_attribute("relaywarden.request_id", request_id)
+        span.record_exception(error)
+        if trace is not None:
+            span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
+        span.set_attribute("error.type", type(error).__name__)
+        span.end()
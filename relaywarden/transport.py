@@ -0,0 +1,186 @@
+"""HTTP transport tuning for the synchronous client."""
+
+import socket
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+_timings = threading.local()
+
+
+def start_timings() -> Dict[str, float]:
+    """
+    Start collecting connection-level timings for requests made by this thread.
+
+    While active, pooled connections add ``pool_wait``, ``connect`` (DNS and TCP)
+    and ``tls`` durations in seconds to the returned dict.
+    """
+    timings: Dict[str, float] = {}
+    _timings.current = timings
+    return timings
+
+
+def stop_timings() -> Optional[Dict[str, float]]:
+    """Stop collecting timings for this thread and return what was recorded."""
+    timings = getattr(_timings, "current", None)
+    _timings.current = None
+    return timings
+
+
+def _record_timing(name: str, seconds: float) -> None:
+    timings = getattr(_timings, "current", None)
+    if timings is not None:
+        timings[name] = timings.get(name, 0.0) + seconds
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def _new_conn(self) -> socket.socket:
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            self._tcp_seconds = time.perf_counter() - start
+            _record_timing("connect", self._tcp_seconds)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def _new_conn(self) -> socket.socket:
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            self._tcp_seconds = time.perf_counter() - start
+            _record_timing("connect", self._tcp_seconds)
+
+    def connect(self) -> None:
+        self._tcp_seconds = 0.0
+        start = time.perf_counter()
+        super().connect()
+        _record_timing("tls", time.perf_counter() - start - self._tcp_seconds)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._get_conn(timeout)
+        finally:
+            _record_timing("pool_wait", time.perf_counter() - start)
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._get_conn(timeout)
+        finally:
+            _record_timing("pool_wait", time.perf_counter() - start)
+
+
+def keepalive_socket_options(
+    idle: int = 60, interval: int = 10, count: int = 5
+) -> List[Tuple[int, int, int]]:
+    """
+    Build socket options enabling TCP keep-alive probes.
+
+    Options not supported by the current platform are skipped.
+
+    Args:
+        idle: Seconds of idleness before the first probe
+        interval: Seconds between probes
+        count: Failed probes before the connection is dropped
+    """
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    for name, value in (
+        ("TCP_KEEPIDLE", idle),
+        ("TCP_KEEPINTVL", interval),
+        ("TCP_KEEPCNT", count),
+    ):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    ``HTTPAdapter`` with configurable pooling, TCP keep-alive and pool statistics.
+
+    Its connection pools report pool wait, connect and TLS handshake times to
+    :func:`start_timings` collectors.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        tcp_keepalive: bool = False,
+    ):
+        """
+        Args:
+            pool_connections: Number of per-host pools to cache
+            pool_maxsize: Maximum connections kept per host
+            pool_block: Block when a host pool is exhausted instead of opening
+                overflow connections that are discarded after use
+            tcp_keepalive: Enable TCP keep-alive probes on pooled sockets
+        """
+        self.socket_options: Optional[List[Tuple[int, int, int]]] = (
+            keepalive_socket_options() if tcp_keepalive else None
+        )
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any
+    ) -> None:
+        if self.socket_options is not None:
+            pool_kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+    def pool_stats(self) -> List[Dict[str, Any]]:
+        """
+        Report usage of each per-host connection pool.
+
+        Returns:
+            One entry per host with ``maxsize``, ``idle`` and ``in_use`` connection
+            counts plus the lifetime ``connections_opened`` and ``requests`` totals.
+            ``connections_opened`` growing as fast as ``requests`` means connections
+            are not being reused.
+        """
+        stats = []
+        pools = self.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None or pool.pool is None:
+                continue
+            queue = pool.pool.queue
+            idle = sum(1 for conn in queue if conn is not None)
+            stats.append(
+                {
+                    "scheme": pool.scheme,
+                    "host": pool.host,
+                    "port": pool.port,
+                    "maxsize": pool.pool.maxsize,
+                    "idle": idle,
+                    "in_use": pool.pool.maxsize - len(queue),
+                    "connections_opened": pool.num_connections,
+                    "requests": pool.num_requests,
+                }
+            )
+        return stats
@@ -0,0 +1,326 @@
+"""Shared polling of message delivery status."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from relaywarden.bulk import KeyedResults
+from relaywarden.exceptions import APIError
+
+if TYPE_CHECKING:
+    from relaywarden.async_client import AsyncClient
+    from relaywarden.client import Client
+
+# Message statuses after which nothing changes any more
+TERMINAL_STATUSES = frozenset({"delivered", "bounced", "cancelled", "failed", "rejected"})
+
+
+class _Watch:
+    __slots__ = ("future", "registered_at", "next_poll_at", "deadline")
+
+    def __init__(self, future: Any, now: float, deadline: Optional[float]):
+        self.future = future
+        self.registered_at = now
+        self.next_poll_at = now
+        self.deadline = deadline
+
+
+def _settle(future: Any, result: Any, error: Optional[BaseException]) -> None:
+    """Resolve a watch's future unless the caller cancelled it meanwhile."""
+    if future.done():
+        return
+    try:
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+    except (InvalidStateError, asyncio.InvalidStateError):
+        # Cancelled by another thread between the check and the call
+        pass
+
+
+class _BaseWatcher:
+    def __init__(
+        self,
+        client: Any,
+        terminal_statuses: Iterable[str] = TERMINAL_STATUSES,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        age_factor: float = 0.2,
+        batch_size: int = 100,
+        concurrency: int = 4,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Args:
+            client: Client used for the status lookups
+            terminal_statuses: Statuses that resolve a watch
+            min_interval: Seconds between polls of a freshly sent message
+            max_interval: Upper bound of the poll interval of old messages
+            age_factor: Poll interval as a fraction of the message's time under
+                watch, e.g. 0.2 polls a message watched for 50s every 10s
+            batch_size: Ids per batch lookup request
+            concurrency: Maximum number of lookup requests in flight per poll
+            timeout: Default seconds after which a watch fails with ``TimeoutError``
+                (default: never)
+        """
+        self.client = client
+        self.terminal_statuses = frozenset(terminal_statuses)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.age_factor = age_factor
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.polls = 0
+        self._pending: Dict[str, _Watch] = {}
+        self._lock = threading.RLock()
+        self._closed = False
+        # Poll loop state: a thread and condition for DeliveryWatcher, a task and
+        # event for AsyncDeliveryWatcher
+        self._thread: Optional[threading.Thread] = None
+        self._condition = threading.Condition(self._lock)
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._event: Optional[asyncio.Event] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _register(self, message_id: str, timeout: Optional[float], new_future: Any) -> Any:
+        """Get the pending future of an id, creating it (with ``new_future``) if needed."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("DeliveryWatcher is closed")
+            watch = self._pending.get(message_id)
+            if watch is None or watch.future.done():
+                now = time.monotonic()
+                timeout = self.timeout if timeout is None else timeout
+                deadline = now + timeout if timeout is not None else None
+                watch = _Watch(new_future(), now, deadline)
+                self._pending[message_id] = watch
+            return watch.future
+
+    def _interval(self, age: float) -> float:
+        return min(self.max_interval, max(self.min_interval, age * self.age_factor))
+
+    def _due(self, now: float) -> Tuple[List[str], List[Any], Optional[float]]:
+        """
+        Collect the ids due for a poll and the watches that timed out.
+
+        Returns:
+            ``(due ids, timed-out futures, seconds until the next poll or deadline)``
+        """
+        due: List[str] = []
+        expired = []
+        wake_at = None
+        with self._lock:
+            for message_id, watch in list(self._pending.items()):
+                if watch.future.done():
+                    # Cancelled by the caller
+                    del self._pending[message_id]
+                    continue
+                if watch.deadline is not None and watch.deadline <= now:
+                    del self._pending[message_id]
+                    expired.append(watch.future)
+                    continue
+                if watch.next_poll_at <= now:
+                    due.append(message_id)
+                    continue
+                next_at = watch.next_poll_at
+                if watch.deadline is not None:
+                    next_at = min(next_at, watch.deadline)
+                wake_at = next_at if wake_at is None else min(wake_at, next_at)
+        return due, expired, (wake_at - now if wake_at is not None else None)
+
+    def _apply(
+        self, due: List[str], results: Optional[KeyedResults]
+    ) -> List[Tuple[Any, Any, Optional[BaseException]]]:
+        """
+        Resolve or reschedule polled ids.
+
+        Returns:
+            ``(future, result, exception)`` for every watch that finished
+        """
+        now = time.monotonic()
+        finished = []
+        with self._lock:
+            for message_id in due:
+                watch = self._pending.get(message_id)
+                if watch is None:
+                    continue
+                if results is not None and message_id in results:
+                    response = results[message_id]
+                    status = (response.get("data") or {}).get("status")
+                    if status in self.terminal_statuses:
+                        del self._pending[message_id]
+                        finished.append((watch.future, response, None))
+                        continue
+                else:
+                    error = results.errors.get(message_id) if results is not None else None
+                    if isinstance(error, APIError) and error.code == 404:
+                        del self._pending[message_id]
+                        finished.append((watch.future, None, error))
+                        continue
+                # Still in flight, or a transient error: poll again later
+                watch.next_poll_at = now + self._interval(now - watch.registered_at)
+        return finished
+
+
+class DeliveryWatcher(_BaseWatcher):
+    """
+    Wait for messages to reach a terminal status with one shared poll loop.
+
+    ``watch()`` returns a ``concurrent.futures.Future`` that resolves to the
+    message (the ``Messages.get`` response) once its status is terminal. A single
+    background thread polls all pending messages together through
+    ``Messages.get_many``, which batches lookups and is paced by the client's
+    ``RateLimiter``. Watching an id that is already pending returns the same
+    future. Recently sent messages are polled every ``min_interval`` seconds;
+    the interval grows with the time a message has been watched, up to
+    ``max_interval``.
+
+    Unknown messages fail with ``APIError`` (404); other errors are retried on
+    the next poll.
+    """
+
+    client: Client
+
+    def watch(self, message_id: str, timeout: Optional[float] = None) -> "Future[Dict[str, Any]]":
+        """
+        Start watching a message.
+
+        Args:
+            message_id: Message UUID
+            timeout: Seconds after which the future fails with ``TimeoutError``
+                (default: the watcher's ``timeout``)
+
+        Returns:
+            Future resolving to the message once its status is terminal
+        """
+        future = self._register(message_id, timeout, Future)
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="relaywarden-delivery-watcher", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        return future
+
+    def wait(
+        self, message_ids: Iterable[str], timeout: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Block until all messages reached a terminal status.
+
+        Raises:
+            TimeoutError: When ``timeout`` passes first
+            APIError: When a message does not exist
+        """
+        futures = {message_id: self.watch(message_id, timeout) for message_id in message_ids}
+        return {message_id: future.result() for message_id, future in futures.items()}
+
+    def close(self) -> None:
+        """Stop the poll loop and cancel all pending watches."""
+        with self._lock:
+            self._closed = True
+            pending = list(self._pending.values())
+            self._pending.clear()
+            self._condition.notify()
+            thread = self._thread
+        for watch in pending:
+            watch.future.cancel()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                # Checked under the lock so a watch() in between cannot be missed
+                if self._closed:
+                    return
+                due, expired, wait = self._due(time.monotonic())
+                if not due and not expired:
+                    self._condition.wait(wait)
+                    continue
+            for future in expired:
+                _settle(future, None, TimeoutError("Message did not reach a terminal status"))
+            if not due:
+                continue
+            self.polls += 1
+            try:
+                results = self.client.messages.get_many(due, self.concurrency, self.batch_size)
+            except Exception:
+                results = None
+            for future, result, error in self._apply(due, results):
+                _settle(future, result, error)
+
+
+class AsyncDeliveryWatcher(_BaseWatcher):
+    """
+    Asyncio counterpart of :class:`DeliveryWatcher`.
+
+    ``watch()`` returns an ``asyncio.Future`` and the poll loop runs as a task on
+    the event loop of the first ``watch()`` call.
+    """
+
+    client: AsyncClient
+
+    def watch(self, message_id: str, timeout: Optional[float] = None) -> "asyncio.Future[Any]":
+        """Start watching a message; see ``DeliveryWatcher.watch``."""
+        loop = asyncio.get_running_loop()
+        future = self._register(message_id, timeout, loop.create_future)
+        if self._task is None:
+            self._event = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        self._event.set()
+        return future
+
+    async def wait(
+        self, message_ids: Iterable[str], timeout: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Wait until all messages reached a terminal status; see ``DeliveryWatcher.wait``."""
+        futures = {message_id: self.watch(message_id, timeout) for message_id in message_ids}
+        return {message_id: await future for message_id, future in futures.items()}
+
+    async def aclose(self) -> None:
+        """Stop the poll loop and cancel all pending watches."""
+        with self._lock:
+            self._closed = True
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for watch in pending:
+            watch.future.cancel()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        event = self._event
+        while not self._closed:
+            due, expired, wait = self._due(time.monotonic())
+            for future in expired:
+                _settle(future, None, TimeoutError("Message did not reach a terminal status"))
+            if not due:
+                event.clear()
+                try:
+                    await asyncio.wait_for(event.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            self.polls += 1
+            try:
+                results = await self.client.messages.get_many(
+                    due, self.concurrency, self.batch_size
+                )
+            except Exception:
+                results = None
+            for future, result, error in self._apply(due, results):
+                _settle(future, result, error)
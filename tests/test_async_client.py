@@ -0,0 +1,163 @@
+"""Tests for the asyncio RelayWarden client."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from relaywarden import AsyncClient
+from relaywarden.exceptions import APIError, AuthenticationError, ValidationError
+from relaywarden.resources.messages import AsyncMessages
+
+
+def make_client(handler):
+    """Create an async client backed by a mock transport."""
+    return AsyncClient(
+        "https://api.relaywarden.eu/api/v1",
+        "test-token",
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def test_async_client_resources():
+    """Test lazy resource properties."""
+    client = make_client(lambda request: httpx.Response(200))
+    assert isinstance(client.messages, AsyncMessages)
+    assert client.messages is client.messages
+    asyncio.run(client.aclose())
+
+
+def test_async_messages_send():
+    """Test sending a message with scoping and idempotency headers."""
+    seen = {}
+
+    def handler(request):
+        seen["headers"] = request.headers
+        seen["body"] = json.loads(request.content)
+        return httpx.Response(
+            202,
+            json={
+                "data": {"message_id": "msg-123", "status": "accepted"},
+                "meta": {"request_id": "req-123"},
+            },
+        )
+
+    async def run():
+        async with make_client(handler) as client:
+            client.set_project_id("project-123")
+            return await client.messages.send({"subject": "Test"}, idempotency_key="key-1")
+
+    result = asyncio.run(run())
+    assert result["data"]["message_id"] == "msg-123"
+    assert seen["headers"]["Authorization"] == "Bearer test-token"
+    assert seen["headers"]["X-Project-Id"] == "project-123"
+    assert seen["headers"]["Idempotency-Key"] == "key-1"
+    assert seen["body"] == {"subject": "Test"}
+
+
+def test_async_delete_returns_none():
+    """Test that DELETE is awaited and returns None on 204."""
+    methods = []
+
+    def handler(request):
+        methods.append(request.method)
+        return httpx.Response(204)
+
+    async def run():
+        async with make_client(handler) as client:
+            return await client.domains.delete("domain-1")
+
+    assert asyncio.run(run()) is None
+    assert methods == ["DELETE"]
+
+
+def test_async_error_mapping():
+    """Test that errors are mapped like the sync client."""
+
+    def handler(request):
+        if request.method == "GET":
+            return httpx.Response(
+                401,
+                json={
+                    "error": {"code": "unauthorized", "message": "Unauthenticated"},
+                    "meta": {"request_id": "req-123"},
+                },
+            )
+        return httpx.Response(
+            422,
+            json={
+                "error": {
+                    "code": "validation_error",
+                    "message": "Validation failed",
+                    "details": [{"field": "email", "message": "Invalid email"}],
+                },
+                "meta": {"request_id": "req-456"},
+            },
+        )
+
+    async def run():
+        async with make_client(handler) as client:
+            with pytest.raises(AuthenticationError) as auth_info:
+                await client.identity.me()
+            with pytest.raises(ValidationError) as validation_info:
+                await client.messages.send({})
+            return auth_info.value, validation_info.value
+
+    auth_error, validation_error = asyncio.run(run())
+    assert auth_error.request_id == "req-123"
+    assert validation_error.details[0]["field"] == "email"
+
+
+def test_async_retries_connection_errors():
+    """Test that transient transport errors are retried."""
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) < 2:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json={"data": {"id": "me"}})
+
+    async def run():
+        async with make_client(handler) as client:
+            return await client.identity.me()
+
+    assert asyncio.run(run())["data"]["id"] == "me"
+    assert len(attempts) == 2
+
+
+def test_async_unkeyed_post_not_retried_after_read_timeout():
+    """Test that a POST without an Idempotency-Key is not repeated once it may have been sent."""
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    async def run():
+        async with make_client(handler) as client:
+            await client.post("/messages", {"subject": "Hi"})
+
+    with pytest.raises(APIError):
+        asyncio.run(run())
+    assert len(attempts) == 1
+
+
+def test_async_messages_send_many():
+    """Test concurrent bulk sending on the async client."""
+    keys = []
+
+    def handler(request):
+        keys.append(request.headers["Idempotency-Key"])
+        return httpx.Response(202, json={"data": {"message_id": "msg"}})
+
+    async def run():
+        async with make_client(handler) as client:
+            payloads = ({"subject": f"msg-{i}"} for i in range(50))
+            return [r async for r in client.messages.send_many(payloads, concurrency=8)]
+
+    results = asyncio.run(run())
+    assert len(results) == 50
+    assert all(r.ok for r in results)
+    assert len(set(keys)) == 50
@@ -0,0 +1,139 @@
+"""Tests for streamed message attachments."""
+
+import asyncio
+import base64
+import io
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from relaywarden import AsyncClient, Attachment, Client
+from relaywarden.attachments import stream_message
+
+CONTENT = bytes(range(256)) * 1000
+
+
+class Unseekable(io.RawIOBase):
+    """A pipe-like stream returning short reads."""
+
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        chunk = self._data.read(min(len(buffer), 1000))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+
+def test_attachment_sources_encode_in_chunks(tmp_path):
+    """Test paths, bytes and unseekable streams encode identically, chunk by chunk."""
+    path = tmp_path / "report.pdf"
+    path.write_bytes(CONTENT)
+    expected = base64.b64encode(CONTENT)
+
+    from_path = Attachment(str(path), chunk_size=1000)
+    assert from_path.filename == "report.pdf"
+    assert from_path.content_type == "application/pdf"
+    assert from_path.chunk_size == 999
+    assert all(len(chunk) <= 1332 for chunk in from_path.iter_base64())
+
+    for attachment in (from_path, Attachment(CONTENT), Attachment(Unseekable(CONTENT))):
+        assert attachment.size == len(CONTENT)
+        assert attachment.encoded_size == len(expected)
+        assert b"".join(attachment.iter_base64()) == expected
+
+
+def test_stream_message_body():
+    """Test the streamed body is the inline JSON message, with a known length."""
+    attachment = Attachment(CONTENT, filename="data.bin", chunk_size=3000)
+    message = {"subject": "Report", "attachments": [attachment, {"attachment_id": "a1"}]}
+
+    body = stream_message(message)
+    content = b"".join(body.content)
+
+    assert len(content) == len(body) == int(body.headers["Content-Length"])
+    assert json.loads(content) == {
+        "subject": "Report",
+        "attachments": [attachment.to_dict(), {"attachment_id": "a1"}],
+    }
+    assert stream_message({"subject": "Plain"}) == {"subject": "Plain"}
+
+
+def test_send_streams_inline_when_uploads_are_unsupported():
+    """Test a sync send falls back to an inline streamed body after a 404 upload."""
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            length = int(self.headers["Content-Length"])
+            payload = self.rfile.read(length)
+            received.append((self.path, self.headers.get("Transfer-Encoding"), payload))
+            status, body = (404, b"{}") if self.path == "/attachments" else (202, b'{"data":{}}')
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = Client(f"http://127.0.0.1:{server.server_port}", "test-token", max_retries=0)
+        attachment = Attachment(io.BytesIO(CONTENT), filename="data.bin")
+        for _ in range(2):
+            client.messages.send({"subject": "Hi", "attachments": [attachment]})
+        client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert [path for path, _, _ in received] == ["/attachments", "/messages", "/messages"]
+    assert client.messages._upload_supported is False
+    assert client.messages._batch_support == {}
+    for _, transfer_encoding, payload in received[1:]:
+        assert transfer_encoding is None
+        sent = json.loads(payload)["attachments"][0]
+        assert base64.b64decode(sent["content"]) == CONTENT
+
+
+def test_async_send_many_uploads_once():
+    """Test concurrent async sends share one upload and reference it by id."""
+    uploads = []
+    messages = []
+
+    def handler(request):
+        payload = json.loads(request.content)
+        if request.url.path.endswith("/attachments"):
+            uploads.append(payload)
+            return httpx.Response(201, json={"data": {"id": "att-1"}})
+        messages.append(payload)
+        return httpx.Response(202, json={"data": {"message_id": "m"}})
+
+    attachment = Attachment(CONTENT, filename="data.bin")
+
+    async def main():
+        async with AsyncClient(
+            "https://api.relaywarden.eu/api/v1",
+            "test-token",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            payloads = ({"subject": str(i), "attachments": [attachment]} for i in range(5))
+            return [result async for result in client.messages.send_many(payloads, 5)]
+
+    results = asyncio.run(main())
+    assert all(result.ok for result in results)
+    assert len(uploads) == 1
+    assert base64.b64decode(uploads[0]["content"]) == CONTENT
+    assert all(m["attachments"][0]["attachment_id"] == "att-1" for m in messages)
+    assert all("content" not in m["attachments"][0] for m in messages)
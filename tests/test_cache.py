@@ -0,0 +1,91 @@
+"""Tests for the response cache."""
+
+from unittest.mock import Mock, patch
+
+from relaywarden import Client, ResponseCache
+
+
+def make_client(**cache_options):
+    cache = ResponseCache(**cache_options)
+    return Client("https://api.relaywarden.eu/api/v1", "test-token", cache=cache), cache
+
+
+def make_response(status_code=200, body=b'{"data":{"id":"tpl-1"}}', headers=None):
+    response = Mock(status_code=status_code, headers=headers or {}, content=body)
+    return response
+
+
+def test_fresh_entries_skip_the_network():
+    """Test repeated reads within the TTL are served locally."""
+    client, cache = make_client()
+    with patch.object(client.session, "request", return_value=make_response()) as mock_request:
+        first = client.templates.get("tpl-1")
+        first["data"]["id"] = "mutated"
+        second = client.templates.get("tpl-1")
+
+    assert mock_request.call_count == 1
+    assert second == {"data": {"id": "tpl-1"}}
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_stale_entries_revalidate_with_etag():
+    """Test an expired entry is revalidated and a 304 reuses the cached body."""
+    client, cache = make_client(ttls={"/templates/{id}": 10})
+    with (
+        patch.object(client.session, "request") as mock_request,
+        patch("relaywarden.cache.time.monotonic") as monotonic,
+    ):
+        mock_request.side_effect = [
+            make_response(headers={"ETag": '"v1"'}),
+            make_response(304, b""),
+        ]
+        monotonic.return_value = 100.0
+        client.templates.get("tpl-1")
+        monotonic.return_value = 111.0
+        result = client.templates.get("tpl-1")
+
+    assert result == {"data": {"id": "tpl-1"}}
+    assert mock_request.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert cache.stats()["revalidations"] == 1
+
+
+def test_writes_invalidate_the_collection():
+    """Test updating a template drops cached template reads only."""
+    client, cache = make_client()
+    with patch.object(client.session, "request", return_value=make_response()) as mock_request:
+        client.templates.get("tpl-1")
+        client.senders.list()
+        client.templates.update("tpl-1", {"name": "New"})
+        client.templates.get("tpl-1")
+        client.senders.list()
+
+    assert mock_request.call_count == 4
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_uncached_endpoints_and_scoping():
+    """Test unlisted endpoints bypass the cache and scope is part of the key."""
+    client, cache = make_client(max_entries=1)
+    with patch.object(client.session, "request", return_value=make_response()) as mock_request:
+        client.messages.get("msg-1")
+        client.messages.get("msg-1")
+        client.identity.me()
+        client.set_project_id("proj-2")
+        client.identity.me()
+        client.identity.me()
+
+    assert mock_request.call_count == 4
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size"] == 1
+
+    # A project and a team with the same id value are different scopes
+    client, cache = make_client()
+    with patch.object(client.session, "request", return_value=make_response()) as mock_request:
+        client.set_project_id("shared-id")
+        client.identity.me()
+        client.set_project_id(None)
+        client.set_team_id("shared-id")
+        client.identity.me()
+
+    assert mock_request.call_count == 2
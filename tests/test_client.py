@@ -1,6 +1,9 @@
 """Tests for the RelayWarden client."""
 
 import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock, patch
 
 import pytest
@@ -129,3 +132,64 @@ def test_rate_limit_error():
             client.get("/test")
         assert exc_info.value.code == 429
         assert exc_info.value.retry_after == 60
+
+
+def test_transport_configuration():
+    """Test pool sizing, keep-alive and split timeouts."""
+    client = Client(
+        "https://api.relaywarden.eu/api/v1",
+        "test-token",
+        pool_maxsize=50,
+        pool_block=True,
+        connect_timeout=2,
+        read_timeout=15,
+        tcp_keepalive=True,
+    )
+    assert client.session.get_adapter("https://api.relaywarden.eu") is client.adapter
+    assert client.adapter._pool_maxsize == 50
+    assert client.adapter._pool_block is True
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in client.adapter.socket_options
+
+    with patch.object(client.session, "request") as mock_request:
+        mock_response = Mock()
+        mock_response.status_code = 204
+        mock_request.return_value = mock_response
+        client.delete("/test")
+    assert mock_request.call_args.kwargs["timeout"] == (2, 15)
+
+
+def test_pool_stats_report_connection_reuse():
+    """Test that pool stats show a single reused keep-alive connection."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            body = b'{"data":{}}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = Client(f"http://127.0.0.1:{server.server_port}", "test-token", pool_maxsize=4)
+        for _ in range(5):
+            client.get("/me")
+        (stats,) = client.pool_stats()
+        client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert stats["maxsize"] == 4
+    assert stats["requests"] == 5
+    assert stats["connections_opened"] == 1
+    assert stats["idle"] == 1
+    assert stats["in_use"] == 0
@@ -0,0 +1,124 @@
+"""Tests for the columnar event exporter."""
+
+import json
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from relaywarden import Client, ColumnarExporter
+from relaywarden.exceptions import APIError
+from relaywarden.export import column_type, export_events, export_timelines, flatten, read_rows
+
+
+def test_flatten_nested_records():
+    """Test nested objects become dotted columns and lists become JSON text."""
+    record = {"id": "e1", "data": {"message_id": "m1", "tags": ["a", "b"], "meta": {"x": 1}}}
+    assert flatten(record) == {
+        "id": "e1",
+        "data.message_id": "m1",
+        "data.tags": '["a","b"]',
+        "data.meta.x": 1,
+    }
+
+
+def test_exporter_partitions_by_day_with_bounded_buffers(tmp_path):
+    """Test records land in per-day part files, flushed whenever a buffer fills."""
+    directory = str(tmp_path / "events")
+    with ColumnarExporter(directory, format="jsonl", batch_size=2) as exporter:
+        exporter.extend(
+            {"id": f"e{i}", "created_at": f"2024-01-0{1 + i % 2}T10:00:00Z", "data": {"n": i}}
+            for i in range(5)
+        )
+        assert exporter._buffered <= 2
+
+    summary = exporter.summary
+    assert summary.rows == 5
+    assert sorted(summary.partitions) == ["2024-01-01", "2024-01-02"]
+    assert len(summary.files) == 3
+    rows = [row for path in summary.files for row in read_rows(path)]
+    assert sorted(row["id"] for row in rows) == ["e0", "e1", "e2", "e3", "e4"]
+    assert all(
+        os.path.basename(os.path.dirname(path)) == f"date={row['created_at'][:10]}"
+        for path in summary.files
+        for row in read_rows(path)
+    )
+
+
+def test_csv_export_tracks_schema_evolution(tmp_path):
+    """Test later columns are added to later files and recorded in the schema file."""
+    directory = str(tmp_path / "events")
+    first = {"id": "e1", "created_at": "2024-01-01T00:00:00Z", "type": "sent"}
+    second = {"id": "e2", "created_at": "2024-01-01T00:00:01Z", "data": {"code": 550}}
+    with ColumnarExporter(directory, format="csv", batch_size=1) as exporter:
+        exporter.add(first)
+        exporter.add(second)
+
+    first_file, second_file = exporter.summary.files
+    assert list(read_rows(first_file)[0]) == ["id", "created_at", "type"]
+    assert read_rows(second_file)[0] == {
+        "id": "e2",
+        "created_at": "2024-01-01T00:00:01Z",
+        "data.code": "550",
+    }
+    with open(os.path.join(directory, "_schema.json")) as f:
+        schema = json.load(f)
+    assert schema["columns"]["data.code"] == ["int"]
+    assert list(schema["columns"]) == ["id", "created_at", "type", "data.code"]
+
+
+def test_column_type_promotion():
+    """Test the type a column is stored as once its values mix types."""
+    assert column_type([]) is None
+    assert column_type(["int"]) == "int"
+    assert column_type(["int", "float"]) == "float"
+    assert column_type(["bool", "int"]) == "str"
+    assert column_type(["str", "float"]) == "str"
+
+
+def test_parquet_parts_share_promoted_types(tmp_path):
+    """Test parts written after a column's types mix use the promoted type."""
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+    directory = str(tmp_path / "events")
+    records = [
+        {"id": "e1", "created_at": "2024-01-01T10:00:00Z", "n": 1, "flag": True},
+        {"id": "e2", "created_at": "2024-01-01T10:00:00Z", "n": 2.5, "flag": "yes"},
+        {"id": "e3", "created_at": "2024-01-01T10:00:00Z", "n": 3, "flag": False},
+    ]
+    with ColumnarExporter(directory, format="parquet", batch_size=1) as exporter:
+        exporter.extend(records)
+
+    schemas = [pyarrow_parquet.read_schema(path) for path in exporter.summary.files]
+    assert str(schemas[1].field("n").type) == str(schemas[2].field("n").type) == "double"
+    assert str(schemas[1].field("flag").type) == str(schemas[2].field("flag").type) == "string"
+
+
+def test_export_events_and_timelines(tmp_path):
+    """Test the helpers stream events and tag timeline entries with their message."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    client.events.list_all = Mock(
+        return_value=iter([{"id": "e1", "created_at": "2024-01-01T00:00:00Z"}])
+    )
+
+    def get_timeline(message_id):
+        if message_id == "m2":
+            raise APIError("Not found", 404)
+        return {"data": [{"status": "delivered", "timestamp": "2024-01-03T00:00:00Z"}]}
+
+    client.messages.get_timeline = Mock(side_effect=get_timeline)
+
+    events = export_events(client, str(tmp_path / "events"), {"type": "bounced"}, format="jsonl")
+    assert events.rows == 1
+    client.events.list_all.assert_called_once_with({"type": "bounced"}, 100, prefetch=True)
+
+    timelines = export_timelines(client, ["m1", "m2"], str(tmp_path / "tl"), format="jsonl")
+    assert timelines.partitions == ["2024-01-03"]
+    assert read_rows(timelines.files[0])[0]["message_id"] == "m1"
+    assert [result.item for result in timelines.failed] == ["m2"]
+
+
+def test_parquet_requires_pyarrow(tmp_path, monkeypatch):
+    """Test the columnar formats explain how to install pyarrow."""
+    monkeypatch.setattr("relaywarden.export.pyarrow", None)
+    with pytest.raises(ImportError, match="relaywarden\\[export\\]"):
+        ColumnarExporter(str(tmp_path), format="parquet")
@@ -0,0 +1,113 @@
+"""Tests for incremental following of events and audit logs."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import httpx
+
+from relaywarden import AsyncClient, Client
+from relaywarden.checkpoint import MemoryCheckpointStore
+from relaywarden.follow import Follower
+
+
+def list_response(items):
+    """Build a mock single-page list response."""
+    response = Mock()
+    response.status_code = 200
+    response.content = b"{}"
+    response.json.return_value = {
+        "data": items,
+        "meta": {"current_page": 1, "last_page": 1},
+    }
+    return response
+
+
+def event(event_id, created_at):
+    return {"id": event_id, "created_at": f"2024-01-01T00:00:{created_at:02d}Z"}
+
+
+def test_tail_yields_only_new_events_and_persists_high_water_mark():
+    """Test tail() asks for events since the checkpoint and dedupes the boundary."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    store = MemoryCheckpointStore()
+    polls = [
+        [event("e2", 2), event("e1", 1), event("e2", 2)],
+        # The API returns the boundary event again alongside a new one
+        [event("e2", 2), event("e3", 2)],
+        [],
+    ]
+    with patch.object(client.session, "request") as mock_request:
+        mock_request.side_effect = lambda *args, **kwargs: list_response(polls.pop(0))
+        first = client.events.tail(store, {"type": "delivered"}, since="2024-01-01T00:00:00Z")
+        second = client.events.tail(store, {"type": "delivered"})
+        third = client.events.tail(store, {"type": "delivered"})
+
+    assert [e["id"] for e in first] == ["e1", "e2"]
+    assert [e["id"] for e in second] == ["e3"]
+    assert third == []
+    params = [c.kwargs["params"] for c in mock_request.call_args_list]
+    assert params[0]["created_after"] == "2024-01-01T00:00:00Z"
+    assert params[1]["created_after"] == "2024-01-01T00:00:02Z"
+    assert params[1]["type"] == "delivered"
+
+
+def test_follow_streams_page_by_page():
+    """Test items are yielded before later pages are fetched, deduped across pages."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    pages = [
+        (1, [event("e1", 1), event("e2", 2)]),
+        # e2 shifted onto the next page by an insert while paging
+        (2, [event("e2", 2), event("e3", 3)]),
+    ]
+
+    def page_response(*args, **kwargs):
+        current_page, items = pages.pop(0)
+        response = list_response(items)
+        response.json.return_value["meta"] = {"current_page": current_page, "last_page": 2}
+        return response
+
+    follower = Follower(client, "/events", since="2024-01-01T00:00:00Z")
+    with patch.object(client.session, "request", side_effect=page_response) as mock_request:
+        items = follower.iter_poll()
+        assert next(items)["id"] == "e1"
+        assert mock_request.call_count == 1
+        assert [e["id"] for e in items] == ["e2", "e3"]
+
+    assert follower.high_water == "2024-01-01T00:00:03Z"
+    # Only the ids at the boundary timestamp are kept for de-duplication
+    assert follower._boundary_ids == {"e3"}
+    assert follower.interval == follower.min_interval
+
+
+def test_follow_adapts_poll_interval():
+    """Test the poll interval backs off while idle and resets when events arrive."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    polls = [[event("e1", 1)], [], [], [event("e2", 2)]]
+    with (
+        patch.object(client.session, "request") as mock_request,
+        patch("relaywarden.follow.time.sleep") as sleep,
+    ):
+        mock_request.side_effect = lambda *args, **kwargs: list_response(polls.pop(0))
+        stream = client.audit_logs.follow(min_interval=1, max_interval=3)
+        assert [next(stream)["id"], next(stream)["id"]] == ["e1", "e2"]
+
+    assert [c.args[0] for c in sleep.call_args_list] == [1, 2, 3]
+
+
+def test_async_follow():
+    """Test the async follower yields new events across polls."""
+    polls = [[event("e1", 1)], [event("e1", 1), event("e2", 3)]]
+
+    def handler(request):
+        return httpx.Response(200, json={"data": polls.pop(0), "meta": {}})
+
+    async def main():
+        async with AsyncClient(
+            "https://api.relaywarden.eu/api/v1",
+            "test-token",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            stream = client.events.follow(since="2024-01-01T00:00:00Z", min_interval=0)
+            return [(await stream.__anext__())["id"], (await stream.__anext__())["id"]]
+
+    assert asyncio.run(main()) == ["e1", "e2"]
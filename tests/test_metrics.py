@@ -0,0 +1,125 @@
+"""Tests for request metrics."""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from relaywarden import AsyncClient, Client, InMemoryMetrics
+from relaywarden.exceptions import RateLimitError
+from relaywarden.metrics import Histogram, endpoint_template
+
+
+def test_endpoint_template_collapses_ids():
+    """Test that IDs are replaced by placeholders."""
+    assert endpoint_template("/messages/5f0c1d2e-aaaa/timeline") == "/messages/{id}/timeline"
+    assert endpoint_template("/webhooks/endpoints/ep-1/deliveries") == (
+        "/webhooks/endpoints/{id}/deliveries"
+    )
+    assert endpoint_template("/suppressions/export") == "/suppressions/export"
+
+
+def test_histogram_percentiles():
+    """Test bucket-interpolated percentiles stay within observed bounds."""
+    histogram = Histogram()
+    for value in [0.02] * 98 + [1.5, 2.0]:
+        histogram.add(value)
+    assert 0.01 <= histogram.percentile(50) <= 0.025
+    assert histogram.percentile(100) == 2.0
+    assert histogram.summary()["count"] == 100
+
+
+def test_retries_and_rate_limits_are_counted():
+    """Test counters and per-endpoint tags on a retried call."""
+    metrics = InMemoryMetrics()
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token", metrics=metrics)
+
+    limited = Mock(status_code=429, headers={"Retry-After": "40"}, content=b"")
+    ok = Mock(status_code=200, headers={}, content=b'{"data":{}}')
+    ok.json.return_value = {"data": {}}
+    with (
+        patch.object(client.session, "request") as mock_request,
+        patch("relaywarden.client.time.sleep"),
+    ):
+        mock_request.side_effect = [Mock(status_code=503, headers={}, content=b""), ok]
+        client.get("/messages/msg-1")
+
+        mock_request.side_effect = [limited]
+        with pytest.raises(RateLimitError):
+            client.get("/messages/msg-2")
+
+    assert metrics.counter("relaywarden.retries", endpoint="/messages/{id}") == 1
+    assert metrics.counter("relaywarden.rate_limited") == 1
+    assert metrics.counter("relaywarden.errors", status="429") == 1
+    calls = metrics.histogram(
+        "relaywarden.request.duration", method="GET", endpoint="/messages/{id}", status="200"
+    )
+    assert calls.count == 1
+    attempts = metrics.histogram(
+        "relaywarden.attempt.duration", method="GET", endpoint="/messages/{id}"
+    )
+    assert attempts.count == 3
+    (in_flight,) = metrics.snapshot()["gauges"]
+    assert in_flight["value"] == 0
+
+
+def test_async_client_with_unstreamed_responses():
+    """Test httpx responses whose elapsed time is unknown are still recorded."""
+    metrics = InMemoryMetrics()
+
+    async def main():
+        async with AsyncClient(
+            "https://api.relaywarden.eu/api/v1",
+            "test-token",
+            metrics=metrics,
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})),
+        ) as client:
+            await client.get("/messages/msg-1")
+
+    asyncio.run(main())
+    calls = metrics.histogram(
+        "relaywarden.request.duration", method="GET", endpoint="/messages/{id}", status="200"
+    )
+    assert calls.count == 1
+    assert metrics.histogram("relaywarden.ttfb", method="GET", endpoint="/messages/{id}") is None
+
+
+def test_connection_phases_and_bytes_against_local_server():
+    """Test connect, pool wait, TTFB and byte counters over a real socket."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            body = b'{"data":{"message_id":"msg-1"}}'
+            self.send_response(202)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    metrics = InMemoryMetrics()
+    try:
+        client = Client(f"http://127.0.0.1:{server.server_port}", "test-token", metrics=metrics)
+        client.messages.send({"subject": "Hello"})
+        client.messages.send({"subject": "Hello"})
+        client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    tags = {"method": "POST", "endpoint": "/messages"}
+    assert metrics.histogram("relaywarden.connect", **tags).count == 1
+    assert metrics.histogram("relaywarden.pool_wait", **tags).count == 2
+    assert metrics.histogram("relaywarden.ttfb", **tags).count == 2
+    assert metrics.counter("relaywarden.bytes_sent") == 2 * len(b'{"subject": "Hello"}')
+    assert metrics.counter("relaywarden.bytes_received") == 2 * 31
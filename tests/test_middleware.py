@@ -0,0 +1,114 @@
+"""Tests for the request pipeline and middleware hooks."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from relaywarden import AsyncClient, Client, Middleware
+from relaywarden.exceptions import APIError
+
+
+class RecordingMiddleware(Middleware):
+    """Middleware recording every hook invocation."""
+
+    def __init__(self):
+        self.calls = []
+
+    def before_request(self, ctx):
+        self.calls.append(("before_request", ctx.method, ctx.path, ctx.attempt))
+        ctx.headers["X-Trace"] = "trace-1"
+
+    def after_response(self, ctx, response):
+        self.calls.append(("after_response", response.status_code))
+
+    def on_retry(self, ctx, error, delay):
+        self.calls.append(("on_retry", ctx.attempt))
+
+    def on_error(self, ctx, error):
+        self.calls.append(("on_error", error.code))
+
+
+def mock_response(status_code):
+    """Create a mock response."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = {}
+    response.content = b'{"data":{}}'
+    response.json.return_value = {"data": {}}
+    return response
+
+
+def test_hooks_run_for_every_attempt():
+    """Test hook order across a retried GET."""
+    recorder = RecordingMiddleware()
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token", middleware=[recorder])
+    with (
+        patch.object(client.session, "request") as mock_request,
+        patch("relaywarden.client.time.sleep"),
+    ):
+        mock_request.side_effect = [mock_response(503), mock_response(200)]
+        client.get("/messages/msg-1")
+
+    assert recorder.calls == [
+        ("before_request", "GET", "/messages/msg-1", 0),
+        ("after_response", 503),
+        ("on_retry", 0),
+        ("before_request", "GET", "/messages/msg-1", 1),
+        ("after_response", 200),
+    ]
+    assert mock_request.call_args.kwargs["headers"]["X-Trace"] == "trace-1"
+
+
+def test_on_error_runs_once_before_raising():
+    """Test that on_error sees the final error."""
+    recorder = RecordingMiddleware()
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    client.add_middleware(recorder)
+    with patch.object(client.session, "request") as mock_request:
+        mock_request.return_value = mock_response(500)
+        with pytest.raises(APIError):
+            client.post("/messages", {})
+
+    assert recorder.calls[-1] == ("on_error", 500)
+
+
+def test_scope_headers_are_cached_and_refreshed():
+    """Test that scoping headers follow project/team changes."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    with patch.object(client.session, "request") as mock_request:
+        mock_request.return_value = mock_response(200)
+        client.get("/me")
+        assert mock_request.call_args.kwargs["headers"] == {}
+
+        client.set_project_id("project-123")
+        client.team_id = "team-1"
+        client.get("/me")
+        assert mock_request.call_args.kwargs["headers"] == {
+            "X-Project-Id": "project-123",
+            "X-Team-Id": "team-1",
+        }
+
+
+def test_async_client_runs_middleware():
+    """Test that the async pipeline calls the same hooks."""
+    recorder = RecordingMiddleware()
+    seen = {}
+
+    def handler(request):
+        seen["trace"] = request.headers.get("X-Trace")
+        return httpx.Response(200, json={"data": {}})
+
+    async def run():
+        async with AsyncClient(
+            "https://api.relaywarden.eu/api/v1",
+            "test-token",
+            middleware=[recorder],
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            await client.identity.me()
+
+    asyncio.run(run())
+    assert recorder.calls == [("before_request", "GET", "/me", 0), ("after_response", 200)]
+    assert seen["trace"] == "trace-1"
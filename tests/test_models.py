@@ -0,0 +1,88 @@
+"""Tests for typed response models."""
+
+import asyncio
+import sys
+
+import pytest
+
+from relaywarden.models import (
+    Domain,
+    Event,
+    Message,
+    ModelList,
+    async_iter_models,
+    iter_models,
+    parse,
+)
+
+MESSAGE = {
+    "id": "m1",
+    "status": "delivered",
+    "subject": "Hello",
+    "from": {"email": "noreply@example.com", "name": "Acme"},
+    "to": [{"email": "user@example.com"}],
+    "provider": {"name": "ses"},
+}
+
+
+def test_eager_model_fields_and_round_trip():
+    """Test fields, keyword renames, nested models, unknown keys and to_dict."""
+    message = Message(MESSAGE)
+
+    assert message.id == "m1"
+    assert message.from_.email == "noreply@example.com"
+    assert message.to[0].email == "user@example.com"
+    assert message.cc is None
+    assert message["provider"] == {"name": "ses"}
+    assert message.get("missing", "default") == "default"
+    assert message.to_dict() == MESSAGE
+    assert not hasattr(message, "__dict__")
+    with pytest.raises(AttributeError):
+        message.unknown
+
+
+def test_lazy_model_decodes_fields_on_first_read():
+    """Test lazy models keep the record and only decode fields that are read."""
+    record = {"id": "d1", "dns_records": [{"type": "TXT", "value": "v=spf1"}]}
+    domain = Domain(record, lazy=True)
+
+    with pytest.raises(AttributeError):
+        object.__getattribute__(domain, "dns_records")
+    assert isinstance(domain.dns_records, ModelList)
+    assert domain.dns_records[0].type == "TXT"
+    assert domain.to_dict() == record
+    assert domain == Domain(record)
+
+
+def test_parse_list_response_decodes_items_on_access():
+    """Test list envelopes become a ModelList that decodes items when read."""
+    page = parse({"data": [MESSAGE, {**MESSAGE, "id": "m2"}], "meta": {}}, Message)
+
+    assert len(page) == 2
+    assert page._decoded == [None, None]
+    assert page[1].id == "m2"
+    assert page._decoded[0] is None
+    assert page.to_list()[1]["id"] == "m2"
+    assert parse({"data": MESSAGE}, Message).status == "delivered"
+    assert parse(None, Message) is None
+
+
+def test_models_are_smaller_than_dicts():
+    """Test an eager slotted model takes less memory than its source dict."""
+    record = {"id": "e1", "type": "delivered", "message_id": "m1", "created_at": "2024"}
+    assert sys.getsizeof(Event(record)) < sys.getsizeof(dict(record))
+
+
+def test_iter_models():
+    """Test sync and async iterators wrap each record."""
+    events = [{"id": "e1", "type": "bounced"}, {"id": "e2", "type": "opened"}]
+    assert [event.type for event in iter_models(iter(events), Event)] == ["bounced", "opened"]
+
+    async def records():
+        for event in events:
+            yield event
+
+    async def main():
+        return [event.id async for event in async_iter_models(records(), Event, lazy=False)]
+
+    assert asyncio.run(main()) == ["e1", "e2"]
@@ -0,0 +1,134 @@
+"""Tests for the durable message outbox."""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+from relaywarden import AsyncClient, AsyncOutbox, Client, Outbox
+from relaywarden.exceptions import APIError, ValidationError
+
+
+def recorder(fail=None):
+    """Fake ``Messages.send`` recording (payload, key), failing with ``fail(payload)``."""
+    sent = []
+
+    def send(data, idempotency_key=None):
+        payload = json.loads(data)
+        error = fail(payload) if fail else None
+        if error is not None:
+            raise error
+        sent.append((payload, idempotency_key))
+        return {"data": {"message_id": idempotency_key}}
+
+    return send, sent
+
+
+def test_send_returns_at_once_and_flusher_delivers(tmp_path):
+    """Test queued messages are sent in the background with their idempotency keys."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    send, sent = recorder()
+    client.messages.send = Mock(side_effect=send)
+    confirmed = []
+
+    with Outbox(
+        client, str(tmp_path / "outbox.db"), on_sent=lambda k, r: confirmed.append(k)
+    ) as outbox:
+        keys = [outbox.send({"subject": f"msg-{i}"}) for i in range(10)]
+        assert outbox.send({"subject": "msg-0"}, idempotency_key=keys[0]) == keys[0]
+        assert outbox.drain(timeout=5)
+        assert outbox.pending() == 0
+
+    assert sorted(key for _, key in sent) == sorted(keys)
+    assert sorted(confirmed) == sorted(keys)
+    assert len(sent) == 10
+
+
+def test_transient_errors_retry_and_permanent_errors_are_kept(tmp_path):
+    """Test 5xx errors back off and retry, 422s are kept as failed and 409s count as sent."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    attempts = {"flaky": 0}
+
+    def fail(payload):
+        if payload["subject"] == "invalid":
+            return ValidationError("Invalid recipient")
+        if payload["subject"] == "duplicate":
+            return APIError("Idempotency key already used", 409)
+        if payload["subject"] == "flaky" and attempts["flaky"] < 2:
+            attempts["flaky"] += 1
+            return APIError("Unavailable", 503)
+        return None
+
+    send, sent = recorder(fail)
+    client.messages.send = Mock(side_effect=send)
+    given_up = []
+    confirmed = []
+
+    outbox = Outbox(
+        client,
+        str(tmp_path / "outbox.db"),
+        min_backoff=0.01,
+        on_sent=lambda key, response: confirmed.append(key),
+        on_failed=lambda key, error: given_up.append(key),
+    )
+    outbox.send({"subject": "flaky"}, "k-flaky")
+    outbox.send({"subject": "invalid"}, "k-invalid")
+    outbox.send({"subject": "duplicate"}, "k-duplicate")
+    assert outbox.drain(timeout=5)
+
+    assert [key for _, key in sent] == ["k-flaky"]
+    assert sorted(confirmed) == ["k-duplicate", "k-flaky"]
+    assert given_up == ["k-invalid"]
+    (failed,) = outbox.failed()
+    assert failed["message"] == {"subject": "invalid"}
+    assert "Invalid recipient" in failed["error"]
+
+    assert outbox.retry_failed(["k-invalid"]) == 1
+    assert outbox.pending() == 1
+    outbox.close()
+
+
+def test_unsent_messages_resume_after_restart(tmp_path):
+    """Test messages still stored when an outbox closes are sent by the next one."""
+    path = str(tmp_path / "outbox.db")
+    down = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    down.messages.send = Mock(side_effect=APIError("Request failed", 0))
+    first = Outbox(down, path, min_backoff=0.01, max_backoff=0.01)
+    keys = [first.send({"subject": f"msg-{i}"}) for i in range(3)]
+    deadline = time.monotonic() + 5
+    while down.messages.send.call_count < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    first.close()
+
+    up = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    send, sent = recorder()
+    up.messages.send = Mock(side_effect=send)
+    with Outbox(up, path) as second:
+        assert second.drain(timeout=5)
+    assert sorted(key for _, key in sent) == sorted(keys)
+
+
+def test_async_outbox(tmp_path):
+    """Test the asyncio outbox drains through its flusher task, calling back on the loop."""
+    send, sent = recorder()
+    callback_threads = set()
+
+    async def async_send(data, idempotency_key=None):
+        return send(data, idempotency_key)
+
+    async def main():
+        async with AsyncClient("https://api.relaywarden.eu/api/v1", "test-token") as client:
+            client.messages.send = async_send
+            async with AsyncOutbox(
+                client,
+                str(tmp_path / "outbox.db"),
+                on_sent=lambda key, response: callback_threads.add(threading.get_ident()),
+            ) as outbox:
+                keys = [await outbox.send({"subject": f"msg-{i}"}) for i in range(5)]
+                assert await outbox.drain(timeout=5)
+                return keys
+
+    keys = asyncio.run(main())
+    assert sorted(key for _, key in sent) == sorted(keys)
+    assert callback_threads == {threading.get_ident()}
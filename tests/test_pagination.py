@@ -0,0 +1,105 @@
+"""Tests for lazy pagination."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import httpx
+
+from relaywarden import AsyncClient, Client
+
+
+def page_response(page, last_page=3, per_page=2):
+    """Build a mock list response for one page."""
+    response = Mock()
+    response.status_code = 200
+    response.content = b"{}"
+    response.json.return_value = {
+        "data": [{"id": f"evt-{page}-{i}"} for i in range(per_page)],
+        "meta": {"current_page": page, "last_page": last_page, "per_page": per_page},
+    }
+    return response
+
+
+def test_list_passes_filters_as_query_params():
+    """Test that list() no longer drops filters."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    with patch.object(client.session, "request") as mock_request:
+        mock_request.return_value = page_response(1, last_page=1)
+        client.messages.list({"status": "delivered", "per_page": 25})
+
+    assert mock_request.call_args.kwargs["params"] == {"status": "delivered", "per_page": 25}
+
+
+def test_list_all_walks_every_page():
+    """Test that list_all() requests pages lazily until last_page."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    with patch.object(client.session, "request") as mock_request:
+        mock_request.side_effect = lambda method, url, params=None, **kw: page_response(
+            params["page"]
+        )
+        items = client.events.list_all({"type": "delivered"}, per_page=2)
+
+        first = next(items)
+        assert first["id"] == "evt-1-0"
+        assert mock_request.call_count == 1
+
+        rest = list(items)
+
+    assert len(rest) == 5
+    assert mock_request.call_count == 3
+    params = [c.kwargs["params"] for c in mock_request.call_args_list]
+    assert params[2] == {"type": "delivered", "per_page": 2, "page": 3}
+
+
+def test_list_all_with_prefetch():
+    """Test that prefetching yields the same items in order."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    with patch.object(client.session, "request") as mock_request:
+        mock_request.side_effect = lambda method, url, params=None, **kw: page_response(
+            params["page"], last_page=4
+        )
+        ids = [item["id"] for item in client.audit_logs.list_all(prefetch=True)]
+
+    assert ids == [f"evt-{p}-{i}" for p in range(1, 5) for i in range(2)]
+    assert mock_request.call_count == 4
+
+
+def test_list_all_single_page_without_meta():
+    """Test endpoints that return no pagination meta."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    with patch.object(client.session, "request") as mock_request:
+        response = Mock()
+        response.status_code = 200
+        response.content = b"{}"
+        response.json.return_value = {"data": [{"id": "dom-1"}]}
+        mock_request.return_value = response
+
+        assert [d["id"] for d in client.domains.list_all()] == ["dom-1"]
+    assert mock_request.call_count == 1
+
+
+def test_async_list_all_with_prefetch():
+    """Test async pagination with background prefetch."""
+    pages = []
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        pages.append(page)
+        return httpx.Response(
+            200,
+            json={
+                "data": [{"id": f"msg-{page}"}],
+                "meta": {"current_page": page, "last_page": 3},
+            },
+        )
+
+    async def run():
+        async with AsyncClient(
+            "https://api.relaywarden.eu/api/v1",
+            "test-token",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            return [m["id"] async for m in client.messages.list_all(prefetch=True)]
+
+    assert asyncio.run(run()) == ["msg-1", "msg-2", "msg-3"]
+    assert sorted(pages) == [1, 2, 3]
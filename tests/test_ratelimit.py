@@ -0,0 +1,98 @@
+"""Tests for the adaptive rate limiter."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import httpx
+
+from relaywarden import AsyncClient, Client, RateLimiter
+
+
+def test_paces_requests_over_the_window():
+    """Test that the remaining quota is spread evenly until the reset."""
+    limiter = RateLimiter(reserve=0)
+    with patch("relaywarden.ratelimit.time.monotonic", return_value=100.0):
+        limiter.update(
+            {"X-RateLimit-Limit": "60", "X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "5"}
+        )
+        delays = [limiter.reserve_delay() for _ in range(4)]
+
+    assert delays == [0.0, 0.5, 1.0, 1.5]
+    assert limiter.remaining == 6
+
+
+def test_waits_for_reset_when_quota_is_exhausted():
+    """Test that an exhausted quota delays until the window resets."""
+    limiter = RateLimiter(reserve=1)
+    with patch("relaywarden.ratelimit.time.monotonic", return_value=100.0):
+        limiter.update({"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "7"})
+        assert limiter.reserve_delay() == 7.0
+
+
+def test_no_delay_without_rate_limit_headers():
+    """Test that the limiter is a no-op until the server reports a quota."""
+    limiter = RateLimiter()
+    limiter.update({})
+    assert limiter.reserve_delay() == 0
+
+
+def test_update_from_limits_payload():
+    """Test priming the limiter from Usage.get_limits()."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token", rate_limiter=RateLimiter())
+    with patch.object(client.session, "request") as mock_request:
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = b"{}"
+        mock_response.json.return_value = {
+            "data": {"rate_limit": {"limit": 600, "remaining": 42, "reset": 30}}
+        }
+        mock_request.return_value = mock_response
+        client.usage.get_limits()
+
+    assert client.rate_limiter.limit == 600
+    assert client.rate_limiter.remaining == 42
+
+
+def test_client_consults_limiter_and_learns_from_headers():
+    """Test that the sync client acquires before and updates after each request."""
+    limiter = RateLimiter()
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token", rate_limiter=limiter)
+    with (
+        patch.object(client.session, "request") as mock_request,
+        patch.object(limiter, "acquire") as mock_acquire,
+    ):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "99"}
+        mock_response.content = b"{}"
+        mock_response.json.return_value = {}
+        mock_request.return_value = mock_response
+        client.get("/me")
+
+    mock_acquire.assert_called_once()
+    assert limiter.remaining == 99
+
+
+def test_limiter_shared_with_async_client():
+    """Test that one limiter instance also paces the async client."""
+    limiter = RateLimiter()
+
+    def handler(request):
+        return httpx.Response(
+            200,
+            headers={"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "50"},
+            json={"data": {}},
+        )
+
+    async def run():
+        async with AsyncClient(
+            "https://api.relaywarden.eu/api/v1",
+            "test-token",
+            rate_limiter=limiter,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            await client.identity.me()
+
+    asyncio.run(run())
+    assert limiter.remaining == 50
@@ -0,0 +1,140 @@
+"""Tests for the webhook delivery reconciler."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+from relaywarden import (
+    AsyncClient,
+    AsyncWebhookReconciler,
+    Client,
+    FileCheckpointStore,
+    WebhookReconciler,
+)
+from relaywarden.checkpoint import MemoryCheckpointStore
+from relaywarden.exceptions import APIError
+
+DELIVERIES = {
+    "ep-1": [
+        {"id": "d1", "event_id": "e1", "status": "failed", "created_at": "2024-01-01T00:00:01Z"},
+        {"id": "d2", "event_id": "e1", "status": "failed", "created_at": "2024-01-01T00:00:02Z"},
+        {"id": "d3", "event_id": "e2", "status": "failed", "created_at": "2024-01-01T00:00:03Z"},
+        {"id": "d4", "event_id": "e2", "status": "delivered", "created_at": "2024-01-01T00:00:04Z"},
+    ],
+    "ep-2": [
+        {"id": "d5", "event_id": "e3", "status": "failed", "created_at": "2024-01-01T00:00:05Z"},
+        {"id": "d6", "event_id": "e4", "status": "pending", "created_at": "2024-01-01T00:00:06Z"},
+        {"id": "d7", "event_id": "e5", "status": "delivered", "created_at": "2024-01-01T00:00:07Z"},
+    ],
+}
+
+
+def make_client():
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    client.webhooks.iter_endpoints = Mock(return_value=iter([{"id": "ep-1"}, {"id": "ep-2"}]))
+    client.webhooks.iter_deliveries = Mock(
+        side_effect=lambda endpoint_id, filters, *args, **kwargs: iter(DELIVERIES[endpoint_id])
+    )
+    client.webhooks.replay_delivery = Mock(return_value={"data": {}})
+    return client
+
+
+def test_replays_latest_failed_delivery_of_missed_events():
+    """Test only events without a success or pending attempt are replayed, once each."""
+    client = make_client()
+    report = WebhookReconciler(client).run()
+
+    replayed = sorted(call.args[0] for call in client.webhooks.replay_delivery.call_args_list)
+    assert replayed == ["d2", "d5"]
+    assert report.scanned == 7
+    assert report.endpoints == 2
+    assert report.ok
+
+
+def test_dry_run_does_not_replay():
+    """Test find_missed reports missed deliveries without replaying them."""
+    client = make_client()
+    report = WebhookReconciler(client).find_missed()
+
+    assert sorted(d["id"] for d in report.missed) == ["d2", "d5"]
+    client.webhooks.replay_delivery.assert_not_called()
+
+
+def test_checkpoint_stops_before_unsettled_deliveries(tmp_path):
+    """Test reruns start after settled deliveries and retry failed replays."""
+    client = make_client()
+
+    def replay(delivery_id):
+        if delivery_id == "d5":
+            raise APIError("Replay failed", 500)
+        return {"data": {}}
+
+    client.webhooks.replay_delivery.side_effect = replay
+    store = FileCheckpointStore(str(tmp_path / "checkpoint.json"))
+    report = WebhookReconciler(client, checkpoint=store).run()
+
+    assert [result.item["id"] for result in report.failed] == ["d5"]
+    states = FileCheckpointStore(store.path).load("webhook-reconciler")["endpoints"]
+    assert states["ep-1"]["cursor"] == "2024-01-01T00:00:04Z"
+    assert states["ep-1"]["replayed"] == {}
+    # d5's replay failed, so ep-2 has nothing settled before it
+    assert states["ep-2"]["cursor"] is None
+
+    client.webhooks.iter_endpoints.return_value = iter([{"id": "ep-1"}, {"id": "ep-2"}])
+    WebhookReconciler(client, checkpoint=store).run()
+    filters = {
+        call.args[0]: call.args[1] for call in client.webhooks.iter_deliveries.call_args_list[2:]
+    }
+    # The cursor's own timestamp is scanned again
+    assert filters == {"ep-1": {"created_after": "2024-01-01T00:00:03Z"}, "ep-2": {}}
+
+
+def test_late_delivery_at_the_cursor_timestamp_is_not_skipped():
+    """Test a delivery created at the cursor's timestamp after a run is still found."""
+    client = make_client()
+    store = MemoryCheckpointStore()
+    WebhookReconciler(client, checkpoint=store).run()
+    assert store.load("webhook-reconciler")["endpoints"]["ep-1"]["ids"] == ["d4"]
+
+    late = {"id": "d8", "event_id": "e6", "status": "failed", "created_at": "2024-01-01T00:00:04Z"}
+    client.webhooks.iter_endpoints.return_value = iter([{"id": "ep-1"}])
+    client.webhooks.iter_deliveries.side_effect = lambda *args, **kwargs: iter(
+        DELIVERIES["ep-1"] + [late]
+    )
+    client.webhooks.replay_delivery.reset_mock()
+    report = WebhookReconciler(client, checkpoint=store).run()
+
+    assert [d["id"] for d in report.missed] == ["d8"]
+    assert store.load("webhook-reconciler")["endpoints"]["ep-1"]["ids"] == ["d4", "d8"]
+
+
+def test_async_reconciler():
+    """Test the asyncio reconciler replays the same deliveries."""
+
+    async def iterate(items):
+        for item in items:
+            yield item
+
+    async def main():
+        async with AsyncClient("https://api.relaywarden.eu/api/v1", "test-token") as client:
+            with (
+                patch.object(
+                    client.webhooks,
+                    "iter_endpoints",
+                    return_value=iterate([{"id": "ep-1"}, {"id": "ep-2"}]),
+                ),
+                patch.object(
+                    client.webhooks,
+                    "iter_deliveries",
+                    side_effect=lambda endpoint_id, *args, **kwargs: iterate(
+                        DELIVERIES[endpoint_id]
+                    ),
+                ),
+                patch.object(client.webhooks, "replay_delivery") as replay,
+            ):
+                replay.return_value = {"data": {}}
+                report = await AsyncWebhookReconciler(client, max_replays_per_second=1000).run()
+                return report, sorted(call.args[0] for call in replay.call_args_list)
+
+    report, replayed = asyncio.run(main())
+    assert replayed == ["d2", "d5"]
+    assert len(report.replayed) == 2
@@ -53,3 +53,185 @@ def test_messages_list():
 
         result = messages.list()
         assert len(result["data"]) == 1
+
+
+def test_messages_send_many():
+    """Test concurrent bulk sending with per-item results."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token", max_retries=0)
+    messages = Messages(client)
+
+    def fake_request(method, url, json=None, headers=None, **kwargs):
+        response = Mock()
+        if json["subject"] == "fail":
+            response.status_code = 422
+            response.json.return_value = {"error": {"message": "Invalid"}}
+            response.content = b'{"error":{"message":"Invalid"}}'
+            response.headers = {}
+            return response
+        response.status_code = 202
+        response.json.return_value = {"data": {"message_id": headers["Idempotency-Key"]}}
+        response.content = b"{}"
+        return response
+
+    payloads = ({"subject": "fail" if i == 3 else f"msg-{i}"} for i in range(20))
+    with patch.object(client.session, "request", side_effect=fake_request):
+        results = list(messages.send_many(payloads, concurrency=4))
+
+    assert len(results) == 20
+    assert sorted(r.index for r in results) == list(range(20))
+    failures = [r for r in results if not r.ok]
+    assert len(failures) == 1
+    assert failures[0].item == {"subject": "fail"}
+    successes = [r for r in results if r.ok]
+    assert all(r.response["data"]["message_id"] == r.idempotency_key for r in successes)
+    assert len({r.idempotency_key for r in results}) == 20
+
+
+def test_messages_send_many_custom_keys():
+    """Test deriving idempotency keys from the payload."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    messages = Messages(client)
+
+    with patch.object(client.session, "request") as mock_request:
+        mock_response = Mock()
+        mock_response.status_code = 202
+        mock_response.json.return_value = {"data": {}}
+        mock_response.content = b'{"data":{}}'
+        mock_request.return_value = mock_response
+
+        results = list(
+            messages.send_many(
+                [{"to": "a"}, {"to": "b"}], idempotency_key=lambda m: f"campaign-1-{m['to']}"
+            )
+        )
+
+    assert {r.idempotency_key for r in results} == {"campaign-1-a", "campaign-1-b"}
+
+
+def json_response(status_code, body):
+    """Build a mock JSON response."""
+    response = Mock(status_code=status_code, headers={}, content=b"{}")
+    response.json.return_value = body
+    return response
+
+
+def test_messages_get_many_falls_back_to_single_gets():
+    """Test ids are deduplicated, fetched one by one without a batch endpoint and keyed by id."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token", max_retries=0)
+    urls = []
+
+    def fake_request(method, url, params=None, **kwargs):
+        urls.append(url)
+        message_id = url.rsplit("/", 1)[1]
+        if message_id in ("batch", "missing"):
+            return json_response(404, {"error": {"message": "Not found"}})
+        return json_response(200, {"data": {"id": message_id}})
+
+    with patch.object(client.session, "request", side_effect=fake_request):
+        results = client.messages.get_many(["m1", "m2", "m1", "missing"], concurrency=2)
+        client.messages.get_many(["m3"])
+
+    assert results == {"m1": {"data": {"id": "m1"}}, "m2": {"data": {"id": "m2"}}}
+    assert list(results.errors) == ["missing"]
+    assert results.errors["missing"].code == 404
+    # The missing batch endpoint is probed only once per client
+    assert sum(url.endswith("/messages/batch") for url in urls) == 1
+    assert len(urls) == 5
+
+
+def test_messages_get_many_falls_back_when_batch_probe_fails():
+    """Test a 422 or 500 from the batch probe still looks up every id one by one."""
+    for status in (422, 500):
+        client = Client("https://api.relaywarden.eu/api/v1", "test-token", max_retries=0)
+        urls = []
+
+        def fake_request(method, url, params=None, **kwargs):
+            urls.append(url)
+            message_id = url.rsplit("/", 1)[1]
+            if message_id == "batch":
+                return json_response(status, {"error": {"message": "Rejected"}})
+            return json_response(200, {"data": {"id": message_id}})
+
+        with patch.object(client.session, "request", side_effect=fake_request):
+            results = client.messages.get_many(["m1", "m2", "m3"], batch_size=2)
+            client.messages.get_many(["m4"])
+
+        assert results == {f"m{i}": {"data": {"id": f"m{i}"}} for i in (1, 2, 3)}
+        assert not results.errors
+        # Neither decides that batching is unsupported, so the next call probes again
+        assert sum(url.endswith("/messages/batch") for url in urls) == 2
+        assert client.messages._batch_support == {}
+
+
+def test_messages_get_timelines_uses_batch_endpoint():
+    """Test timelines are fetched in chunks when the batch endpoint exists."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    calls = []
+
+    def fake_request(method, url, params=None, **kwargs):
+        ids = params["ids"].split(",")
+        calls.append((url, ids))
+        data = [{"message_id": i, "events": []} for i in ids if i != "m4"]
+        return json_response(200, {"data": data})
+
+    ids = [f"m{i}" for i in range(5)]
+    with patch.object(client.session, "request", side_effect=fake_request):
+        results = client.messages.get_timelines(ids, batch_size=2)
+
+    assert all(url.endswith("/messages/batch/timeline") for url, _ in calls)
+    assert sorted(chunk for _, chunk in calls) == [["m0", "m1"], ["m2", "m3"], ["m4"]]
+    assert results["m1"] == {"data": {"message_id": "m1", "events": []}}
+    assert list(results.errors) == ["m4"]
+
+
+def test_suppressions_import_many():
+    """Test chunked import with deterministic keys, progress and a failed chunk."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token", max_retries=0)
+    sent = []
+
+    def fake_request(method, url, json=None, headers=None, **kwargs):
+        sent.append((headers["Idempotency-Key"], json["suppressions"]))
+        response = Mock(headers={})
+        if any(row["email"] == "bad@example.com" for row in json["suppressions"]):
+            response.status_code = 422
+            response.json.return_value = {"error": {"message": "Invalid"}}
+            response.content = b'{"error":{"message":"Invalid"}}'
+            return response
+        response.status_code = 200
+        response.json.return_value = {"data": {"imported": len(json["suppressions"])}}
+        response.content = b"{}"
+        return response
+
+    emails = [f"user{i}@example.com" for i in range(25)] + ["bad@example.com"]
+    progress = []
+    with patch.object(client.session, "request", side_effect=fake_request):
+        results = list(
+            client.suppressions.import_many(
+                iter(emails), chunk_size=10, concurrency=2, on_progress=progress.append
+            )
+        )
+        rerun_keys = [r.idempotency_key for r in client.suppressions.import_many(emails, 10)]
+
+    assert len(results) == 3
+    assert [len(chunk) for _, chunk in sent[:3]] == [10, 10, 6]
+    assert sum(not r.ok for r in results) == 1
+    assert progress[-1].items_done == 20
+    assert progress[-1].items_failed == 6
+    assert sorted(rerun_keys) == sorted(r.idempotency_key for r in results)
+
+
+def test_suppressions_import_many_from_csv(tmp_path):
+    """Test importing straight from a CSV file."""
+    path = tmp_path / "crm.csv"
+    path.write_text("email,reason\na@example.com,bounce\nb@example.com,\n")
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+
+    with patch.object(client.session, "request") as mock_request:
+        mock_request.return_value = Mock(status_code=200, headers={}, content=b"")
+        (result,) = client.suppressions.import_many(str(path))
+
+    assert result.item == [
+        {"email": "a@example.com", "reason": "bounce"},
+        {"email": "b@example.com"},
+    ]
+    assert mock_request.call_args.kwargs["json"] == {"suppressions": result.item}
@@ -0,0 +1,173 @@
+"""Tests for retry policies."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from relaywarden import Client
+from relaywarden.exceptions import APIError, RateLimitError
+from relaywarden.retry import RetryBudget, RetryPolicy
+
+
+def error_response(status_code, headers=None):
+    """Create a mock error response."""
+    response = Mock()
+    response.status_code = status_code
+    response.content = b'{"error":{"message":"Upstream unavailable"}}'
+    response.json.return_value = {"error": {"message": "Upstream unavailable"}}
+    response.headers = headers or {}
+    return response
+
+
+def ok_response():
+    """Create a mock success response."""
+    response = Mock()
+    response.status_code = 200
+    response.content = b'{"data":{}}'
+    response.json.return_value = {"data": {}}
+    return response
+
+
+def test_full_jitter_backoff_bounds():
+    """Test that the delay is drawn between zero and the capped ceiling."""
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=4.0, rng=lambda: 1.0)
+    assert [policy.backoff(a) for a in range(5)] == [0.5, 1.0, 2.0, 4.0, 4.0]
+    assert RetryPolicy(rng=lambda: 0.0).backoff(3) == 0.0
+
+
+def test_retries_5xx_for_idempotent_requests():
+    """Test that GET and keyed POST requests are retried on 503."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    with (
+        patch.object(client.session, "request") as mock_request,
+        patch("relaywarden.client.time.sleep") as mock_sleep,
+    ):
+        mock_request.side_effect = [error_response(503), error_response(502), ok_response()]
+        assert client.get("/messages/msg-1") == {"data": {}}
+        assert mock_request.call_count == 3
+        assert mock_sleep.call_count == 2
+
+        mock_request.reset_mock()
+        mock_request.side_effect = [error_response(504), ok_response()]
+        client.post("/messages", {}, {"Idempotency-Key": "key-1"})
+        assert mock_request.call_count == 2
+
+
+def test_does_not_retry_5xx_for_unkeyed_post():
+    """Test that non-idempotent requests are not repeated on 5xx."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    with (
+        patch.object(client.session, "request") as mock_request,
+        patch("relaywarden.client.time.sleep"),
+    ):
+        mock_request.return_value = error_response(503)
+        with pytest.raises(APIError) as exc_info:
+            client.post("/messages", {})
+    assert exc_info.value.code == 503
+    assert mock_request.call_count == 1
+
+
+def test_unkeyed_post_retries_only_connect_errors():
+    """Test that a request that may have been sent is not repeated without a key."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    refused = requests.exceptions.ConnectionError(
+        Mock(reason=NewConnectionError(None, "Connection refused"))
+    )
+    with (
+        patch.object(client.session, "request") as mock_request,
+        patch("relaywarden.client.time.sleep"),
+    ):
+        mock_request.side_effect = [requests.exceptions.ConnectTimeout(), refused, ok_response()]
+        assert client.post("/messages", {}) == {"data": {}}
+        assert mock_request.call_count == 3
+
+        mock_request.reset_mock()
+        mock_request.side_effect = [requests.exceptions.ReadTimeout(), ok_response()]
+        with pytest.raises(APIError):
+            client.post("/messages", {})
+        assert mock_request.call_count == 1
+
+        mock_request.reset_mock()
+        mock_request.side_effect = [requests.exceptions.ReadTimeout(), ok_response()]
+        assert client.post("/messages", {}, {"Idempotency-Key": "k1"}) == {"data": {}}
+        assert mock_request.call_count == 2
+
+
+def test_rate_limit_without_retry_after_uses_backoff():
+    """Test that a missing Retry-After no longer means a 60 second sleep."""
+    policy = RetryPolicy(backoff_base=0.2, rng=lambda: 0.5)
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token", retry_policy=policy)
+    with (
+        patch.object(client.session, "request") as mock_request,
+        patch("relaywarden.client.time.sleep") as mock_sleep,
+    ):
+        mock_request.side_effect = [error_response(429), ok_response()]
+        client.get("/test")
+    mock_sleep.assert_called_once_with(0.1)
+
+
+def test_long_retry_after_raises_immediately():
+    """Test that waits above max_retry_after are left to the caller."""
+    client = Client(
+        "https://api.relaywarden.eu/api/v1",
+        "test-token",
+        retry_policy=RetryPolicy(max_retry_after=5),
+    )
+    with (
+        patch.object(client.session, "request") as mock_request,
+        patch("relaywarden.client.time.sleep") as mock_sleep,
+    ):
+        mock_request.return_value = error_response(429, {"Retry-After": "20"})
+        with pytest.raises(RateLimitError) as exc_info:
+            client.get("/test")
+    assert exc_info.value.retry_after == 20
+    mock_sleep.assert_not_called()
+
+
+def test_retry_budget_stops_retry_storms():
+    """Test that an exhausted budget disables retries."""
+    budget = RetryBudget(capacity=2, ratio=0, min_per_second=0)
+    client = Client(
+        "https://api.relaywarden.eu/api/v1",
+        "test-token",
+        retry_policy=RetryPolicy(max_retries=5, budget=budget),
+    )
+    with (
+        patch.object(client.session, "request") as mock_request,
+        patch("relaywarden.client.time.sleep"),
+    ):
+        mock_request.return_value = error_response(503)
+        with pytest.raises(APIError):
+            client.get("/test")
+        assert mock_request.call_count == 3
+
+        mock_request.reset_mock()
+        with pytest.raises(APIError):
+            client.get("/test")
+        assert mock_request.call_count == 1
+
+
+def test_deadline_limits_retries_and_timeouts():
+    """Test that the deadline bounds both waits and per-attempt timeouts."""
+    policy = RetryPolicy(max_retries=10, backoff_base=1, rng=lambda: 1.0, deadline=2.5)
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token", retry_policy=policy)
+    clock = [0.0]
+
+    def fake_sleep(seconds):
+        clock[0] += seconds
+
+    with (
+        patch.object(client.session, "request") as mock_request,
+        patch("relaywarden.client.time.sleep", side_effect=fake_sleep),
+        patch("relaywarden.client.time.monotonic", side_effect=lambda: clock[0]),
+    ):
+        mock_request.return_value = error_response(503)
+        with pytest.raises(APIError):
+            client.get("/test")
+
+    # After a 1s wait, the next 2s backoff would overrun the 2.5s deadline
+    assert mock_request.call_count == 2
+    connect_timeout, read_timeout = mock_request.call_args.kwargs["timeout"]
+    assert read_timeout == 1.5
@@ -0,0 +1,112 @@
+"""Tests for request body serialization and compression."""
+
+import asyncio
+import gzip
+import json
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from relaywarden import AsyncClient, BodyEncoder, Client, InMemoryMetrics, MetricsMiddleware
+from relaywarden.serialization import EncodedBody, Serializer, default_serializer
+
+PAYLOAD = {"subject": "Hello", "html_body": "<p>" + "x" * 4000 + "</p>", 1: "int key"}
+DECODED = {"subject": "Hello", "html_body": PAYLOAD["html_body"], "1": "int key"}
+
+
+def test_encoder_compresses_large_bodies_only():
+    """Test the size threshold, bytes passthrough and pre-encoded bodies."""
+    encoder = BodyEncoder(compression="gzip", min_size=1024)
+
+    large = encoder.encode(PAYLOAD)
+    assert large.headers == {"Content-Encoding": "gzip"}
+    assert json.loads(gzip.decompress(large.content)) == DECODED
+
+    small = encoder.encode({"subject": "Hi"})
+    assert small.content_encoding is None
+    assert json.loads(small.content) == {"subject": "Hi"}
+
+    raw = json.dumps(PAYLOAD).encode()
+    assert gzip.decompress(encoder.encode(raw).content) == raw
+    assert encoder.encode(large) is large
+
+
+def test_auto_compression_follows_accept_encoding():
+    """Test "auto" mode only compresses once the server advertised a coding."""
+    encoder = BodyEncoder(serializer=Serializer(), min_size=10)
+    assert encoder.encode(PAYLOAD).content_encoding is None
+
+    encoder.observe({"Accept-Encoding": "br, gzip;q=0.8"})
+    assert encoder.active_compression == "gzip"
+    assert encoder.encode(PAYLOAD).content_encoding == "gzip"
+    assert default_serializer().name in ("orjson", "msgspec", "json")
+
+
+def test_client_sends_encoded_bytes():
+    """Test the sync client sends encoded bytes and passes raw bytes through."""
+    client = Client(
+        "https://api.relaywarden.eu/api/v1",
+        "test-token",
+        body_encoder=BodyEncoder(compression="gzip"),
+    )
+    response = Mock(status_code=202, headers={}, content=b'{"data":{"message_id":"m1"}}')
+    with patch.object(client.session, "request", return_value=response) as mock_request:
+        assert client.post("/messages", PAYLOAD)["data"]["message_id"] == "m1"
+        kwargs = mock_request.call_args.kwargs
+        assert kwargs["json"] is None
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(kwargs["data"]))["subject"] == "Hello"
+
+    plain = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    with patch.object(plain.session, "request", return_value=response) as mock_request:
+        plain.post("/messages", b'{"subject":"Hi"}')
+        assert mock_request.call_args.kwargs["data"] == b'{"subject":"Hi"}'
+        assert mock_request.call_args.kwargs["json"] is None
+
+        prepared = EncodedBody(gzip.compress(b"{}"), "gzip")
+        plain.post("/messages", prepared)
+        assert mock_request.call_args.kwargs["data"] is prepared.content
+        assert mock_request.call_args.kwargs["headers"]["Content-Encoding"] == "gzip"
+
+
+def test_async_client_falls_back_when_compression_is_refused():
+    """Test a 415 to a compressed body resends it uncompressed and disables compression."""
+    seen = []
+
+    def handler(request):
+        encoding = request.headers.get("Content-Encoding")
+        seen.append(encoding)
+        if encoding:
+            return httpx.Response(415, json={"error": {"message": "Unsupported"}})
+        assert json.loads(request.content)["subject"] == "Hello"
+        return httpx.Response(202, json={"data": {"message_id": "m1"}})
+
+    encoder = BodyEncoder(compression="gzip")
+    metrics = InMemoryMetrics()
+
+    async def main():
+        async with AsyncClient(
+            "https://api.relaywarden.eu/api/v1",
+            "test-token",
+            body_encoder=encoder,
+            middleware=[MetricsMiddleware(metrics)],
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            first = await client.post("/messages", PAYLOAD)
+            await client.post("/messages", PAYLOAD)
+            return first
+
+    assert asyncio.run(main())["data"]["message_id"] == "m1"
+    assert seen == ["gzip", None, None]
+    assert encoder.active_compression is None
+    # The refused attempt completed its hooks before the resend
+    (in_flight,) = metrics.snapshot()["gauges"]
+    assert in_flight["value"] == 0
+    assert metrics.counter("relaywarden.retries", method="POST", endpoint="/messages") == 1
+
+
+def test_unknown_compression_rejected():
+    """Test unsupported codings fail when the encoder is created."""
+    with pytest.raises(ValueError):
+        BodyEncoder(compression="br")
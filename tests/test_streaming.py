@@ -0,0 +1,119 @@
+"""Tests for streaming downloads and CSV parsing."""
+
+import asyncio
+import io
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from relaywarden import AsyncClient, Client
+from relaywarden.streaming import iter_csv_rows
+
+BODY = "email,reason\n" + "".join(f"user{i}@example.com,bounce\n" for i in range(2000))
+
+
+def serve(handler_class):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_handler(body, support_ranges, seen):
+    """Handler serving ``body`` that drops the first connection halfway through."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            seen.append(dict(self.headers))
+            start = 0
+            if support_ranges and self.headers.get("Range"):
+                start = int(self.headers["Range"][len("bytes=") :].rstrip("-"))
+            payload = body[start:]
+            self.send_response(206 if start else 200)
+            self.send_header("Content-Type", "text/csv")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            if len(seen) == 1:
+                self.wfile.write(payload[: len(payload) // 2])
+                self.wfile.flush()
+                self.connection.shutdown(socket.SHUT_RDWR)
+                self.close_connection = True
+                return
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def test_csv_parser_handles_arbitrary_chunk_boundaries():
+    """Test rows survive chunks splitting characters and quoted newlines."""
+    data = 'email,note\n"a@example.com","multi\nline, quoted"\nb@example.com,café\n'.encode()
+    chunks = [data[i : i + 3] for i in range(0, len(data), 3)]
+    assert list(iter_csv_rows(chunks)) == [
+        {"email": "a@example.com", "note": "multi\nline, quoted"},
+        {"email": "b@example.com", "note": "café"},
+    ]
+
+
+def test_export_resumes_with_range_after_dropped_connection():
+    """Test an interrupted export resumes from the received offset."""
+    seen = []
+    server = serve(make_handler(BODY.encode(), True, seen))
+    try:
+        client = Client(f"http://127.0.0.1:{server.server_port}", "test-token")
+        rows = list(client.suppressions.export_rows(chunk_size=1024))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(rows) == 2000
+    assert rows[-1] == {"email": "user1999@example.com", "reason": "bounce"}
+    assert "Range" not in seen[0]
+    resumed_at = int(seen[1]["Range"][len("bytes=") : -1])
+    assert 0 < resumed_at <= len(BODY) // 2
+    assert seen[0]["Accept"] == "text/csv"
+
+
+def test_export_to_file_without_range_support(tmp_path):
+    """Test a server ignoring Range still yields each byte exactly once."""
+    seen = []
+    server = serve(make_handler(BODY.encode(), False, seen))
+    target = tmp_path / "suppressions.csv"
+    buffer = io.BytesIO()
+    try:
+        client = Client(f"http://127.0.0.1:{server.server_port}", "test-token")
+        written = client.suppressions.export_to(str(target))
+        seen.clear()
+        client.suppressions.export_to(buffer)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert written == len(BODY)
+    assert target.read_text() == BODY
+    assert buffer.getvalue() == BODY.encode()
+
+
+def test_async_export_rows():
+    """Test the async client streams and parses the export."""
+
+    def handler(request):
+        assert request.headers["Accept"] == "text/csv"
+        return httpx.Response(200, content=BODY.encode())
+
+    async def run():
+        async with AsyncClient(
+            "https://api.relaywarden.eu/api/v1",
+            "test-token",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            return [row async for row in client.suppressions.export_rows()]
+
+    rows = asyncio.run(run())
+    assert len(rows) == 2000
+    assert rows[0] == {"email": "user0@example.com", "reason": "bounce"}
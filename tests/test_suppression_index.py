@@ -0,0 +1,103 @@
+"""Tests for the local suppression index."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+from relaywarden import SuppressionIndex
+
+
+def test_membership_growth_and_removal():
+    """Test lookups stay correct across resizes and tombstones."""
+    index = SuppressionIndex()
+    emails = [f"user{i}@example.com" for i in range(5000)]
+    for email in emails:
+        index.add(email)
+    index.add("USER1@example.com ")
+
+    assert len(index) == 5000
+    assert all(email in index for email in emails)
+    assert "User42@Example.com" in index
+    assert "other@example.com" not in index
+
+    index.discard("user1@example.com")
+    index.add("new@example.com")
+    assert "user1@example.com" not in index
+    assert "user2@example.com" in index
+    assert len(index) == 5000
+
+
+def test_filter_messages_drops_suppressed_recipients():
+    """Test suppressed recipients are removed and empty messages skipped."""
+    index = SuppressionIndex()
+    index.add("blocked@example.com")
+    messages = [
+        {"to": [{"email": "ok@example.com"}, {"email": "blocked@example.com"}], "subject": "A"},
+        {"to": [{"email": "blocked@example.com"}], "subject": "B"},
+        {"to": [{"email": "ok@example.com"}], "cc": ["blocked@example.com"], "subject": "C"},
+        {"to": "blocked@example.com", "subject": "D"},
+        {"to": "ok@example.com", "subject": "E"},
+    ]
+
+    filtered = list(index.filter_messages(messages))
+
+    assert [m["subject"] for m in filtered] == ["A", "C", "E"]
+    assert filtered[2] is messages[4]
+    assert filtered[0]["to"] == [{"email": "ok@example.com"}]
+    assert filtered[1]["cc"] == []
+    assert messages[0]["to"][1] == {"email": "blocked@example.com"}
+    assert index.partition(["a@example.com", "blocked@example.com"]) == (
+        ["a@example.com"],
+        ["blocked@example.com"],
+    )
+
+
+def test_rebuild_sync_and_persistence(client, tmp_path):
+    """Test a rebuild from the CSV export, an incremental sync and a reload."""
+    path = str(tmp_path / "suppressions.idx")
+    export = Mock(status_code=200, headers={}, content=b"x")
+    export.iter_content.return_value = [
+        b"email,reason,created_at\n",
+        b"a@example.com,bounce,2026-01-01T00:00:00Z\n",
+        b"b@example.com,complaint,2026-01-02T00:00:00Z\n",
+    ]
+    page = Mock(status_code=200, headers={}, content=b"x")
+    page.json.return_value = {
+        "data": [{"email": "c@example.com", "created_at": "2026-01-03T00:00:00Z"}],
+        "meta": {"current_page": 1, "last_page": 1},
+    }
+
+    index = SuppressionIndex(path)
+    with patch.object(client.session, "request") as mock_request:
+        mock_request.side_effect = [export, page]
+        index.sync(client)
+        index.sync(client)
+
+    assert mock_request.call_args_list[0].kwargs["headers"]["Accept"] == "text/csv"
+    assert mock_request.call_args_list[1].kwargs["params"]["created_after"] == (
+        "2026-01-02T00:00:00Z"
+    )
+
+    reloaded = SuppressionIndex(path)
+    assert len(reloaded) == 3
+    assert "c@example.com" in reloaded
+    assert "d@example.com" not in reloaded
+    assert reloaded.cursor == "2026-01-03T00:00:00Z"
+
+
+def test_sync_async_applies_items_while_streaming():
+    """Test the async sync adds each listed suppression before the next is fetched."""
+    index = SuppressionIndex()
+    index.cursor = "2026-01-01T00:00:00Z"
+    emails = [f"user{i}@example.com" for i in range(3)]
+
+    async def list_all(filters, per_page):
+        for i, email in enumerate(emails):
+            assert all(earlier in index for earlier in emails[:i])
+            yield {"email": email, "created_at": f"2026-01-0{i + 2}T00:00:00Z"}
+
+    client = Mock()
+    client.suppressions.list_all = list_all
+    asyncio.run(index.sync_async(client))
+
+    assert all(email in index for email in emails)
+    assert index.cursor == "2026-01-04T00:00:00Z"
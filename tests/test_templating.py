@@ -0,0 +1,100 @@
+"""Tests for local template rendering."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from relaywarden import AsyncClient, Client, TemplateRenderError
+from relaywarden.templating import LocalRenderer, compile_template
+
+TEMPLATE = {
+    "data": {
+        "id": "t1",
+        "version": 3,
+        "subject": "Hello {{ $name ?? 'there' }}",
+        "html_body": "<p>{{ $user.note }} {!! $user.note !!} @{{ literal }} {{ $items[0] }}</p>",
+        "text_body": "{{ $user['note'] }} {braces}",
+    }
+}
+
+
+def test_compiled_template_matches_server_semantics():
+    """Test escaping, raw output, defaults, nested access and value conversion."""
+    compiled = compile_template(TEMPLATE["data"])
+    rendered = compiled.render({"user": {"note": "<b>O'Neil & co</b>"}, "items": [2.0, 3]})
+
+    assert rendered["subject"] == "Hello there"
+    assert rendered["html_body"] == (
+        "<p>&lt;b&gt;O&#039;Neil &amp; co&lt;/b&gt; <b>O'Neil & co</b> {{ literal }} 2</p>"
+    )
+    assert rendered["text_body"] == "<b>O'Neil & co</b> {braces}"
+    assert compiled.render({"name": True, "items": [None]})["subject"] == "Hello 1"
+
+
+def test_render_many_keeps_input_order():
+    """Test batch rendering produces one result per recipient, in order."""
+    compiled = compile_template({"subject": "Hi {{ $name }}", "text_body": "static"})
+    recipients = [{"name": f"user{i}"} for i in range(3)]
+    assert compiled.render_many(iter(recipients)) == [
+        {"subject": f"Hi user{i}", "text_body": "static"} for i in range(3)
+    ]
+
+
+def test_unsupported_syntax_raises():
+    """Test constructs only the server understands fail at compile time."""
+    with pytest.raises(TemplateRenderError, match="Unsupported"):
+        compile_template({"subject": "{{ strtoupper($name) }}"})
+
+
+def test_renderer_caches_compiled_versions():
+    """Test templates are fetched once and pinned versions come from the version list."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    client.templates.get = Mock(return_value=TEMPLATE)
+    client.templates.iter_versions = Mock(
+        return_value=iter([{"version": 1, "subject": "Old {{ $name }}"}])
+    )
+
+    for name in ("a", "b"):
+        assert client.templates.render_local("t1", {"name": name})["subject"] == f"Hello {name}"
+    client.templates.get.assert_called_once_with("t1")
+    assert client.templates.renderer.get_compiled("t1").version == 3
+
+    renderer = LocalRenderer(client, max_templates=1)
+    assert renderer.render("t1", {"name": "a"}, version=1) == {"subject": "Old a"}
+    renderer.render("t1", {})
+    assert list(renderer._compiled) == [("t1", 3)]
+    with pytest.raises(TemplateRenderError):
+        client.templates.iter_versions.return_value = iter([])
+        renderer.render("t1", {}, version=7)
+
+
+def test_update_invalidates_local_renderer():
+    """Test render_local serves the new content right after this client updates it."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    updated = {"data": {**TEMPLATE["data"], "subject": "Welcome {{ $name }}"}}
+    client.templates.get = Mock(side_effect=[TEMPLATE, updated])
+    client.patch = Mock(return_value=updated)
+
+    assert client.templates.render_local("t1", {"name": "a"})["subject"] == "Hello a"
+    client.templates.update("t1", {"subject": "Welcome {{ $name }}"})
+    assert client.templates.render_local("t1", {"name": "a"})["subject"] == "Welcome a"
+
+
+def test_async_render_local_many():
+    """Test the async resource renders batches from one fetched template."""
+
+    async def main():
+        async with AsyncClient("https://api.relaywarden.eu/api/v1", "test-token") as client:
+
+            async def get(template_id):
+                return TEMPLATE
+
+            client.templates.get = Mock(side_effect=get)
+            results = await client.templates.render_local_many("t1", [{"name": "x"}, {}])
+            await client.templates.render_local("t1", {})
+            return results, client.templates.get.call_count
+
+    results, calls = asyncio.run(main())
+    assert [result["subject"] for result in results] == ["Hello x", "Hello there"]
+    assert calls == 1
@@ -0,0 +1,137 @@
+"""Tests for tracing spans."""
+
+import asyncio
+import contextvars
+import re
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from relaywarden import AsyncClient, Client
+from relaywarden.bulk import bounded_map
+from relaywarden.exceptions import ValidationError
+
+
+class FakeSpanContext:
+    def __init__(self, span_id):
+        self.trace_id = 0x4BF92F3577B34DA6A3CE929D0E0E4736
+        self.span_id = span_id
+        self.trace_flags = 1
+
+
+class FakeSpan:
+    def __init__(self, name, attributes, span_id):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.events = []
+        self.exceptions = []
+        self.ended = 0
+        self._context = FakeSpanContext(span_id)
+
+    def get_span_context(self):
+        return self._context
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def add_event(self, name, attributes):
+        self.events.append((name, attributes))
+
+    def record_exception(self, error):
+        self.exceptions.append(error)
+
+    def end(self):
+        self.ended += 1
+
+
+class FakeTracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, attributes=None, **kwargs):
+        span = FakeSpan(name, attributes or {}, len(self.spans) + 1)
+        self.spans.append(span)
+        return span
+
+
+def make_response(status_code, body=b'{"data":{},"meta":{"request_id":"req-42"}}'):
+    response = Mock(status_code=status_code, headers={}, content=body, _content=body)
+    response.json.return_value = {}
+    return response
+
+
+def test_span_per_call_with_retry_events_and_traceparent():
+    """Test one span covers all attempts and each attempt propagates it."""
+    tracer = FakeTracer()
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token", tracer=tracer)
+
+    with (
+        patch.object(client.session, "request") as mock_request,
+        patch("relaywarden.client.time.sleep"),
+    ):
+        mock_request.side_effect = [make_response(503, b""), make_response(200)]
+        client.get("/messages/msg-1/timeline")
+
+    (span,) = tracer.spans
+    assert span.name == "GET /messages/{id}/timeline"
+    assert span.attributes["http.response.status_code"] == 200
+    assert span.attributes["http.request.resend_count"] == 1
+    assert span.attributes["relaywarden.request_id"] == "req-42"
+    assert [name for name, _ in span.events] == ["relaywarden.retry"]
+    assert span.ended == 1
+
+    for call in mock_request.call_args_list:
+        traceparent = call.kwargs["headers"]["traceparent"]
+        assert re.fullmatch(r"00-4bf92f3577b34da6a3ce929d0e0e4736-0{15}1-01", traceparent)
+
+
+def test_failed_call_records_exception():
+    """Test a final error ends the span with the exception and request ID."""
+    tracer = FakeTracer()
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token", tracer=tracer)
+    body = b'{"error":{"message":"Invalid"},"meta":{"request_id":"req-7"}}'
+    response = make_response(422, body)
+    response.json.return_value = {"error": {"message": "Invalid"}, "meta": {"request_id": "req-7"}}
+
+    with patch.object(client.session, "request", return_value=response):
+        with pytest.raises(ValidationError):
+            client.post("/messages", {"subject": "Hello"})
+
+    (span,) = tracer.spans
+    assert span.attributes["relaywarden.request_id"] == "req-7"
+    assert span.attributes["error.type"] == "ValidationError"
+    assert isinstance(span.exceptions[0], ValidationError)
+    assert span.ended == 1
+
+
+def test_async_client_spans():
+    """Test concurrent asyncio calls get separate spans."""
+    tracer = FakeTracer()
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers["traceparent"])
+        return httpx.Response(200, json={"data": {}})
+
+    async def run():
+        async with AsyncClient(
+            "https://api.relaywarden.eu/api/v1",
+            "test-token",
+            tracer=tracer,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            await asyncio.gather(client.get("/events"), client.get("/audit-logs"))
+
+    asyncio.run(run())
+    assert sorted(span.name for span in tracer.spans) == ["GET /audit-logs", "GET /events"]
+    assert all(span.ended == 1 for span in tracer.spans)
+    assert len(set(seen)) == 2
+
+
+def test_bounded_map_propagates_context():
+    """Test worker threads see the caller's context variables (and so its span)."""
+    current = contextvars.ContextVar("current", default=None)
+    current.set("parent-span")
+    results = list(bounded_map(lambda item: current.get(), range(3), concurrency=2))
+    assert [result.response for result in results] == ["parent-span"] * 3
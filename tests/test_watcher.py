@@ -0,0 +1,130 @@
+"""Tests for the shared delivery status watcher."""
+
+import asyncio
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from unittest.mock import Mock
+
+import pytest
+
+from relaywarden import AsyncClient, Client
+from relaywarden.bulk import KeyedResults
+from relaywarden.exceptions import APIError
+from relaywarden.watcher import AsyncDeliveryWatcher, DeliveryWatcher, _settle
+
+
+def lookup(statuses):
+    """Fake ``get_many`` answering from a list of status dicts, one per poll."""
+    calls = []
+
+    def get_many(message_ids, concurrency, batch_size):
+        calls.append(sorted(message_ids))
+        current = statuses[min(len(calls), len(statuses)) - 1]
+        results = KeyedResults()
+        for message_id in message_ids:
+            if message_id in current:
+                results[message_id] = {"data": {"id": message_id, "status": current[message_id]}}
+            else:
+                results.errors[message_id] = APIError("Not found", 404)
+        return results
+
+    return get_many, calls
+
+
+def test_watch_coalesces_ids_into_shared_polls():
+    """Test one poll loop resolves all watches and reuses futures for the same id."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    get_many, calls = lookup(
+        [
+            {"m1": "queued", "m2": "sending"},
+            {"m1": "delivered", "m2": "sending"},
+            {"m1": "delivered", "m2": "bounced"},
+        ]
+    )
+    client.messages.get_many = Mock(side_effect=get_many)
+    watcher = client.delivery_watcher
+    watcher.min_interval = 0.01
+
+    first = watcher.watch("m1")
+    assert watcher.watch("m1") is first
+    results = watcher.wait(["m1", "m2"], timeout=5)
+
+    assert results["m1"]["data"]["status"] == "delivered"
+    assert results["m2"]["data"]["status"] == "bounced"
+    assert all(len(ids) <= 2 for ids in calls)
+    assert len(calls) <= 4
+    client.close()
+    assert not watcher._thread.is_alive()
+
+
+def test_unknown_messages_and_timeouts_fail_their_futures():
+    """Test a 404 fails the watch immediately and a deadline raises TimeoutError."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    get_many, _ = lookup([{"m1": "queued"}])
+    client.messages.get_many = Mock(side_effect=get_many)
+    watcher = DeliveryWatcher(client, min_interval=0.01)
+
+    missing = watcher.watch("unknown")
+    slow = watcher.watch("m1", timeout=0.05)
+
+    with pytest.raises(APIError):
+        missing.result(timeout=5)
+    with pytest.raises((TimeoutError, FutureTimeoutError)):
+        slow.result(timeout=5)
+    watcher.close()
+
+
+def test_cancelled_watches_do_not_stop_the_poll_loop():
+    """Test a future cancelled while its poll is in flight is skipped."""
+    client = Client("https://api.relaywarden.eu/api/v1", "test-token")
+    get_many, _ = lookup([{"m1": "delivered", "m2": "delivered"}])
+    futures = {}
+
+    def cancelling_get_many(message_ids, concurrency, batch_size):
+        futures["m1"].cancel()
+        return get_many(message_ids, concurrency, batch_size)
+
+    client.messages.get_many = Mock(side_effect=cancelling_get_many)
+    watcher = DeliveryWatcher(client, min_interval=0.01)
+    futures["m1"] = watcher.watch("m1")
+    futures["m2"] = watcher.watch("m2")
+
+    assert futures["m2"].result(timeout=5)["data"]["status"] == "delivered"
+    assert futures["m1"].cancelled()
+    assert watcher._thread.is_alive()
+    watcher.close()
+
+    # Cancelled by another thread between the done() check and set_result()
+    racing = Future()
+    racing.cancel()
+    racing.done = lambda: False
+    _settle(racing, {}, None)
+    _settle(racing, None, APIError("Not found", 404))
+
+
+def test_poll_interval_grows_with_age():
+    """Test older messages are polled less often, within the bounds."""
+    watcher = DeliveryWatcher(Mock(), min_interval=1, max_interval=30, age_factor=0.2)
+    assert watcher._interval(0) == 1
+    assert watcher._interval(50) == 10
+    assert watcher._interval(3600) == 30
+
+
+def test_async_watcher():
+    """Test the asyncio watcher resolves awaitables from its poll task."""
+    get_many, calls = lookup([{"m1": "queued"}, {"m1": "delivered"}])
+
+    async def async_get_many(*args):
+        return get_many(*args)
+
+    async def main():
+        async with AsyncClient("https://api.relaywarden.eu/api/v1", "test-token") as client:
+            client.messages.get_many = async_get_many
+            watcher = client.delivery_watcher
+            assert isinstance(watcher, AsyncDeliveryWatcher)
+            watcher.min_interval = 0.01
+            return await asyncio.wait_for(watcher.watch("m1"), 5)
+
+    message = asyncio.run(main())
+    assert message["data"]["status"] == "delivered"
+    assert len(calls) == 2
@@ -0,0 +1,102 @@
+"""Tests for webhook verification and parsing."""
+
+import asyncio
+import io
+
+import pytest
+
+from relaywarden import WebhookVerificationError, WebhookVerifier
+from relaywarden.webhooks import MessageEvent, asgi_app, generate_signature_header, wsgi_app
+
+SECRET = "whsec_test"
+BODY = (
+    b'{"id":"evt-1","type":"message.delivered","data":{"message_id":"msg-1","status":"delivered"}}'
+)
+NOW = 1_700_000_000
+
+
+def test_valid_signature_parses_typed_event():
+    """Test a correctly signed delivery is verified and parsed into its event class."""
+    verifier = WebhookVerifier(["whsec_old", SECRET])
+    header = generate_signature_header(SECRET, BODY, NOW)
+
+    event = verifier.construct_event(BODY, header, now=NOW + 10)
+
+    assert isinstance(event, MessageEvent)
+    assert event.id == "evt-1"
+    assert event.message_id == "msg-1"
+    assert event.status == "delivered"
+
+
+@pytest.mark.parametrize(
+    "body,header,now",
+    [
+        (BODY, generate_signature_header("whsec_wrong", BODY, NOW), NOW),
+        (BODY + b" ", generate_signature_header(SECRET, BODY, NOW), NOW),
+        (BODY, generate_signature_header(SECRET, BODY, NOW), NOW + 301),
+        (BODY, "v1=deadbeef", NOW),
+        (BODY, None, NOW),
+    ],
+)
+def test_invalid_deliveries_are_rejected(body, header, now):
+    """Test wrong secrets, tampered bodies, stale timestamps and bad headers fail."""
+    verifier = WebhookVerifier(SECRET)
+    with pytest.raises(WebhookVerificationError):
+        verifier.verify(body, header, now=now)
+
+
+def test_replayed_delivery_is_rejected():
+    """Test the same signed delivery is only accepted once."""
+    verifier = WebhookVerifier(SECRET)
+    header = generate_signature_header(SECRET, BODY, NOW)
+    verifier.verify(BODY, header, now=NOW)
+
+    with pytest.raises(WebhookVerificationError, match="already received"):
+        verifier.verify(BODY, header, now=NOW + 1)
+    assert len(verifier.replay_cache) == 1
+
+
+def test_wsgi_and_asgi_apps():
+    """Test the framework helpers answer 200 for valid and 400 for invalid deliveries."""
+    verifier = WebhookVerifier(SECRET, reject_replays=False)
+    received = []
+    header = generate_signature_header(SECRET, BODY)
+
+    app = wsgi_app(verifier, received.append)
+    statuses = []
+    for signature in (header, "t=1,v1=00"):
+        environ = {
+            "REQUEST_METHOD": "POST",
+            "CONTENT_LENGTH": str(len(BODY)),
+            "wsgi.input": io.BytesIO(BODY),
+            "HTTP_X_RELAYWARDEN_SIGNATURE": signature,
+        }
+        app(environ, lambda status, headers: statuses.append(status))
+    assert statuses == ["200 OK", "400 Bad Request"]
+
+    async def handler(event):
+        received.append(event)
+
+    async def call_asgi():
+        sent = []
+        chunks = [
+            {"type": "http.request", "body": BODY[:10], "more_body": True},
+            {"type": "http.request", "body": BODY[10:]},
+        ]
+
+        async def receive():
+            return chunks.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "headers": [(b"x-relaywarden-signature", header.encode())],
+        }
+        await asgi_app(verifier, handler)(scope, receive, send)
+        return sent[0]["status"]
+
+    assert asyncio.run(call_asgi()) == 200
+    assert [event.id for event in received] == ["evt-1", "evt-1"]